@@ -0,0 +1,54 @@
+# Import all needed modules and packages.
+import argparse
+import importlib
+import sys
+
+# The entry point of every mode of Battleship: python -m battleship <command> [options]. Each command only imports the modules it needs, so the headless commands never load the terminal game, and worker processes (which import this module again when they are spawned) don't pay for anything they don't use.
+
+# The commands, by name: the module whose main(arguments) function runs the command, and a description for the help.
+COMMANDS = dict(
+    play=("main", "Play Battleship in the terminal."),
+    simulate=("game.simulation", "Play computer vs. computer games across all cores."),
+    batch=("game.batch", "Simulate thousands of computer games side by side."),
+    bench=("game.benchmark", "Time the hot paths and compare them to the baseline."),
+    serve=("game.server", "Host networked games."),
+    connect=("game.client", "Join a networked game."),
+)
+
+
+def main(arguments: list[str] = None) -> int:
+    """
+    This function runs a command from the command line. The options after the command are handed to the command itself, so python -m battleship simulate --help shows the options of the simulation.
+
+    Returns:
+    int: The exit code of the command.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m battleship",
+        description="Battleship, in the terminal or without it.",
+    )
+    commands = parser.add_subparsers(dest="command", metavar="command", required=True)
+
+    for name, (_, description) in COMMANDS.items():
+        commands.add_parser(name, help=description, add_help=False)
+
+    options, rest = parser.parse_known_args(arguments)
+
+    # Only the module of the chosen command (and what it imports) is loaded.
+    module = importlib.import_module(COMMANDS[options.command][0])
+
+    # The commands' parsers name the program after sys.argv[0], so their help shows the command as it was typed.
+    program: str = sys.argv[0]
+    sys.argv[0] = f"python -m battleship {options.command}"
+
+    try:
+        result = module.main(rest)
+    finally:
+        sys.argv[0] = program
+
+    # The benchmarks return the ones that regressed, which fail the command like a failed test.
+    return 1 if options.command == "bench" and result else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
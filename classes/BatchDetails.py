@@ -0,0 +1,236 @@
+import numpy as np
+
+from classes.GameDetails import GameDetails
+from classes.GameRecord import GameRecord
+from classes.GameSettings import GameSettings
+from classes.Heatmap import HEATMAP_MAX_CELLS
+from classes.TournamentDetails import TournamentDetails
+
+from functions import gameLog
+from functions.placements import getPlacementMatrix, getPlacements
+
+
+class BatchDetails:
+    """
+    This class is used to store the stats of a batch of computer games simulated side by side. Every stat is an array with one row per game, and player 1 and player 2 in the second axis.
+
+    Params:
+    startingPlayer: (games,) The player who went first (1 or 2).
+    fleets: (games, 2, ships) The index of each ship's placement in its table (see functions.placements.getPlacements), by the owner of the fleet.
+    moves: (games, 2, cells) The cell of each shot a player would have fired to sink the whole fleet, padded with -1.
+    shotHits: (games, 2, cells) Whether each of those shots hit.
+    sunkAt: (games, 2, ships) The shot that sunk each of the opponent's ships.
+    """
+
+    def __init__(
+        self,
+        settings: GameSettings,
+        targeting: tuple,
+        startingPlayer: np.ndarray,
+        fleets: np.ndarray,
+        moves: np.ndarray,
+        shotHits: np.ndarray,
+        sunkAt: np.ndarray,
+    ):
+        self.settings = settings
+        self.targeting = tuple(targeting)
+        self.startingPlayer = startingPlayer
+        self.fleets = fleets
+        self.moves = moves
+        self.shotHits = shotHits
+        self.sunkAt = sunkAt
+
+        # Each player sinks the whole fleet after the shot that sinks its last ship. Whoever gets there first wins, and the starting player gets there first on a tie.
+        shotsToWin = sunkAt.max(axis=2)
+        firstWins = np.where(
+            startingPlayer == 1,
+            shotsToWin[:, 0] <= shotsToWin[:, 1],
+            shotsToWin[:, 0] < shotsToWin[:, 1],
+        )
+
+        self.winner = np.where(firstWins, 1, 2)
+
+        winnerShots = np.where(firstWins, shotsToWin[:, 0], shotsToWin[:, 1])
+
+        # The loser fires one shot less than the winner if the winner started, or as many otherwise.
+        loserShots = winnerShots - (self.winner == startingPlayer)
+
+        self.totalShots = np.stack(
+            [
+                np.where(firstWins, winnerShots, loserShots),
+                np.where(firstWins, loserShots, winnerShots),
+            ],
+            axis=1,
+        )
+
+        # Count the hits among the shots each player actually fired.
+        self.fired = np.arange(moves.shape[2]) < self.totalShots[:, :, None]
+
+        self.hits = (shotHits & self.fired).sum(axis=2)
+        self.misses = self.totalShots - self.hits
+
+        # Ships that weren't sunk before the game ended have a 0.
+        self.movesToSink = np.where(sunkAt <= self.totalShots[:, :, None], sunkAt, 0)
+
+    def __len__(self) -> int:
+        return len(self.winner)
+
+    def getRecord(self, game: int) -> GameRecord:
+        """
+        This function returns the record of a game, in the game log format. Replaying the record through the engine gives Player and SunkShip stats equal to the ones in the batch (see checkReplay).
+        """
+        if self.settings.width * self.settings.height > gameLog.END:
+            raise ValueError(
+                f"Game records store a byte per cell, so they only support boards with up to {gameLog.END} cells. See classes.BatchDetails.getRecord"
+            )
+
+        fleets: bytearray = bytearray()
+
+        for player in (0, 1):
+            for ship, index in zip(
+                self.settings.ships.values(), self.fleets[game, player]
+            ):
+                _, start, end = getPlacements(
+                    self.settings.width, self.settings.height, ship.length
+                )[index]
+
+                fleets += bytes(
+                    [
+                        start[1] * self.settings.width + start[0],
+                        start[0] == end[0] and ship.length > 1,
+                    ]
+                )
+
+        # Interleave the shots of both players, starting with the starting player.
+        first: int = self.startingPlayer[game] - 1
+        order: list[int] = []
+
+        for turn in range(int(self.totalShots[game].sum())):
+            player: int = first if turn % 2 == 0 else 1 - first
+
+            order.append(int(self.moves[game, player, turn // 2]))
+
+        return GameRecord(
+            self.settings,
+            0,
+            int(self.startingPlayer[game]),
+            bytes(fleets),
+            bytes(order),
+        )
+
+    def checkReplay(self, game: int) -> None:
+        """
+        This function replays a game through the engine and checks that the winner, the shots, hits and misses of both players, and the moves to sink each ship match the batch. It raises a ValueError naming the first stat that doesn't.
+        """
+        details: GameDetails = self.getRecord(game).replay()
+
+        stats: list[tuple[str, int, int]] = [
+            ("winner", details.winner.getRaw(), int(self.winner[game]))
+        ]
+
+        for player, opponent in zip(details.players, details.players[::-1]):
+            row: int = player.getRaw() - 1
+            sunk: dict[str, int] = {
+                ship.name: ship.movesToSink for ship in opponent.board.sunkShips
+            }
+
+            stats += [
+                (
+                    f"player {row + 1} totalShots",
+                    player.totalShots,
+                    int(self.totalShots[game, row]),
+                ),
+                (f"player {row + 1} hits", player.hits, int(self.hits[game, row])),
+                (
+                    f"player {row + 1} misses",
+                    player.misses,
+                    int(self.misses[game, row]),
+                ),
+            ]
+
+            for ship, data in enumerate(self.settings.ships.values()):
+                stats.append(
+                    (
+                        f"player {row + 1} movesToSink {data.name}",
+                        sunk.get(data.name, 0),
+                        int(self.movesToSink[game, row, ship]),
+                    )
+                )
+
+        for name, replayed, batched in stats:
+            if replayed != batched:
+                raise ValueError(
+                    f"Game {game} replays with {name} {replayed}, but the batch has {batched}. See classes.BatchDetails.checkReplay"
+                )
+
+    def toTournament(self) -> TournamentDetails:
+        """
+        This function combines the stats of the batch into the totals of a tournament, so that they can be printed and merged like any other.
+        """
+        details: TournamentDetails = TournamentDetails(
+            self.targeting, ("uniform", "uniform")
+        )
+
+        details.games = len(self)
+
+        details.aggregate.games = len(self)
+
+        for player in (1, 2):
+            won = self.winner == player
+
+            details.wins[player] = int(won.sum())
+            details.shotsToWin[player] = int(self.totalShots[won, player - 1].sum())
+
+            details.aggregate.wins[player] = details.wins[player]
+            details.aggregate.shotsToWin[player].addArray(
+                self.totalShots[won, player - 1]
+            )
+            details.aggregate.hitRatio[player].addArray(
+                self.hits[:, player - 1] / self.totalShots[:, player - 1]
+            )
+
+            for ship, name in enumerate(
+                ship.name for ship in self.settings.ships.values()
+            ):
+                moves = self.movesToSink[:, player - 1, ship]
+                sunk = moves > 0
+
+                if sunk.any():
+                    details.movesToSink[player][name] = [
+                        int(moves[sunk].sum()),
+                        int(sunk.sum()),
+                    ]
+
+                    details.aggregate.getMovesToSink(player, name).addArray(moves[sunk])
+
+        cells: int = self.settings.width * self.settings.height
+
+        # Count every cell of every game at once: the fired shots and hits are counted with bincount, and the ships by counting each placement and multiplying by the cells it covers.
+        if cells <= HEATMAP_MAX_CELLS:
+            for player in (1, 2):
+                fired = self.fired[:, player - 1]
+                moves = self.moves[:, player - 1]
+                ships = np.zeros(cells, dtype=np.int64)
+
+                for ship, data in enumerate(self.settings.ships.values()):
+                    matrix = getPlacementMatrix(
+                        self.settings.width, self.settings.height, data.length
+                    )
+                    counts = np.bincount(
+                        self.fleets[:, player - 1, ship], minlength=len(matrix)
+                    )
+
+                    ships += (counts @ matrix).round().astype(np.int64)
+
+                details.getHeatmap(
+                    player, self.settings.width, self.settings.height
+                ).addCounts(
+                    len(self),
+                    np.bincount(moves[fired], minlength=cells),
+                    np.bincount(
+                        moves[fired & self.shotHits[:, player - 1]], minlength=cells
+                    ),
+                    ships,
+                )
+
+        return details
@@ -1,18 +1,58 @@
 import random
-from copy import deepcopy as copy
 
 from classes.Ship import Ship
 from classes.Coordinate import Coordinate
-
-from functions import utils
+from classes.Geometry import Geometry, getGeometry
+from classes.PlacementOracle import PlacementOracle, getPlacementOracle
+from classes.ShipPreview import ShipPreview
 
 
 class Board:
-    def __init__(self, rows: list[list[Coordinate]]):
-        self.rows = rows
+    """
+    This class stores a player's board. The ships, hits and misses are kept as integer bitmasks where cell (x, y) is bit y * width + x, so placing, shooting and sinking are all single mask operations. The rows of Coordinate classes are only built when something asks for them.
+    """
+
+    # Dense boards keep everything in masks. See classes.SparseBoard for boards too big for that.
+    sparse = False
+
+    def __init__(
+        self, rows: list[list[Coordinate]] = None, width: int = 10, height: int = 10
+    ):
+        self.width = len(rows[0]) if rows else width
+        self.height = len(rows) if rows else height
+        self.shipMask = 0
+        self.hitMask = 0
+        self.missMask = 0
+        self.shipMasks = {}
+        self.cellShips = {}
         self.shipLocations = {}
         self.sunkShips = []
         self.tempBoard = None
+        self._rows = rows
+        self.geometry: Geometry = getGeometry(self.width, self.height)
+        self.oracle: PlacementOracle = getPlacementOracle(self.width, self.height)
+
+    @property
+    def rows(self) -> list[list[Coordinate]]:
+        """
+        This property returns the rows of Coordinate classes, building them from the masks the first time it is used.
+        """
+        if self._rows is None:
+            self._rows = [
+                [
+                    Coordinate(letter, y, self.geometry)
+                    for letter in self.geometry.letters
+                ]
+                for y in range(self.height)
+            ]
+
+            # Copy the ships and hits that were placed before the rows existed.
+            for index, ship in self.cellShips.items():
+                cell: Coordinate = self._rows[index // self.width][index % self.width]
+                cell.setShip(ship)
+                cell.shipHit = bool(self.hitMask >> index & 1)
+
+        return self._rows
 
     def getRows(self) -> list[list[Coordinate]]:
         """
@@ -20,99 +60,46 @@ class Board:
         """
         return self.rows
 
+    def getIndex(self, x: int, y: int) -> int:
+        """
+        This function returns the bit index of a cell. Use indices: -1 < x < width and -1 < y < height.
+        """
+        return self.geometry.getIndex(x, y)
+
     def getCellData(self, x: int, y: int) -> Coordinate:
         """
-        This function returns the data for a specific cell. Use indices: -1 < x < 10.
+        This function returns the data for a specific cell. Use indices: -1 < x < width and -1 < y < height.
         """
-        if x > 9 or x < 0 or y > 9 or y < 0:
-            raise ValueError(
-                "board.getCellData was provided an input that satisfies: x > 9 or x < 0 or y > 9 or y < 0"
-            )
+        self.getIndex(x, y)
 
         return self.rows[y][x]
 
     def tempAddShip(
         self, startCoordinates: list[int], endCoordinates: list[int], shipData
-    ) -> list[list[Coordinate]]:
+    ) -> ShipPreview:
         """
-        This function temporarily adds a ship to the board. This is used during ship placement to avoid interfering with the actual board.
+        This function temporarily adds a ship to the board. This is used during ship placement to avoid interfering with the actual board. Only the covered cells are stored, so the rows are never copied.
         """
-        # Copy the standard rows array using deepcopy to avoid linked replaces and stuff.
-        tempRows: list[list[Coordinate]] = copy(self.rows)
-
-        # If the ship is vertical;
-        if startCoordinates[0] == endCoordinates[0]:
-            # Iterate through all of the rows. Select the range of the rows by determining the higher value through if/else.
-            for row in range(
-                endCoordinates[1]
-                if endCoordinates[1] < startCoordinates[1]
-                else startCoordinates[1],
-                (
-                    endCoordinates[1]
-                    if endCoordinates[1] > startCoordinates[1]
-                    else startCoordinates[1]
-                )
-                + 1,
-            ):
-                # Set the point to true to enable the ship to be displayed.
-                tempRows[row][startCoordinates[0]].setShip(shipData)
-        # If the ship is horizontal;
-        elif startCoordinates[1] == endCoordinates[1]:
-            # Iterate through all of the points in the row. Select the range of the point by determining the higher value through if/else.
-            for point in tempRows[startCoordinates[1]][
-                startCoordinates[0]
-                if startCoordinates[0] < endCoordinates[0]
-                else endCoordinates[0] : startCoordinates[0] + 1
-                if startCoordinates[0] > endCoordinates[0]
-                else endCoordinates[0] + 1
-            ]:
-                # Set the point to true to enable the ship to be displayed.
-                point.setShip(shipData)
-        else:
-            raise Exception(
-                "From utils.classes: Error generating ship. startCoordinates[0] != endCoordinates[0] AND startCoordinates[1] != endCoordinates[1]."
-            )
+        # Set the temp board to a preview of the ship's cells.
+        self.tempBoard = ShipPreview(
+            self.getMask(startCoordinates, endCoordinates), self.width, shipData
+        )
 
-        # Set the temp board to the edited temp rows.
-        self.tempBoard = tempRows
+        return self.tempBoard
 
     def tempRemShip(
         self, startCoordinates: list[int], endCoordinates: list[int], shipData
-    ) -> list[list[Coordinate]]:
+    ) -> None:
         """
         This function removes temporarily added ships from the board. This is used during ship placement to avoid interfering with the actual board.
         """
-        # This is the same idea as the abive function just reversed.
-        tempRows: list[list[Coordinate]] = copy(self.rows)
-
-        if startCoordinates[0] == endCoordinates[0]:
-            for row in range(
-                endCoordinates[1]
-                if endCoordinates[1] < startCoordinates[1]
-                else startCoordinates[1],
-                (
-                    endCoordinates[1]
-                    if endCoordinates[1] > startCoordinates[1]
-                    else startCoordinates[1]
-                )
-                + 1,
-            ):
-                tempRows[row][startCoordinates[0]].setShip(False)
-        elif startCoordinates[1] == endCoordinates[1]:
-            for point in tempRows[startCoordinates[1]][
-                startCoordinates[0]
-                if startCoordinates[0] < endCoordinates[0]
-                else endCoordinates[0] : startCoordinates[0] + 1
-                if startCoordinates[0] > endCoordinates[0]
-                else endCoordinates[0] + 1
-            ]:
-                point.setShip(False)
-        else:
-            raise Exception(
-                "From utils.classes: Error removing ship. startCoordinates[0] != endCoordinates[0] AND startCoordinates[1] != endCoordinates[1]."
-            )
+        self.tempBoard = None
 
-        self.tempBoard = tempRows
+    def getMask(self, startCoordinates: list[int], endCoordinates: list[int]) -> int:
+        """
+        This function returns the bitmask of all of the cells from the start to the end coordinates.
+        """
+        return self.geometry.getMask(startCoordinates, endCoordinates)
 
     def setShip(
         self, startCoordinates: list[int], endCoordinates: list[int], shipData: Ship
@@ -120,60 +107,115 @@ class Board:
         """
         This function sets a ship from start to end coordinates on the actual board. It also adds a start to end coordinate to the shipLocations dictionary.
         """
-        # This is the same function as the above; it sets the ship onto the main game array this time.
-        if startCoordinates[0] == endCoordinates[0]:
-            for row in range(
-                endCoordinates[1]
-                if endCoordinates[1] < startCoordinates[1]
-                else startCoordinates[1],
-                (
-                    endCoordinates[1]
-                    if endCoordinates[1] > startCoordinates[1]
-                    else startCoordinates[1]
-                )
-                + 1,
-            ):
-                self.rows[row][startCoordinates[0]].setShip(shipData)
-        elif startCoordinates[1] == endCoordinates[1]:
-            for point in self.rows[startCoordinates[1]][
-                startCoordinates[0]
-                if startCoordinates[0] < endCoordinates[0]
-                else endCoordinates[0] : startCoordinates[0] + 1
-                if startCoordinates[0] > endCoordinates[0]
-                else endCoordinates[0] + 1
-            ]:
-                point.setShip(shipData)
-        else:
-            raise Exception(
-                "From utils.classes: Error generating ship. startCoordinates[0] != endCoordinates[0] AND startCoordinates[1] != endCoordinates[1]."
-            )
+        mask: int = self.getMask(startCoordinates, endCoordinates)
+
+        # Add the ship to the occupancy mask and remember which ship owns each cell.
+        self.shipMask |= mask
+        self.shipMasks[shipData.name] = mask
+
+        for index in self.geometry.getSpanBetween(startCoordinates, endCoordinates):
+            self.cellShips[index] = shipData
+
+            # Keep the rows up to date if they have been built.
+            if self._rows is not None:
+                x, y = self.geometry.getPoint(index)
+                self._rows[y][x].setShip(shipData)
 
         self.shipLocations[shipData.name] = dict(
             startCoordinates=startCoordinates, endCoordinates=endCoordinates
         )
 
+        # The ship has been placed, so the preview is no longer needed.
+        self.tempBoard = None
+
+    def fits(self, startCoordinates: list[int], endCoordinates: list[int]) -> bool:
+        """
+        This function checks if a ship can be placed from the start to the end coordinates without overlapping another ship.
+        """
+        return not self.oracle.getMask(startCoordinates, endCoordinates) & self.shipMask
+
     def collides(self, startCoordinates: list[int], endCoordinates: list[int]) -> bool:
         """
         This function checks if a coordinate range will collide with a ship. It returns a list of collisions if found.
         """
-        # Get the range coords of the ship that is to be placed.
-        coordsOfCurrent: list[list[int, int]] = utils.getCoordsFromStartToEnd(
-            startCoordinates, endCoordinates
+        # AND the range with the occupied cells. Anything left over is a collision.
+        overlap: int = (
+            self.oracle.getMask(startCoordinates, endCoordinates) & self.shipMask
         )
 
         # Init an an array for potential collisions.
         collisions: list[tuple[str, int]] = []
 
-        # Loop through all of the coords and get the cell data. If there is a collision, append the coords to the array.
-        for x, y in coordsOfCurrent:
-            cellData = self.getCellData(x, y)
+        # Loop through the set bits of the overlap and append the human-readable coords of each.
+        while overlap:
+            index: int = (overlap & -overlap).bit_length() - 1
+            overlap &= overlap - 1
 
-            if cellData.ship:
-                collisions.append(cellData.coords())
+            collisions.append(
+                (
+                    self.geometry.letters[index % self.width],
+                    index // self.width + 1,
+                )
+            )
 
         # Return all of the collisions.
         return collisions
 
+    def fire(self, x: int, y: int) -> tuple[Ship, bool]:
+        """
+        This function resolves a shot at a cell.
+
+        Returns:
+        tuple[Ship, bool]: The ship that was hit (or None for a miss) and whether the shot sunk it.
+        """
+        bit: int = 1 << self.getIndex(x, y)
+
+        # If there is no ship on the cell, record the miss.
+        if not self.shipMask & bit:
+            self.missMask |= bit
+
+            return None, False
+
+        # Record the hit and damage the ship.
+        self.hitMask |= bit
+
+        ship: Ship = self.cellShips[y * self.width + x]
+        ship.health -= 1
+
+        if self._rows is not None:
+            self._rows[y][x].shipHit = True
+
+        return ship, self.isSunk(ship.name)
+
+    def markShot(self, x: int, y: int, hit: bool) -> None:
+        """
+        This function records a shot that was resolved somewhere else (like on the match server) on a board that doesn't know where the ships are.
+        """
+        bit: int = 1 << self.getIndex(x, y)
+
+        if hit:
+            self.hitMask |= bit
+        else:
+            self.missMask |= bit
+
+    def isShot(self, x: int, y: int) -> bool:
+        """
+        This function determines if a cell has already been shot at.
+        """
+        return bool((self.hitMask | self.missMask) >> self.getIndex(x, y) & 1)
+
+    def isSunk(self, name: str) -> bool:
+        """
+        This function determines if every cell of a ship has been hit.
+        """
+        return not self.shipMasks[name] & ~self.hitMask
+
+    def allSunk(self) -> bool:
+        """
+        This function determines if every ship on the board has been sunk.
+        """
+        return bool(self.shipMask) and not self.shipMask & ~self.hitMask
+
     def getRandomRow(self) -> list[Coordinate]:
         """
         This function gets a random row from the board.
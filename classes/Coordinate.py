@@ -1,12 +1,14 @@
+from classes.Geometry import Geometry
 from classes.Ship import Ship
 
-from functions import utils
-
 
 class Coordinate:
-    def __init__(self, column, row):
+    def __init__(self, column, row, geometry: Geometry):
         self.column = column
         self.row = row
+
+        # The geometry of the board the point is on, which turns the column letter back into its index.
+        self.geometry = geometry
         self.colour = None
         self.name = None
         self.ship = False
@@ -23,7 +25,7 @@ class Coordinate:
         This function returns the coordinates of the current point in x, y form.
         """
 
-        return [utils.convertLetterToNumber(self.column), self.row]
+        return [self.geometry.numbers[self.column], self.row]
 
     def setShip(self, instance: Ship) -> bool:
         """
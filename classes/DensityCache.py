@@ -0,0 +1,140 @@
+import threading
+from collections import OrderedDict
+from typing import Callable
+from weakref import WeakKeyDictionary
+
+import numpy as np
+
+from classes.StateHash import StateHash
+
+from functions.metrics import METRICS
+
+
+class DensityCache:
+    """
+    This class is used to store the density maps of recently seen board states, with the least recently used ones thrown away first. A map only depends on the misses, the hits, the sunk ships and the lengths of the afloat ships, so the opening position and the common early positions are only worked out once.
+
+    States are looked up by their canonical hash (see classes.StateHash.StateHash), so a board that is a rotation or reflection of a cached one uses the cached map turned the same way. Each board's hash is kept with the cache and updated with only the shots that landed since the last lookup.
+
+    Params:
+    compute: The function that works out a map when it isn't cached. It takes the same arguments as game.targeting.getDensityMap and returns a (height, width) array.
+    name: The name of the cache in the metrics.
+    capacity: The most maps kept at once.
+    maxCells: Boards with more cells than this skip the cache, since their maps are too big to keep and rarely repeat.
+    """
+
+    def __init__(
+        self,
+        compute: Callable[..., np.ndarray],
+        name: str = "density",
+        capacity: int = 4096,
+        maxCells: int = 400,
+    ):
+        self.compute = compute
+        self.name = name
+        self.capacity = capacity
+        self.maxCells = maxCells
+
+        # The maps in their canonical orientation, flattened, by (width, height, canonical hash, afloat lengths). The last used map is at the end.
+        self.entries: OrderedDict[tuple, np.ndarray] = OrderedDict()
+
+        # The hash of each board. Boards that are no longer used drop out on their own.
+        self.hashes: WeakKeyDictionary = WeakKeyDictionary()
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+        # The computer's move can be worked out on a background thread (see classes.Speculation.Speculation) while another lookup is running.
+        self.lock = threading.Lock()
+
+    def getMap(self, board, sunkMask: int, lengths: list[int]) -> np.ndarray:
+        """
+        This function returns the density map of a board, from the cache if the state (or a rotation or reflection of it) was seen recently.
+
+        Params:
+        board: The board being shot at.
+        sunkMask: The cells of the ships that have been sunk.
+        lengths: The lengths of the ships that are still afloat.
+
+        Returns:
+        np.ndarray: A (height, width) array, the same as compute would return. It is a new array, so it can be changed freely.
+        """
+        width, height = board.width, board.height
+
+        if width * height > self.maxCells:
+            return self.compute(
+                width, height, board.missMask, board.hitMask, sunkMask, lengths
+            )
+
+        with self.lock:
+            stateHash: StateHash = self.hashes.get(board)
+
+            if stateHash is None:
+                stateHash = self.hashes[board] = StateHash(width, height)
+
+            stateHash.update(board.missMask, board.hitMask, sunkMask)
+
+            canonical, symmetry = stateHash.getCanonical()
+            key: tuple = (width, height, canonical, tuple(sorted(lengths)))
+
+            # Where each cell of the board is moved to in the canonical orientation.
+            cells: np.ndarray = stateHash.symmetries[symmetry]
+
+            density: np.ndarray = self.entries.get(key)
+
+            if density is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+
+                METRICS.increment("density_cache", outcome="hit", cache=self.name)
+
+                return density[cells].reshape(height, width)
+
+        density = self.compute(
+            width, height, board.missMask, board.hitMask, sunkMask, lengths
+        )
+
+        # Store the map turned into the canonical orientation.
+        canonicalMap: np.ndarray = np.empty(width * height, dtype=density.dtype)
+        canonicalMap[cells] = density.ravel()
+
+        with self.lock:
+            self.misses += 1
+            self.entries[key] = canonicalMap
+
+            METRICS.increment("density_cache", outcome="miss", cache=self.name)
+
+            while len(self.entries) > self.capacity:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+                METRICS.increment("density_cache", outcome="eviction", cache=self.name)
+
+        return density
+
+    def getStats(self) -> dict:
+        """
+        This function returns how well the cache is doing: its hits, misses and evictions, how many maps it holds and the share of lookups it answered.
+        """
+        lookups: int = self.hits + self.misses
+
+        return dict(
+            name=self.name,
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            size=len(self.entries),
+            capacity=self.capacity,
+            hitRate=self.hits / lookups if lookups else 0.0,
+        )
+
+    def clear(self) -> None:
+        """
+        This function forgets every map, every board hash and the stats.
+        """
+        with self.lock:
+            self.entries.clear()
+            self.hashes.clear()
+
+            self.hits = self.misses = self.evictions = 0
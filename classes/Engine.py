@@ -0,0 +1,107 @@
+from typing import Iterable, Iterator
+
+from classes.GameLogWriter import GameLogWriter
+from classes.Player import Player
+from classes.ShotEvent import ShotEvent
+from classes.SunkShip import SunkShip
+
+
+class Engine:
+    """
+    This class runs the rules of a game of Battleship. It never prints, sleeps or asks for input; moves go in and shot events come out, so any frontend (the terminal game, simulations, etc.) can drive it.
+    """
+
+    def __init__(
+        self,
+        players: list[Player],
+        startingPlayer: Player = None,
+        log: GameLogWriter = None,
+        seed: int = 0,
+    ):
+        self.players = players
+        self.player = startingPlayer if startingPlayer else players[0]
+        self.winner = None
+        self.log = log
+
+        # If the game is being logged, start its record. The fleets have to be placed by now.
+        if log:
+            log.beginGame(players, self.player, seed)
+
+    def getOpponent(self, player: Player) -> Player:
+        """
+        This function returns the opponent of the provided player.
+        """
+        return self.players[1] if player.getRaw() == 1 else self.players[0]
+
+    def fire(self, guess: list[int]) -> ShotEvent:
+        """
+        This function fires the current player's shot at the opponent's board, updates both players and hands the turn over.
+
+        Params:
+        guess: The x, y indices of the targeted cell.
+
+        Returns:
+        ShotEvent: The hit/miss/sink/win outcome of the shot.
+        """
+        if self.winner:
+            raise Exception("The game is already over. See classes.Engine.Engine.fire.")
+
+        player: Player = self.player
+        opponent: Player = self.getOpponent(player)
+
+        # Shots off the board are rejected before anything is recorded.
+        index: int = opponent.board.getIndex(guess[0], guess[1])
+
+        # The same cell can never be shot twice.
+        if player.isGuessed(guess):
+            raise ValueError(
+                f"Cell {list(guess)} was already guessed. See classes.Engine.Engine.fire."
+            )
+
+        # Record the shot.
+        player.addGuessedCell(list(guess))
+        player.totalShots += 1
+
+        # Resolve the shot against the opponent's board.
+        ship, sunk = opponent.board.fire(guess[0], guess[1])
+
+        if self.log:
+            self.log.writeMove(index)
+
+        sunkShip: SunkShip = None
+
+        # If there is a ship at the guessed cell, count the hit and record the ship if it was sunk.
+        if ship:
+            player.hits += 1
+
+            if sunk:
+                sunkShip = SunkShip(ship, player.totalShots)
+                opponent.board.sunkShips.append(sunkShip)
+        else:
+            player.misses += 1
+
+        # The game is won once every ship on the opponent's board has been sunk.
+        won: bool = sunk and opponent.board.allSunk()
+
+        # Either end the game or pass the turn to the opponent.
+        if won:
+            self.winner = player
+
+            if self.log:
+                self.log.endGame()
+        else:
+            self.player = opponent
+
+        return ShotEvent(player, opponent, list(guess), ship, sunkShip, won)
+
+    def play(self, moves: Iterable[list[int]]) -> Iterator[ShotEvent]:
+        """
+        This function fires a stream of moves, alternating between the players, and yields the event of each shot until the game is won or the moves run out.
+        """
+        for guess in moves:
+            event: ShotEvent = self.fire(guess)
+
+            yield event
+
+            if event.won:
+                return
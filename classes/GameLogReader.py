@@ -0,0 +1,59 @@
+import mmap
+from typing import Iterator
+
+from classes.GameRecord import GameRecord
+
+from functions import gameLog
+
+
+class GameLogReader:
+    """
+    This class reads a game log file (see functions.gameLog for the format). The file is memory-mapped and games are decoded one at a time as they are iterated over, so logs with millions of games never have to fit in memory.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+        with open(path, "rb") as file:
+            self.map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self.settings, self.start = gameLog.decodeHeader(self.map)
+        self.recordSize = gameLog.getRecordSize(self.settings)
+
+    def __enter__(self) -> "GameLogReader":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[GameRecord]:
+        """
+        This function decodes the games in the order they were written. A game that was cut off at the end of the file is skipped.
+        """
+        data: mmap.mmap = self.map
+        offset: int = self.start
+
+        # The fleets sit between the seed and starting player and the moves.
+        fleetsStart: int = gameLog.SEED.size + 1
+
+        while offset + self.recordSize <= len(data):
+            end: int = data.find(bytes([gameLog.END]), offset + self.recordSize)
+
+            if end == -1:
+                return
+
+            yield GameRecord(
+                self.settings,
+                gameLog.SEED.unpack_from(data, offset)[0],
+                data[offset + gameLog.SEED.size],
+                data[offset + fleetsStart : offset + self.recordSize],
+                data[offset + self.recordSize : end],
+            )
+
+            offset = end + 1
+
+    def close(self) -> None:
+        """
+        This function unmaps the file.
+        """
+        self.map.close()
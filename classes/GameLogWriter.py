@@ -0,0 +1,79 @@
+import os
+
+from classes.GameSettings import GameSettings
+from classes.Player import Player
+
+from functions import gameLog
+
+
+class GameLogWriter:
+    """
+    This class appends games to a game log file (see functions.gameLog for the format). The engine calls it as the game is played: once when the game starts, once per move and once when it is won.
+
+    Each game is kept in memory until it is won and then written with a single append, so several processes can log to the same file and a game that is interrupted never leaves half a record.
+    """
+
+    def __init__(self, path: str, settings: GameSettings):
+        self.path = path
+        self.settings = settings
+        self.header = gameLog.encodeHeader(settings)
+        self.record = None
+        self.games = 0
+
+        # Open the file for appending. A new (or empty) file gets the header, and an existing one has to hold games with the same settings.
+        self.file = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+
+        if os.fstat(self.file).st_size == 0:
+            os.write(self.file, self.header)
+        else:
+            with open(path, "rb") as file:
+                if file.read(len(self.header)) != self.header:
+                    os.close(self.file)
+
+                    raise ValueError(
+                        f"{path} holds games with different settings. See classes.GameLogWriter"
+                    )
+
+    def __enter__(self) -> "GameLogWriter":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def beginGame(
+        self, players: list[Player], startingPlayer: Player, seed: int = 0
+    ) -> None:
+        """
+        This function starts the record of a game with its seed, the starting player and the fleets of both players.
+        """
+        self.record = bytearray(gameLog.SEED.pack(seed))
+        self.record.append(startingPlayer.getRaw())
+
+        for player in players:
+            self.record += gameLog.encodeFleet(player.board, self.settings)
+
+    def writeMove(self, index: int) -> None:
+        """
+        This function adds a move (the index of the cell that was shot) to the current game.
+        """
+        self.record.append(index)
+
+    def endGame(self) -> None:
+        """
+        This function finishes the current game and appends it to the file.
+        """
+        self.record.append(gameLog.END)
+
+        os.write(self.file, self.record)
+
+        self.record = None
+        self.games += 1
+
+    def close(self) -> None:
+        """
+        This function closes the file. A game that wasn't finished is dropped.
+        """
+        if self.file is not None:
+            os.close(self.file)
+
+            self.file = None
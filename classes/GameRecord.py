@@ -0,0 +1,79 @@
+from copy import deepcopy
+
+from classes.Engine import Engine
+from classes.GameDetails import GameDetails
+from classes.GameSettings import GameSettings
+from classes.Player import Player
+
+from functions import gameLog
+
+
+class GameRecord:
+    """
+    This class is used to store a game read from a game log: its seed, who started, both fleets and the moves. The boards are only rebuilt if the game is replayed.
+    """
+
+    __slots__ = ("settings", "seed", "startingPlayer", "fleets", "moves")
+
+    def __init__(
+        self,
+        settings: GameSettings,
+        seed: int,
+        startingPlayer: int,
+        fleets: bytes,
+        moves: bytes,
+    ):
+        self.settings = settings
+        self.seed = seed
+        self.startingPlayer = startingPlayer
+        self.fleets = fleets
+        self.moves = moves
+
+    def getFleet(self, player: int) -> list[tuple[list[int], list[int]]]:
+        """
+        This function returns the start and end coordinates of each of a player's ships, in the order of the fleet.
+        """
+        size: int = 2 * len(self.settings.ships)
+
+        return gameLog.decodeFleet(
+            self.fleets[(player - 1) * size : player * size], self.settings
+        )
+
+    def getWinner(self) -> int:
+        """
+        This function returns the raw number of the winner. Turns alternate, so the winner is whoever made the last move.
+        """
+        return self.startingPlayer if len(self.moves) % 2 else 3 - self.startingPlayer
+
+    def getMoves(self) -> list[list[int]]:
+        """
+        This function returns the x, y indices of every move in order.
+        """
+        width: int = self.settings.width
+
+        return [[index % width, index // width] for index in self.moves]
+
+    def replay(self, pvp: bool = False) -> GameDetails:
+        """
+        This function rebuilds the game by placing both fleets and playing every move through the engine.
+
+        Returns:
+        GameDetails: The details of the game, exactly as they were when it was played.
+        """
+        players: list[Player] = [
+            self.settings.createPlayer(1, pvp),
+            self.settings.createPlayer(2, pvp),
+        ]
+
+        for player in players:
+            for ship, (start, end) in zip(
+                self.settings.ships.values(), self.getFleet(player.getRaw())
+            ):
+                player.board.setShip(start, end, deepcopy(ship))
+
+        engine: Engine = Engine(players, players[self.startingPlayer - 1])
+
+        for _ in engine.play(self.getMoves()):
+            pass
+
+        return GameDetails(pvp, engine.winner, players)
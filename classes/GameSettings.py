@@ -0,0 +1,84 @@
+from classes.Board import Board
+from classes.Player import Player
+from classes.Ship import Ship
+from classes.SparseBoard import SparseBoard
+
+from functions.placements import fleetFits
+
+# Boards with more cells than this use sparse storage by default.
+SPARSE_CELLS = 10000
+
+
+class GameSettings:
+    """
+    This class is used to store the parameters of a game: the size of the board and the fleet each player places.
+    """
+
+    def __init__(
+        self, ships: dict, width: int = 10, height: int = 10, sparse: bool = None
+    ):
+        if width < 1 or height < 1:
+            raise ValueError(
+                "The board must have at least one row and column. See classes.GameSettings.GameSettings"
+            )
+
+        # Every ship has to fit on the board in at least one direction, and the names are used to tell the ships apart.
+        for ship in ships.values():
+            if ship.length < 1 or ship.length > max(width, height):
+                raise ValueError(
+                    f"The {ship.name} doesn't fit on a {width}x{height} board. See classes.GameSettings.GameSettings"
+                )
+
+        if len({ship.name for ship in ships.values()}) != len(ships):
+            raise ValueError(
+                "Every ship needs a different name. See classes.GameSettings.GameSettings"
+            )
+
+        # The whole fleet has to fit at once, or placing it would never finish.
+        if not fleetFits(width, height, [ship.length for ship in ships.values()]):
+            raise ValueError(
+                f"The fleet doesn't fit on a {width}x{height} board. See classes.GameSettings.GameSettings"
+            )
+
+        self.ships = ships
+        self.width = width
+        self.height = height
+        self.sparse = width * height > SPARSE_CELLS if sparse is None else sparse
+
+    def getLengths(self) -> list[int]:
+        """
+        This function returns the length of every ship in the fleet.
+        """
+        return [ship.length for ship in self.ships.values()]
+
+    def createBoard(self) -> Board:
+        """
+        This function creates an empty board of the configured size.
+        """
+        if self.sparse:
+            return SparseBoard(self.width, self.height)
+
+        return Board(width=self.width, height=self.height)
+
+    def createPlayer(self, player: int, pvp: bool) -> Player:
+        """
+        This function creates a player with an empty board of the configured size.
+        """
+        newPlayer: Player = Player(player, pvp, self.width, self.sparse, self.height)
+        newPlayer.board = self.createBoard()
+
+        return newPlayer
+
+
+def createFleet(lengths: list[int]) -> dict:
+    """
+    This function creates a fleet of numbered ships with the provided lengths. It is used for custom fleets, like the large ones for stress tests.
+    """
+    colours: list[str] = ["blue", "cyan", "yellow", "magenta", "green"]
+
+    return {
+        f"ship{number}": Ship(
+            length, colours[number % len(colours)], f"Ship {number + 1}"
+        )
+        for number, length in enumerate(lengths)
+    }
@@ -0,0 +1,52 @@
+from classes.GameDetails import GameDetails
+from classes.GameRecord import GameRecord
+from classes.GameSettings import GameSettings
+
+from functions import gameLog
+
+
+class GameSummary:
+    """
+    This class is used to store a finished game compactly. It keeps the numbers that describe the game and its move log (in the game log format), instead of the players and their boards. The full details are rebuilt from the move log when they are needed.
+    """
+
+    __slots__ = ("isPVP", "winner", "totalShots", "hits", "misses", "record")
+
+    def __init__(self, details: GameDetails, settings: GameSettings):
+        players = details.players
+
+        self.isPVP = details.isPVP
+        self.winner = details.winner.getRaw()
+        self.totalShots = (players[0].totalShots, players[1].totalShots)
+        self.hits = (players[0].hits, players[1].hits)
+        self.misses = (players[0].misses, players[1].misses)
+
+        # Turns alternate and the winner made the last move, so the starting player is the winner if the amount of moves is odd.
+        startingPlayer: int = (
+            self.winner if sum(self.totalShots) % 2 else 3 - self.winner
+        )
+
+        # Interleave the guesses of both players back into the order they were made in.
+        first, second = players if startingPlayer == 1 else (players[1], players[0])
+
+        moves: bytearray = bytearray()
+
+        for turn in range(sum(self.totalShots)):
+            x, y = (first if turn % 2 == 0 else second).guessedCells[turn // 2]
+
+            moves.append(y * settings.width + x)
+
+        self.record = GameRecord(
+            settings,
+            0,
+            startingPlayer,
+            gameLog.encodeFleet(players[0].board, settings)
+            + gameLog.encodeFleet(players[1].board, settings),
+            bytes(moves),
+        )
+
+    def getDetails(self) -> GameDetails:
+        """
+        This function rebuilds the full details of the game by replaying its move log. They aren't kept, so only one game is ever held in full.
+        """
+        return self.record.replay(self.isPVP)
@@ -0,0 +1,202 @@
+from functools import lru_cache
+
+import numpy as np
+
+from functions import utils
+
+# The x, y step of each direction, in the order the computer checks them.
+DIRECTIONS = dict(up=(0, -1), down=(0, 1), left=(-1, 0), right=(1, 0))
+
+# Boards with up to this many cells get their per-cell tables built up front. Bigger (sparse) boards work them out when asked instead.
+TABLE_CELLS = 10000
+
+
+class Geometry:
+    """
+    This class stores the geometry of a board size: the cell index and letters of every cell, the neighbours of every cell and the cells covered by a ship from any start, in any direction, at any length. A cell is referred to by its index, y * width + x, everywhere.
+
+    Use getGeometry to get the shared instance for a board size instead of creating a new one.
+    """
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+
+        # The letter of each column, and the column of each letter.
+        self.letters = tuple(utils.getColumnLetters(width))
+        self.numbers = {letter: x for x, letter in enumerate(self.letters)}
+
+        # The cells covered by a ship, by (start index, direction, length). Each span is built the first time it is asked for.
+        self.spans = {}
+
+        # The mask of the cells between two cells, by (first index, last index).
+        self.masks = {}
+
+        self.points = None
+        self.neighbours = None
+        self.symmetries = None
+
+        if width * height <= TABLE_CELLS:
+            self.points = tuple((x, y) for y in range(height) for x in range(width))
+            self.neighbours = tuple(
+                self.findNeighbours(index) for index in range(width * height)
+            )
+
+    def contains(self, x: int, y: int) -> bool:
+        """
+        This function determines if a cell is on the board.
+        """
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def getIndex(self, x: int, y: int) -> int:
+        """
+        This function returns the index of a cell. It raises a ValueError if the cell is not on the board.
+        """
+        if not self.contains(x, y):
+            raise ValueError(
+                f"board.getCellData was provided an input that satisfies: x > {self.width - 1} or x < 0 or y > {self.height - 1} or y < 0"
+            )
+
+        return y * self.width + x
+
+    def getPoint(self, index: int) -> tuple[int, int]:
+        """
+        This function returns the x, y indices of a cell.
+        """
+        if self.points:
+            return self.points[index]
+
+        return index % self.width, index // self.width
+
+    def findNeighbours(self, index: int) -> tuple[tuple[str, int], ...]:
+        """
+        This function works out the (direction, index) of each cell next to a cell, in the order of DIRECTIONS. Cells off the board are left out.
+        """
+        x, y = index % self.width, index // self.width
+
+        return tuple(
+            (direction, (y + dy) * self.width + x + dx)
+            for direction, (dx, dy) in DIRECTIONS.items()
+            if self.contains(x + dx, y + dy)
+        )
+
+    def getNeighbours(self, index: int) -> tuple[tuple[str, int], ...]:
+        """
+        This function returns the (direction, index) of each cell next to a cell, in the order of DIRECTIONS.
+        """
+        if self.neighbours:
+            return self.neighbours[index]
+
+        return self.findNeighbours(index)
+
+    def getNeighbour(self, index: int, direction: str) -> int:
+        """
+        This function returns the index of the cell next to a cell in a direction, or None if it is off the board.
+        """
+        for neighbourDirection, neighbour in self.getNeighbours(index):
+            if neighbourDirection == direction:
+                return neighbour
+
+        return None
+
+    def getSymmetries(self) -> tuple[np.ndarray, ...]:
+        """
+        This function returns the symmetries of the board: the 8 rotations and reflections of a square board, or the 4 of a rectangular one (a quarter turn would change its shape). Each symmetry is an array with the index that every cell is moved to, and the first one leaves every cell where it is.
+        """
+        if self.symmetries is None:
+            x, y = np.meshgrid(np.arange(self.width), np.arange(self.height))
+            right, bottom = self.width - 1 - x, self.height - 1 - y
+
+            # The new x, y of every cell under each symmetry, starting with the identity.
+            points: list[tuple[np.ndarray, np.ndarray]] = [
+                (x, y),
+                (right, y),
+                (x, bottom),
+                (right, bottom),
+            ]
+
+            # Transposing a square board (and combining that with the flips) gives the other 4.
+            if self.width == self.height:
+                points += [(y, x), (bottom, x), (y, right), (bottom, right)]
+
+            self.symmetries = tuple(
+                (newY * self.width + newX).ravel() for newX, newY in points
+            )
+
+        return self.symmetries
+
+    def getSpan(self, start: int, direction: str, length: int) -> tuple[int, ...]:
+        """
+        This function returns the indices of the cells covered by a ship from a start cell in a direction, starting with the start cell, or None if the ship would leave the board.
+        """
+        key: tuple[int, str, int] = (start, direction, length)
+
+        if key not in self.spans:
+            x, y = self.getPoint(start)
+            dx, dy = DIRECTIONS[direction]
+
+            self.spans[key] = (
+                tuple(start + step * (dy * self.width + dx) for step in range(length))
+                if self.contains(x + dx * (length - 1), y + dy * (length - 1))
+                else None
+            )
+
+        return self.spans[key]
+
+    def getEnd(
+        self, startCoordinates: list[int], direction: str, length: int
+    ) -> list[int]:
+        """
+        This function returns the end coordinates of a ship from start coordinates in a direction, or None if the ship would leave the board.
+        """
+        span: tuple[int, ...] = self.getSpan(
+            self.getIndex(*startCoordinates), direction, length
+        )
+
+        return list(self.getPoint(span[-1])) if span else None
+
+    def getSpanBetween(
+        self, startCoordinates: list[int], endCoordinates: list[int]
+    ) -> tuple[int, ...]:
+        """
+        This function returns the indices of the cells from the start to the end coordinates, from the top left cell to the bottom right one. The coordinates have to share a row or a column.
+        """
+        first: int = self.getIndex(*startCoordinates)
+        last: int = self.getIndex(*endCoordinates)
+
+        if first > last:
+            first, last = last, first
+
+        if startCoordinates[1] == endCoordinates[1]:
+            return self.getSpan(first, "right", last - first + 1)
+        elif startCoordinates[0] == endCoordinates[0]:
+            return self.getSpan(first, "down", (last - first) // self.width + 1)
+
+        raise Exception(
+            "Error getting coords from start to end. See classes.Geometry.Geometry.getSpanBetween. startCoordinates[1] != endCoordinates[1] AND startCoordinates[0] != endCoordinates[0]."
+        )
+
+    def getMask(self, startCoordinates: list[int], endCoordinates: list[int]) -> int:
+        """
+        This function returns the bitmask of the cells from the start to the end coordinates.
+        """
+        span: tuple[int, ...] = self.getSpanBetween(startCoordinates, endCoordinates)
+        key: tuple[int, int] = (span[0], span[-1])
+
+        if key not in self.masks:
+            mask: int = 0
+
+            for index in span:
+                mask |= 1 << index
+
+            self.masks[key] = mask
+
+        return self.masks[key]
+
+
+@lru_cache(maxsize=None)
+def getGeometry(width: int, height: int) -> Geometry:
+    """
+    This function returns the geometry of a board size. It is only built once per size.
+    """
+    return Geometry(width, height)
@@ -0,0 +1,108 @@
+import numpy as np
+
+from functions.masks import maskToArray
+
+# The layers of a heatmap, in the order they are saved in.
+# shots: How often the player shot each cell.
+# hits: How often those shots hit.
+# ships: How often the player put one of its own ships on each cell.
+LAYERS = ("shots", "hits", "ships")
+
+# The largest boards (in cells) heatmaps are kept for. Sparse boards can be far bigger than a heatmap is useful for.
+HEATMAP_MAX_CELLS = 4096
+
+
+class Heatmap:
+    """
+    This class is used to store per-cell counters of one kind of player over any number of games: where it shoots, where its shots hit, and where it puts its ships. Each game is added with a few array operations on its masks, so keeping heatmaps costs little next to playing the games.
+
+    Params:
+    width, height: The size of the board.
+    """
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.games: int = 0
+
+        # The counters of every cell, flattened. A cell is y * width + x, like in the masks.
+        self.shots = np.zeros(width * height, dtype=np.int64)
+        self.hits = np.zeros(width * height, dtype=np.int64)
+        self.ships = np.zeros(width * height, dtype=np.int64)
+
+    def addGame(self, shotMask: int, hitMask: int, shipMask: int) -> None:
+        """
+        This function counts a game of the player.
+
+        Params:
+        shotMask: The cells the player shot.
+        hitMask: The cells of the opponent's ships the player hit.
+        shipMask: The cells of the player's own ships.
+        """
+        self.games += 1
+
+        self.shots += maskToArray(shotMask, self.width, self.height).ravel()
+        self.hits += maskToArray(hitMask, self.width, self.height).ravel()
+        self.ships += maskToArray(shipMask, self.width, self.height).ravel()
+
+    def addCounts(
+        self, games: int, shots: np.ndarray, hits: np.ndarray, ships: np.ndarray
+    ) -> None:
+        """
+        This function adds counters that were already summed over many games, such as the ones of a batch of games.
+        """
+        self.games += games
+
+        self.shots += np.asarray(shots, dtype=np.int64).ravel()
+        self.hits += np.asarray(hits, dtype=np.int64).ravel()
+        self.ships += np.asarray(ships, dtype=np.int64).ravel()
+
+    def merge(self, other: "Heatmap") -> None:
+        """
+        This function adds the counters of another heatmap (usually from another process) to this one. Both have to be the same size.
+        """
+        if (other.width, other.height) != (self.width, self.height):
+            raise ValueError(
+                f"Can't merge a {other.width}x{other.height} heatmap into a {self.width}x{self.height} one. See classes.Heatmap.Heatmap.merge"
+            )
+
+        self.addCounts(other.games, other.shots, other.hits, other.ships)
+
+    def getLayer(self, name: str) -> np.ndarray:
+        """
+        This function returns a layer as a (height, width) array: one of LAYERS, or hitRate for the share of each cell's shots that hit (0 where the cell was never shot).
+        """
+        if name == "hitRate":
+            rate = np.divide(
+                self.hits,
+                self.shots,
+                out=np.zeros(self.shots.shape),
+                where=self.shots > 0,
+            )
+
+            return rate.reshape(self.height, self.width)
+
+        if name not in LAYERS:
+            raise ValueError(
+                f"Unknown heatmap layer: {name}. See classes.Heatmap.LAYERS"
+            )
+
+        return getattr(self, name).reshape(self.height, self.width)
+
+    def save(self, path: str) -> None:
+        """
+        This function saves the counters as a .npy file, as a (3, height, width) array of the layers in the order of LAYERS.
+        """
+        np.save(path, np.stack([self.getLayer(name) for name in LAYERS]))
+
+
+def loadHeatmap(path: str, games: int = 0) -> Heatmap:
+    """
+    This function loads a heatmap saved by Heatmap.save. The file doesn't hold the amount of games, so it can be given.
+    """
+    layers: np.ndarray = np.load(path)
+
+    heatmap: Heatmap = Heatmap(layers.shape[2], layers.shape[1])
+    heatmap.addCounts(games, *layers)
+
+    return heatmap
@@ -0,0 +1,66 @@
+from bisect import bisect_left
+
+# The upper bounds of the buckets, in seconds. They span from microseconds (a computer move) to minutes (a player thinking).
+BUCKETS = (
+    0.00001,
+    0.0001,
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1.0,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+
+class Histogram:
+    """
+    This class is used to store a distribution of timings. Each timing is only counted in its bucket, so the histogram stays the same size however many timings it holds.
+    """
+
+    __slots__ = ("bounds", "counts", "count", "total", "max")
+
+    def __init__(self, bounds: tuple[float, ...] = BUCKETS):
+        self.bounds = bounds
+
+        # The amount of timings in each bucket. The last bucket holds every timing past the largest bound.
+        self.counts: list[int] = [0] * (len(bounds) + 1)
+
+        self.count: int = 0
+        self.total: float = 0.0
+        self.max: float = 0.0
+
+    def observe(self, value: float) -> None:
+        """
+        This function adds a timing to the histogram.
+        """
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+
+        if value > self.max:
+            self.max = value
+
+    def getCumulative(self) -> list[tuple[float, int]]:
+        """
+        This function returns the amount of timings at or below each bound, ending with every timing at infinity. (The form Prometheus expects.)
+        """
+        cumulative: list[tuple[float, int]] = []
+        running: int = 0
+
+        for bound, count in zip(self.bounds + (float("inf"),), self.counts):
+            running += count
+            cumulative.append((bound, running))
+
+        return cumulative
+
+    def getMean(self) -> float:
+        """
+        This function returns the mean timing, or 0 if there are none.
+        """
+        return self.total / self.count if self.count else 0.0
@@ -0,0 +1,181 @@
+import json
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+from classes.Histogram import Histogram
+
+
+class Metrics:
+    """
+    This class is used to store the counters and timing histograms of the game. Every metric has a name and optional labels (such as the name of a strategy), and can be exported as JSON or as Prometheus text.
+
+    Recording is a dictionary lookup and an addition, so it can stay on in the hot paths. It can also be turned off entirely. Metrics can be recorded from several threads at once (such as the speculation worker and the game).
+    """
+
+    def __init__(self, prefix: str = "battleship", enabled: bool = True):
+        self.prefix = prefix
+        self.enabled = enabled
+
+        # The metrics, by (name, labels). The labels are a sorted tuple of (key, value) pairs.
+        self.counters: dict[tuple, float] = {}
+        self.histograms: dict[tuple, Histogram] = {}
+
+        # Guards the metrics, so that updates from different threads aren't lost and exports don't see them half done.
+        self.lock = threading.Lock()
+
+    def increment(self, name: str, amount: float = 1, **labels) -> None:
+        """
+        This function adds an amount to a counter.
+        """
+        if not self.enabled:
+            return
+
+        key: tuple = (name, tuple(sorted(labels.items())))
+
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        """
+        This function adds a timing (in seconds) to a histogram.
+        """
+        if not self.enabled:
+            return
+
+        key: tuple = (name, tuple(sorted(labels.items())))
+
+        with self.lock:
+            histogram: Histogram = self.histograms.get(key)
+
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram()
+
+            histogram.observe(value)
+
+    @contextmanager
+    def timer(self, name: str, **labels) -> Iterator[None]:
+        """
+        This function times the block it wraps into a histogram.
+        """
+        if not self.enabled:
+            yield
+
+            return
+
+        start: float = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def reset(self) -> None:
+        """
+        This function forgets every metric.
+        """
+        with self.lock:
+            self.counters.clear()
+            self.histograms.clear()
+
+    def toDict(self) -> dict:
+        """
+        This function returns every metric as plain data.
+        """
+        with self.lock:
+            return dict(
+                counters=[
+                    dict(name=name, labels=dict(labels), value=value)
+                    for (name, labels), value in sorted(self.counters.items())
+                ],
+                histograms=[
+                    dict(
+                        name=name,
+                        labels=dict(labels),
+                        count=histogram.count,
+                        sum=histogram.total,
+                        mean=histogram.getMean(),
+                        max=histogram.max,
+                        buckets={
+                            str(bound): count
+                            for bound, count in histogram.getCumulative()
+                        },
+                    )
+                    for (name, labels), histogram in sorted(
+                        self.histograms.items(), key=lambda item: item[0]
+                    )
+                ],
+            )
+
+    def toJSON(self) -> str:
+        """
+        This function exports every metric as JSON.
+        """
+        return json.dumps(self.toDict(), indent=4)
+
+    def toPrometheus(self) -> str:
+        """
+        This function exports every metric in the Prometheus text format. Counters end in _total and timings in _seconds.
+        """
+        lines: list[str] = []
+        typed: set = set()
+
+        # Copy the metrics, so they can be formatted without holding up the threads recording them.
+        with self.lock:
+            counters: list[tuple] = sorted(self.counters.items())
+            histograms: list[tuple] = [
+                (key, histogram.count, histogram.total, histogram.getCumulative())
+                for key, histogram in sorted(
+                    self.histograms.items(), key=lambda item: item[0]
+                )
+            ]
+
+        def formatLabels(labels: tuple, extra: tuple = ()) -> str:
+            pairs: tuple = labels + extra
+
+            if not pairs:
+                return ""
+
+            # Backslashes, quotes and newlines in label values have to be escaped.
+            values: list[str] = [
+                str(value)
+                .replace("\\", "\\\\")
+                .replace('"', '\\"')
+                .replace("\n", "\\n")
+                for _, value in pairs
+            ]
+
+            return (
+                "{"
+                + ",".join(f'{key}="{value}"' for (key, _), value in zip(pairs, values))
+                + "}"
+            )
+
+        for (name, labels), value in counters:
+            metric: str = f"{self.prefix}_{name}_total"
+
+            if metric not in typed:
+                typed.add(metric)
+                lines.append(f"# TYPE {metric} counter")
+
+            lines.append(f"{metric}{formatLabels(labels)} {value}")
+
+        for (name, labels), count, total, cumulative in histograms:
+            metric: str = f"{self.prefix}_{name}_seconds"
+
+            if metric not in typed:
+                typed.add(metric)
+                lines.append(f"# TYPE {metric} histogram")
+
+            for bound, bucketCount in cumulative:
+                bucket: str = "+Inf" if bound == float("inf") else repr(bound)
+
+                lines.append(
+                    f"{metric}_bucket{formatLabels(labels, (('le', bucket),))} {bucketCount}"
+                )
+
+            lines.append(f"{metric}_sum{formatLabels(labels)} {total}")
+            lines.append(f"{metric}_count{formatLabels(labels)} {count}")
+
+        return "\n".join(lines) + "\n"
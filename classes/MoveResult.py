@@ -0,0 +1,35 @@
+from classes.Coordinate import Coordinate
+
+
+class MoveResult:
+    """
+    This class is used to store the move a timed computer player picked, and how much of its search it got through before the time budget ran out.
+    """
+
+    def __init__(
+        self,
+        coordinate: Coordinate,
+        difficulty: str,
+        budget: float,
+        elapsed: float,
+        steps: int,
+        samples: int,
+        complete: bool,
+    ):
+        self.coordinate = coordinate
+        self.difficulty = difficulty
+        self.budget = budget
+        self.elapsed = elapsed
+
+        # The amount of steps of the search that were done, and the amount of fleet layouts it sampled.
+        self.steps = steps
+        self.samples = samples
+
+        # Whether the search finished before the budget ran out. If it didn't, the coordinate is the best answer it had at that point.
+        self.complete = complete
+
+    def rawCoords(self) -> list[int]:
+        """
+        This function returns the x, y indices of the picked cell.
+        """
+        return self.coordinate.rawCoords()
@@ -0,0 +1,326 @@
+from functools import lru_cache
+
+import numpy as np
+
+from classes.Geometry import DIRECTIONS
+
+from functions.placements import getPlacements, getPlacementWords
+
+# The x, y step of each key that moves a ship while it is being placed.
+MOVES = dict(W=(0, -1), A=(-1, 0), S=(0, 1), D=(1, 0))
+
+# What can be wrong with a placement, as returned by PlacementOracle.getProblem:
+# offBoard: A cell of the ship is off the board.
+# shape: The ship isn't a straight line, or isn't as long as the ship.
+# overlap: The ship covers a cell of another ship.
+PROBLEMS = ("offBoard", "shape", "overlap")
+
+
+class PlacementOracle:
+    """
+    This class is used to store the rules for where a ship can go on a board size, so that the human's placement, the computer's placement and the validation of layouts sent by clients all follow the same ones.
+
+    Every placement is a shifted copy of a horizontal or vertical block of ones, so checking one is a few comparisons, a shift and an AND. Whole batches of fleets are checked at once with the placement tables of functions.placements.
+
+    Use getPlacementOracle to get the shared instance for a board size instead of creating a new one.
+    """
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+
+        # The mask of a ship of each length placed at cell 0, horizontally and vertically. Built the first time a length is asked for.
+        self.blocks: dict[int, tuple[int, int]] = {}
+
+        # The index of each placement in the placement table, by length, then vertical, then start cell. -1 if the ship would leave the board.
+        self.indices: dict[int, np.ndarray] = {}
+
+    def getBlocks(self, length: int) -> tuple[int, int]:
+        """
+        This function returns the masks of a ship placed at cell 0: horizontally, then vertically.
+        """
+        blocks: tuple[int, int] = self.blocks.get(length)
+
+        if blocks is None:
+            column: int = 0
+
+            for offset in range(length):
+                column |= 1 << (offset * self.width)
+
+            blocks = self.blocks[length] = ((1 << length) - 1, column)
+
+        return blocks
+
+    def contains(self, coordinates: list[int]) -> bool:
+        """
+        This function determines if x, y coordinates are on the board.
+        """
+        return 0 <= coordinates[0] < self.width and 0 <= coordinates[1] < self.height
+
+    def getPlacement(
+        self, startCoordinates: list[int], endCoordinates: list[int]
+    ) -> tuple[int, int]:
+        """
+        This function returns the mask and length of a ship from the start to the end coordinates, in either order.
+
+        Returns:
+        tuple[int, int]: The mask and length, or (0, 0) if the coordinates leave the board or don't share a row or a column.
+        """
+        if not (self.contains(startCoordinates) and self.contains(endCoordinates)):
+            return 0, 0
+
+        (startX, startY), (endX, endY) = startCoordinates, endCoordinates
+
+        if startY == endY:
+            length: int = abs(endX - startX) + 1
+
+            return (
+                self.getBlocks(length)[0] << (startY * self.width + min(startX, endX)),
+                length,
+            )
+
+        if startX == endX:
+            length: int = abs(endY - startY) + 1
+
+            return (
+                self.getBlocks(length)[1] << (min(startY, endY) * self.width + startX),
+                length,
+            )
+
+        return 0, 0
+
+    def getMask(self, startCoordinates: list[int], endCoordinates: list[int]) -> int:
+        """
+        This function returns the mask of a ship from the start to the end coordinates, or 0 if they leave the board or don't share a row or a column.
+        """
+        return self.getPlacement(startCoordinates, endCoordinates)[0]
+
+    def getProblem(
+        self,
+        startCoordinates: list[int],
+        endCoordinates: list[int],
+        length: int,
+        occupied: int = 0,
+    ) -> str:
+        """
+        This function checks if a ship can be placed from the start to the end coordinates.
+
+        Params:
+        length: The length of the ship.
+        occupied: The mask of the cells that already hold a ship.
+
+        Returns:
+        str: What is wrong with the placement (see PROBLEMS), or None if it is legal.
+        """
+        if not (self.contains(startCoordinates) and self.contains(endCoordinates)):
+            return "offBoard"
+
+        mask, span = self.getPlacement(startCoordinates, endCoordinates)
+
+        if span != length:
+            return "shape"
+
+        if mask & occupied:
+            return "overlap"
+
+        return None
+
+    def isLegal(
+        self,
+        startCoordinates: list[int],
+        endCoordinates: list[int],
+        length: int,
+        occupied: int = 0,
+    ) -> bool:
+        """
+        This function checks if a ship can be placed from the start to the end coordinates without leaving the board or overlapping the occupied cells.
+        """
+        mask, span = self.getPlacement(startCoordinates, endCoordinates)
+
+        return span == length and not mask & occupied
+
+    def getRotation(
+        self,
+        startCoordinates: list[int],
+        endCoordinates: list[int],
+        occupied: int = 0,
+    ) -> tuple[list[int], list[int]]:
+        """
+        This function rotates a ship around its start. A horizontal ship turns up (or down if up leaves the board or is occupied), and a vertical one left (or right).
+
+        Returns:
+        tuple[list[int], list[int]]: The new start and end coordinates, or None if the ship can't rotate.
+        """
+        mask, length = self.getPlacement(startCoordinates, endCoordinates)
+
+        if not mask or length < 2:
+            return None
+
+        x, y = startCoordinates
+
+        directions: tuple[str, str] = (
+            ("up", "down") if y == endCoordinates[1] else ("left", "right")
+        )
+
+        for direction in directions:
+            dx, dy = DIRECTIONS[direction]
+            end: list[int] = [x + dx * (length - 1), y + dy * (length - 1)]
+
+            rotated: int = self.getMask(startCoordinates, end)
+
+            if rotated and not rotated & occupied:
+                return startCoordinates, end
+
+        return None
+
+    def getMoves(
+        self,
+        startCoordinates: list[int],
+        endCoordinates: list[int],
+        occupied: int = 0,
+    ) -> dict[str, tuple[list[int], list[int]]]:
+        """
+        This function finds every legal move of a ship being placed: a step in each direction (W, A, S, D) and a rotation (R). Moves that leave the board or cover an occupied cell are left out.
+
+        Returns:
+        dict: The new start and end coordinates, by key.
+        """
+        moves: dict[str, tuple[list[int], list[int]]] = {}
+
+        for key, (dx, dy) in MOVES.items():
+            start: list[int] = [startCoordinates[0] + dx, startCoordinates[1] + dy]
+            end: list[int] = [endCoordinates[0] + dx, endCoordinates[1] + dy]
+
+            mask: int = self.getMask(start, end)
+
+            if mask and not mask & occupied:
+                moves[key] = (start, end)
+
+        rotation: tuple[list[int], list[int]] = self.getRotation(
+            startCoordinates, endCoordinates, occupied
+        )
+
+        if rotation:
+            moves["R"] = rotation
+
+        return moves
+
+    def getDirections(
+        self, startCoordinates: list[int], length: int
+    ) -> dict[str, tuple[int, list[int]]]:
+        """
+        This function finds the directions (in the order of DIRECTIONS) a ship can point from a start cell without leaving the board.
+
+        Returns:
+        dict: The mask and end coordinates of the ship, by direction.
+        """
+        x, y = startCoordinates
+        directions: dict[str, tuple[int, list[int]]] = {}
+
+        for direction, (dx, dy) in DIRECTIONS.items():
+            end: list[int] = [x + dx * (length - 1), y + dy * (length - 1)]
+
+            if self.contains(end):
+                directions[direction] = (self.getMask(startCoordinates, end), end)
+
+        return directions
+
+    def isValidFleet(
+        self, layout: list[tuple[list[int], list[int]]], lengths: list[int]
+    ) -> bool:
+        """
+        This function checks a whole fleet layout: every ship has to be on the board, straight, as long as its ship and not overlapping any other.
+
+        Params:
+        layout: The start and end coordinates of each ship.
+        lengths: The length of each ship, in the same order.
+        """
+        if len(layout) != len(lengths):
+            return False
+
+        occupied: int = 0
+
+        for (startCoordinates, endCoordinates), length in zip(layout, lengths):
+            mask, span = self.getPlacement(startCoordinates, endCoordinates)
+
+            if span != length or mask & occupied:
+                return False
+
+            occupied |= mask
+
+        return True
+
+    def getIndices(self, length: int) -> np.ndarray:
+        """
+        This function returns the index in the placement table (see functions.placements.getPlacements) of a ship of a length, by vertical (0 or 1) and start cell. Starts that would take the ship off the board are -1.
+        """
+        indices: np.ndarray = self.indices.get(length)
+
+        if indices is None:
+            indices = np.full((2, self.width * self.height), -1, dtype=np.int32)
+
+            for index, (_, start, end) in enumerate(
+                getPlacements(self.width, self.height, length)
+            ):
+                vertical: bool = start[0] == end[0] and length > 1
+
+                indices[int(vertical), start[1] * self.width + start[0]] = index
+
+            # A ship of length 1 points both ways.
+            if length == 1:
+                indices[1] = indices[0]
+
+            self.indices[length] = indices
+
+        return indices
+
+    def validateFleets(self, fleets: np.ndarray, lengths: list[int]) -> np.ndarray:
+        """
+        This function checks many fleet layouts at once, in the game log format.
+
+        Params:
+        fleets: (fleets, ships, 2) The start cell of each ship, and 1 if it is vertical. See functions.gameLog.encodeFleet.
+        lengths: The length of each ship.
+
+        Returns:
+        np.ndarray: (fleets,) Whether each layout is valid.
+        """
+        fleets = np.asarray(fleets, dtype=np.int64)
+        cells: int = self.width * self.height
+
+        # Layouts with a start off the board or a direction that isn't 0 or 1 are invalid before anything else is checked.
+        starts, vertical = fleets[:, :, 0], fleets[:, :, 1]
+        valid = (
+            (starts >= 0) & (starts < cells) & ((vertical == 0) | (vertical == 1))
+        ).all(axis=1)
+
+        starts = np.where(valid[:, None], starts, 0)
+        vertical = np.where(valid[:, None], vertical, 0)
+
+        occupied: np.ndarray = None
+
+        for ship, length in enumerate(lengths):
+            index = self.getIndices(length)[vertical[:, ship], starts[:, ship]]
+
+            valid &= index >= 0
+
+            # Look the placements up as 64-bit words, and check them against the cells of the ships before them.
+            words = getPlacementWords(self.width, self.height, length)[
+                np.maximum(index, 0)
+            ]
+
+            if occupied is None:
+                occupied = words
+            else:
+                valid &= ~(occupied & words).any(axis=1)
+                occupied = occupied | words
+
+        return valid
+
+
+@lru_cache(maxsize=None)
+def getPlacementOracle(width: int, height: int) -> PlacementOracle:
+    """
+    This function returns the placement oracle of a board size. It is only built once per size.
+    """
+    return PlacementOracle(width, height)
@@ -1,15 +1,46 @@
+from classes.Geometry import Geometry, getGeometry
+
+
 class Player:
     """
     This class is used to store player data.
     """
 
-    def __init__(self, player: int, pvp: bool):
+    def __init__(
+        self,
+        player: int,
+        pvp: bool,
+        width: int = 10,
+        sparse: bool = False,
+        height: int = 10,
+    ):
         self.player = player
         self.pvp = pvp
+        self.width = width
+        self.height = height
+        self.geometry: Geometry = getGeometry(width, height)
+        self.sparse = sparse
         self.hits = 0
         self.misses = 0
         self.totalShots = 0
         self.guessedCells = []
+        self.guessedSet = set()
+        self._guessedMask = 0
+
+    @property
+    def guessedMask(self) -> int:
+        """
+        This property returns the guessed cells as a mask. On sparse boards the guesses are kept in a set instead, so the mask is built when it is asked for and kept until the next guess.
+        """
+        if self._guessedMask is None:
+            mask: int = 0
+
+            for index in self.guessedSet:
+                mask |= 1 << index
+
+            self._guessedMask = mask
+
+        return self._guessedMask
 
     def getRaw(self) -> int:
         """
@@ -40,14 +71,27 @@ class Player:
 
     def addGuessedCell(self, coordinates: list[int]) -> None:
         """
-        This function adds the provided cell to the guesses array.
+        This function adds the provided cell to the guesses array. The cell is also set in the guessed mask (or set, on sparse boards), which is used for lookups.
         """
 
+        index: int = self.geometry.getIndex(coordinates[0], coordinates[1])
+
         self.guessedCells.append(coordinates)
 
+        if self.sparse:
+            self.guessedSet.add(index)
+            self._guessedMask = None
+        else:
+            self._guessedMask |= 1 << index
+
     def isGuessed(self, coordinates: list[int]) -> bool:
         """
-        This function determines if the user has guessed the coordinate already.
+        This function determines if the user has guessed the coordinate already. It raises a ValueError if the cell is not on the board.
         """
 
-        return list(coordinates) in self.guessedCells
+        index: int = self.geometry.getIndex(coordinates[0], coordinates[1])
+
+        if self.sparse:
+            return index in self.guessedSet
+
+        return bool(self._guessedMask >> index & 1)
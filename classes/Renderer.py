@@ -0,0 +1,177 @@
+import io
+import re
+import shutil
+import sys
+import unicodedata
+from contextlib import contextmanager, redirect_stdout
+
+# ANSI escape sequences used by the renderer.
+CLEAR_SCREEN = "\x1b[H\x1b[2J\x1b[3J"
+CLEAR_LINE_END = "\x1b[K"
+CLEAR_BELOW = "\x1b[J"
+RESET = "\x1b[0m"
+
+# Matches a colour/style sequence (like the ones termcolor prints) or a single character.
+TOKEN = re.compile(r"\x1b\[([0-9;]*)m|(.)", re.DOTALL)
+
+# Leave room below the frame for prompts and error messages. If the frame and this room don't fit on the screen, the terminal would scroll and the old frame could no longer be patched in place.
+PROMPT_ROWS = 10
+
+
+def moveCursor(row: int, column: int) -> str:
+    """
+    This function returns the sequence that moves the cursor to a 0-based row and column.
+    """
+    return f"\x1b[{row + 1};{column + 1}H"
+
+
+class Renderer:
+    """
+    This class draws screens to the terminal. It remembers the last frame and only redraws the cells that changed, using cursor moves, and writes each frame with a single write.
+    """
+
+    def __init__(self, stream=None):
+        self.stream = stream
+        self.previous = None
+
+    def getStream(self):
+        """
+        This function returns the stream being drawn to. It defaults to the current stdout.
+        """
+        return self.stream if self.stream else sys.stdout
+
+    def isTerminal(self) -> bool:
+        """
+        This function determines if the stream is a terminal which understands cursor moves.
+        """
+        isatty = getattr(self.getStream(), "isatty", None)
+
+        return bool(isatty and isatty())
+
+    def clear(self) -> None:
+        """
+        This function clears the screen without starting a subprocess, and forgets the last frame so that the next one is drawn in full.
+        """
+        self.previous = None
+
+        if self.isTerminal():
+            self.getStream().write(CLEAR_SCREEN)
+            self.getStream().flush()
+
+    def parse(self, text: str) -> list[list[tuple[str, str]]]:
+        """
+        This function splits printed text into lines of cells. Each cell is a (style, character) pair, where the style is the colour sequences in effect for the character.
+        """
+        lines: list[list[tuple[str, str]]] = []
+
+        for line in text.split("\n")[:-1] if text.endswith("\n") else text.split("\n"):
+            cells: list[tuple[str, str]] = []
+            style: str = ""
+            pending: str = ""
+
+            for match in TOKEN.finditer(line):
+                codes, character = match.groups()
+
+                # Colour sequences change the style of the characters after them. A reset clears it.
+                if character is None:
+                    style = "" if codes in ("", "0") else style + match.group(0)
+                # Zero-width characters don't take up a cell, so they are drawn with the next one.
+                elif unicodedata.category(character) in ("Cf", "Mn"):
+                    pending += character
+                else:
+                    cells.append((style, pending + character))
+                    pending = ""
+
+            if pending:
+                cells.append((style, pending))
+
+            lines.append(cells)
+
+        return lines
+
+    def getPatch(self, lines: list[list[tuple[str, str]]]) -> str:
+        """
+        This function returns the sequences that turn the last frame into the new one, one run of changed cells at a time.
+        """
+        patch: list[str] = []
+
+        for row, cells in enumerate(lines):
+            old = self.previous[row] if row < len(self.previous) else []
+
+            if cells == old:
+                continue
+
+            column: int = 0
+
+            while column < len(cells):
+                # Skip the cells that didn't change.
+                if column < len(old) and cells[column] == old[column]:
+                    column += 1
+
+                    continue
+
+                # Move to the first changed cell and draw until the cells match again.
+                patch.append(moveCursor(row, column))
+
+                style: str = None
+
+                while column < len(cells) and (
+                    column >= len(old) or cells[column] != old[column]
+                ):
+                    if cells[column][0] != style:
+                        style = cells[column][0]
+                        patch.append(RESET + style)
+
+                    patch.append(cells[column][1])
+                    column += 1
+
+                patch.append(RESET)
+
+            # Erase anything left over from a longer old line.
+            if len(old) > len(cells):
+                patch.append(moveCursor(row, len(cells)) + CLEAR_LINE_END)
+
+        # Leave the cursor under the frame and erase old prompts and lines below it.
+        patch.append(moveCursor(len(lines), 0) + CLEAR_BELOW)
+
+        return "".join(patch)
+
+    def draw(self, text: str) -> None:
+        """
+        This function draws a frame of printed text to the stream.
+        """
+        stream = self.getStream()
+
+        if not self.isTerminal():
+            stream.write(text)
+            stream.flush()
+
+            return
+
+        lines = self.parse(text)
+
+        # Draw the whole frame if there is nothing to patch or it wouldn't fit on the screen.
+        if (
+            self.previous is None
+            or len(lines) + PROMPT_ROWS > shutil.get_terminal_size().lines
+        ):
+            output: str = CLEAR_SCREEN + text
+        else:
+            output: str = self.getPatch(lines)
+
+        self.previous = lines
+
+        stream.write(output)
+        stream.flush()
+
+    @contextmanager
+    def frame(self):
+        """
+        This function captures everything printed inside the with block and draws it as one frame when the block ends.
+        """
+        buffer = io.StringIO()
+
+        with redirect_stdout(buffer):
+            yield buffer
+
+        self.draw(buffer.getvalue())
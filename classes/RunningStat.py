@@ -0,0 +1,155 @@
+import numpy as np
+
+
+class RunningStat:
+    """
+    This class is used to store the statistics of a stream of values without keeping the values: their count, mean, variance, smallest and largest, and a sketch of their distribution for quantiles. It stays the same size however many values it holds.
+
+    The sketch counts the values rounded to a resolution, so quantiles are exact for whole numbers at a resolution of 1 (such as shots and moves) and within the resolution otherwise. Two running stats merge into exactly the counts (and, up to rounding, the mean and variance) of one that saw both streams, so workers can each keep their own.
+
+    Params:
+    resolution: The width of the sketch's buckets.
+    """
+
+    __slots__ = ("resolution", "count", "mean", "m2", "min", "max", "buckets")
+
+    def __init__(self, resolution: float = 1):
+        self.resolution = resolution
+
+        self.count: int = 0
+        self.mean: float = 0.0
+
+        # The sum of the squared differences from the mean. (Welford's method, which doesn't lose precision the way a sum of squares does.)
+        self.m2: float = 0.0
+
+        self.min: float = None
+        self.max: float = None
+
+        # The amount of values in each bucket, by the value divided by the resolution and rounded.
+        self.buckets: dict[int, int] = {}
+
+    def add(self, value: float) -> None:
+        """
+        This function adds a value to the stats.
+        """
+        self.count += 1
+
+        delta: float = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+        bucket: int = round(value / self.resolution)
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+
+    def addArray(self, values: np.ndarray) -> None:
+        """
+        This function adds every value of an array at once. It gives the same stats as adding them one at a time.
+        """
+        values = np.asarray(values).ravel()
+
+        if not len(values):
+            return
+
+        other: RunningStat = RunningStat(self.resolution)
+
+        other.count = len(values)
+        other.mean = float(values.mean())
+        other.m2 = float(((values - other.mean) ** 2).sum())
+
+        # Keep whole numbers whole, the same as when they are added one at a time.
+        other.min = values.min().item()
+        other.max = values.max().item()
+
+        buckets, counts = np.unique(
+            np.round(values / self.resolution).astype(np.int64), return_counts=True
+        )
+        other.buckets = dict(zip(buckets.tolist(), counts.tolist()))
+
+        self.merge(other)
+
+    def merge(self, other: "RunningStat") -> None:
+        """
+        This function adds the values of another running stat (usually from another process) to this one. Both have to use the same resolution.
+        """
+        if other.resolution != self.resolution:
+            raise ValueError(
+                f"Can't merge stats with resolutions {self.resolution} and {other.resolution}. See classes.RunningStat.RunningStat.merge"
+            )
+
+        if not other.count:
+            return
+
+        count: int = self.count + other.count
+        delta: float = other.mean - self.mean
+
+        # Chan's formula combines the means and squared differences of the two streams.
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.mean += delta * other.count / count
+        self.count = count
+
+        if self.min is None or other.min < self.min:
+            self.min = other.min
+        if self.max is None or other.max > self.max:
+            self.max = other.max
+
+        for bucket, amount in other.buckets.items():
+            self.buckets[bucket] = self.buckets.get(bucket, 0) + amount
+
+    def getMean(self) -> float:
+        """
+        This function returns the mean of the values, or None if there are none.
+        """
+        return self.mean if self.count else None
+
+    def getVariance(self) -> float:
+        """
+        This function returns the sample variance of the values, or None if there are less than 2.
+        """
+        return self.m2 / (self.count - 1) if self.count > 1 else None
+
+    def getStandardDeviation(self) -> float:
+        """
+        This function returns the sample standard deviation of the values, or None if there are less than 2.
+        """
+        variance: float = self.getVariance()
+
+        return variance**0.5 if variance is not None else None
+
+    def getQuantile(self, quantile: float) -> float:
+        """
+        This function returns the value that the given share of values are at or below (0.5 for the median), rounded to the resolution. It returns None if there are no values.
+        """
+        if not self.count:
+            return None
+
+        # The rank of the value, counting from 1.
+        rank: float = max(1, quantile * self.count)
+        running: int = 0
+
+        for bucket in sorted(self.buckets):
+            running += self.buckets[bucket]
+
+            if running >= rank:
+                return bucket * self.resolution
+
+        return max(self.buckets) * self.resolution
+
+    def toDict(self) -> dict:
+        """
+        This function returns the stats as plain data.
+        """
+        return dict(
+            count=self.count,
+            mean=self.getMean(),
+            standardDeviation=self.getStandardDeviation(),
+            min=self.min,
+            max=self.max,
+            median=self.getQuantile(0.5),
+            p90=self.getQuantile(0.9),
+            p99=self.getQuantile(0.99),
+        )
@@ -0,0 +1,119 @@
+import asyncio
+
+from classes.Player import Player
+
+from functions import protocol
+
+
+class Seat:
+    """
+    This class is used to store a player's place in a match on the match server: the connection to their client and their Player class. A seat without a connection is played by the computer. The client uses it for its connection to the server too.
+    """
+
+    def __init__(
+        self, reader: asyncio.StreamReader = None, writer: asyncio.StreamWriter = None
+    ):
+        self.reader = reader
+        self.writer = writer
+        self.player: Player = None
+
+        # Set once the seat's match is over, so that a player waiting in the lobby knows when to disconnect.
+        self.done = asyncio.Event()
+
+        # While the seat waits in the lobby, a read of its client is kept running to notice if it disconnects. It is stopped when the seat's match starts, so that the match is the only reader.
+        self.watcher: asyncio.Task = None
+        self.matched: bool = False
+
+    def isComputer(self) -> bool:
+        """
+        This function determines if the seat is played by the computer.
+        """
+        return self.reader is None
+
+    async def send(self, message: dict) -> None:
+        """
+        This function sends a message to the seat's client. Messages to the computer, or to a client that has gone, are dropped.
+        """
+        if self.isComputer() or self.writer.is_closing():
+            return
+
+        self.writer.write(protocol.encodeMessage(message))
+
+        try:
+            await self.writer.drain()
+        except ConnectionError:
+            self.close()
+
+    async def receive(self) -> dict:
+        """
+        This function waits for the next message from the seat's client.
+
+        Returns:
+        dict: The message, a message with the type "invalid" if it couldn't be read, or None if the client disconnected.
+        """
+        if self.isComputer():
+            return None
+
+        try:
+            line: bytes = await self.reader.readline()
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            return None
+
+        if not line:
+            return None
+
+        try:
+            return protocol.decodeMessage(line)
+        except ValueError:
+            return dict(type="invalid")
+
+    async def waitInLobby(self) -> bool:
+        """
+        This function waits in the lobby until the seat's match is over, or until its client disconnects before the match starts. Nothing is expected from the client before the match starts, so anything it sends is ignored.
+
+        Returns:
+        bool: False if the client disconnected before the match started.
+        """
+        done: asyncio.Task = asyncio.ensure_future(self.done.wait())
+
+        try:
+            while True:
+                # Once the match has started, it notices the client leaving itself.
+                if self.matched or done.done():
+                    await done
+
+                    return True
+
+                self.watcher = asyncio.ensure_future(self.receive())
+
+                await asyncio.wait(
+                    {self.watcher, done}, return_when=asyncio.FIRST_COMPLETED
+                )
+
+                if (
+                    not self.matched
+                    and self.watcher.done()
+                    and self.watcher.result() is None
+                ):
+                    return False
+        finally:
+            done.cancel()
+
+            if self.watcher:
+                self.watcher.cancel()
+
+    def startMatch(self) -> None:
+        """
+        This function takes a seat out of the lobby for its match, stopping the read that watches for its client leaving.
+        """
+        self.matched = True
+
+        if self.watcher:
+            self.watcher.cancel()
+
+    def close(self) -> None:
+        """
+        This function closes the connection to the seat's client.
+        """
+        if self.writer and not self.writer.is_closing():
+            self.writer.close()
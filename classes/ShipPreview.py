@@ -0,0 +1,18 @@
+from classes.Ship import Ship
+
+
+class ShipPreview:
+    """
+    This class is used to store the ship that is being moved around during placement. Only the cells that the ship covers are stored; the board draws them over its own rows.
+    """
+
+    def __init__(self, mask: int, width: int, ship: Ship):
+        self.mask = mask
+        self.width = width
+        self.ship = ship
+
+    def getShip(self, x: int, y: int) -> Ship:
+        """
+        This function returns the previewed ship if it covers the cell, otherwise None.
+        """
+        return self.ship if self.mask >> (y * self.width + x) & 1 else None
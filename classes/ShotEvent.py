@@ -0,0 +1,40 @@
+from classes.Coordinate import Coordinate
+from classes.Player import Player
+from classes.Ship import Ship
+from classes.SunkShip import SunkShip
+
+
+class ShotEvent:
+    """
+    This class is used to store the outcome of a single shot fired through the game engine.
+    """
+
+    def __init__(
+        self,
+        player: Player,
+        opponent: Player,
+        guess: list[int],
+        ship: Ship,
+        sunkShip: SunkShip,
+        won: bool,
+    ):
+        self.player = player
+        self.opponent = opponent
+        self.guess = guess
+        self.ship = ship
+        self.hit = ship is not None
+        self.sunkShip = sunkShip
+        self.won = won
+
+    @property
+    def cell(self) -> Coordinate:
+        """
+        This property returns the Coordinate class of the shot cell on the opponent's board.
+        """
+        return self.opponent.board.getCellData(self.guess[0], self.guess[1])
+
+    def isSunk(self) -> bool:
+        """
+        This function returns whether or not the shot sunk a ship.
+        """
+        return self.sunkShip is not None
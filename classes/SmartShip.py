@@ -24,3 +24,21 @@ class SmartShip:
             raise Exception(
                 "Error determining smart ship rotation, classes.SmartShip.SmartShip."
             )
+
+    def record(self, hit: bool, sunk: bool, cell) -> None:
+        """
+        This function updates the tracked points using the outcome of the computer's last shot.
+        """
+        # If the ship is sunk, forget about it and go back to random guessing.
+        if sunk:
+            self.origin = None
+            self.current = None
+        # If the ship was hit, set the origin to the hit or the current to the hit if there is already an origin.
+        elif hit:
+            if self.origin:
+                self.current = cell
+            else:
+                self.origin = cell
+        # If the shot missed, reset the current position.
+        elif self.origin:
+            self.current = None
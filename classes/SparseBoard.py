@@ -0,0 +1,233 @@
+from classes.Board import Board
+from classes.Coordinate import Coordinate
+from classes.Geometry import Geometry, getGeometry
+from classes.PlacementOracle import PlacementOracle, getPlacementOracle
+from classes.Ship import Ship
+
+
+class SparseRows:
+    """
+    This class is used as the rows of a sparse board. Rows are built when they are asked for and are not kept, so a large board never holds a Coordinate for every cell.
+    """
+
+    def __init__(self, board: "SparseBoard"):
+        self.board = board
+
+    def __len__(self) -> int:
+        return self.board.height
+
+    def __getitem__(self, y: int) -> list[Coordinate]:
+        if y < 0 or y >= self.board.height:
+            raise IndexError("Row out of range. See classes.SparseBoard.SparseRows")
+
+        return [self.board.getCellData(x, y) for x in range(self.board.width)]
+
+    def __iter__(self):
+        for y in range(self.board.height):
+            yield self[y]
+
+
+class SparseBoard(Board):
+    """
+    This class stores a large board. Instead of masks with one bit per cell, only the cells that hold a ship or were shot are stored (in dictionaries and sets), so every shot and sink check costs the same no matter how big the board is.
+    """
+
+    sparse = True
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.cellShips = {}
+        self.shipCells = {}
+        self.shipHealth = {}
+        self.hits = set()
+        self.misses = set()
+        self.remaining = 0
+        self.shipLocations = {}
+        self.sunkShips = []
+        self.tempBoard = None
+        self.geometry: Geometry = getGeometry(width, height)
+        self.oracle: PlacementOracle = getPlacementOracle(width, height)
+
+        # The masks built from the cells, by name ("ship", "hit" or "miss", and "ships" for the masks of each ship). A mask is dropped when its cells change, and built again the next time it is asked for.
+        self.masks: dict[str, int] = {}
+
+    @property
+    def rows(self) -> SparseRows:
+        """
+        This property returns a view of the rows which builds each row when it is used.
+        """
+        return SparseRows(self)
+
+    def getCellData(self, x: int, y: int) -> Coordinate:
+        """
+        This function returns the data for a specific cell. The Coordinate class is built for the call, so changing it doesn't change the board.
+        """
+        index: int = self.getIndex(x, y)
+
+        cell: Coordinate = Coordinate(self.geometry.letters[x], y, self.geometry)
+
+        if index in self.cellShips:
+            cell.setShip(self.cellShips[index])
+            cell.shipHit = index in self.hits
+
+        return cell
+
+    @property
+    def shipMask(self) -> int:
+        """
+        This property returns the occupancy mask. It is only meant for code that needs masks, like rendering, and is kept until a ship is placed so that reading it once per cell doesn't rebuild it every time.
+        """
+        return self.getCachedMask("ship", self.cellShips)
+
+    @property
+    def hitMask(self) -> int:
+        return self.getCachedMask("hit", self.hits)
+
+    @property
+    def missMask(self) -> int:
+        return self.getCachedMask("miss", self.misses)
+
+    @property
+    def shipMasks(self) -> dict:
+        """
+        This property returns the mask of each ship, by name. Like the other masks, it is kept until a ship is placed.
+        """
+        shipMasks: dict = self.masks.get("ships")
+
+        if shipMasks is None:
+            shipMasks = self.masks["ships"] = {
+                name: self.getCellsMask(cells) for name, cells in self.shipCells.items()
+            }
+
+        return shipMasks
+
+    def getCachedMask(self, name: str, cells) -> int:
+        """
+        This function returns a mask from the cache, building it from its cells if they changed since it was last built.
+        """
+        mask: int = self.masks.get(name)
+
+        if mask is None:
+            mask = self.masks[name] = self.getCellsMask(cells)
+
+        return mask
+
+    def getCellsMask(self, cells) -> int:
+        """
+        This function builds a mask from a collection of cell indices.
+        """
+        mask: int = 0
+
+        for index in cells:
+            mask |= 1 << index
+
+        return mask
+
+    def getCells(
+        self, startCoordinates: list[int], endCoordinates: list[int]
+    ) -> list[int]:
+        """
+        This function returns the indices of all of the cells from the start to the end coordinates.
+        """
+        return list(self.geometry.getSpanBetween(startCoordinates, endCoordinates))
+
+    def setShip(
+        self, startCoordinates: list[int], endCoordinates: list[int], shipData: Ship
+    ) -> None:
+        """
+        This function sets a ship from start to end coordinates on the actual board. It also adds a start to end coordinate to the shipLocations dictionary.
+        """
+        cells: list[int] = self.getCells(startCoordinates, endCoordinates)
+
+        for index in cells:
+            self.cellShips[index] = shipData
+
+        self.shipCells[shipData.name] = cells
+        self.masks.pop("ship", None)
+        self.masks.pop("ships", None)
+        self.shipHealth[shipData.name] = len(cells)
+        self.remaining += len(cells)
+
+        self.shipLocations[shipData.name] = dict(
+            startCoordinates=startCoordinates, endCoordinates=endCoordinates
+        )
+
+        self.tempBoard = None
+
+    def fits(self, startCoordinates: list[int], endCoordinates: list[int]) -> bool:
+        """
+        This function checks if a ship can be placed from the start to the end coordinates without overlapping another ship. Only the ship's own cells are looked up, however many ships are on the board.
+        """
+        return not any(
+            index in self.cellShips
+            for index in self.getCells(startCoordinates, endCoordinates)
+        )
+
+    def collides(self, startCoordinates: list[int], endCoordinates: list[int]) -> bool:
+        """
+        This function checks if a coordinate range will collide with a ship. It returns a list of collisions if found.
+        """
+        return [
+            (
+                self.geometry.letters[index % self.width],
+                index // self.width + 1,
+            )
+            for index in self.getCells(startCoordinates, endCoordinates)
+            if index in self.cellShips
+        ]
+
+    def fire(self, x: int, y: int) -> tuple[Ship, bool]:
+        """
+        This function resolves a shot at a cell.
+
+        Returns:
+        tuple[Ship, bool]: The ship that was hit (or None for a miss) and whether the shot sunk it.
+        """
+        index: int = self.getIndex(x, y)
+
+        ship: Ship = self.cellShips.get(index)
+
+        # If there is no ship on the cell, record the miss.
+        if not ship:
+            self.misses.add(index)
+            self.masks.pop("miss", None)
+
+            return None, False
+
+        # Record the hit and damage the ship.
+        self.hits.add(index)
+        self.masks.pop("hit", None)
+        ship.health -= 1
+
+        self.shipHealth[ship.name] -= 1
+        self.remaining -= 1
+
+        return ship, self.isSunk(ship.name)
+
+    def markShot(self, x: int, y: int, hit: bool) -> None:
+        """
+        This function records a shot that was resolved somewhere else (like on the match server) on a board that doesn't know where the ships are.
+        """
+        (self.hits if hit else self.misses).add(self.getIndex(x, y))
+        self.masks.pop("hit" if hit else "miss", None)
+
+    def isShot(self, x: int, y: int) -> bool:
+        """
+        This function determines if a cell has already been shot at.
+        """
+        index: int = self.getIndex(x, y)
+
+        return index in self.hits or index in self.misses
+
+    def isSunk(self, name: str) -> bool:
+        """
+        This function determines if every cell of a ship has been hit.
+        """
+        return self.shipHealth[name] == 0
+
+    def allSunk(self) -> bool:
+        """
+        This function determines if every ship on the board has been sunk.
+        """
+        return bool(self.cellShips) and self.remaining == 0
@@ -0,0 +1,103 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from copy import copy
+from typing import Callable
+
+from classes.Coordinate import Coordinate
+from classes.Player import Player
+from classes.SmartShip import SmartShip
+
+from functions.metrics import METRICS
+
+
+class Speculation:
+    """
+    This class is used to work out the computer's next move in the background while the human is picking theirs. The human's shot only changes the computer's own board, so the move is nearly always still right once it is the computer's turn; if anything it depends on has changed, it is thrown away and worked out again.
+    """
+
+    def __init__(self, targeting: Callable[[Player, Player, SmartShip], Coordinate]):
+        self.targeting = targeting
+
+        # A single thread is enough, since only the next move is ever worked out. Waiting for input releases the interpreter, so the thread gets the processor while the human thinks.
+        self.executor = ThreadPoolExecutor(max_workers=1)
+
+        self.future: Future = None
+        self.key: tuple = None
+
+    @staticmethod
+    def getKey(player: Player, opponent: Player, smartShip: SmartShip) -> tuple:
+        """
+        This function returns everything the computer's move depends on: its guesses, what it knows about the opponent's board and the state of its smart ship.
+        """
+        return (
+            player.totalShots,
+            opponent.board.missMask,
+            opponent.board.hitMask,
+            len(opponent.board.sunkShips),
+            smartShip.origin,
+            smartShip.current,
+        )
+
+    def start(self, player: Player, opponent: Player, smartShip: SmartShip) -> None:
+        """
+        This function starts working out the computer's next move in the background.
+
+        Params:
+        player: The computer.
+        opponent: The human, whose board the computer shoots at.
+        smartShip: The computer's smart ship. The background move works on a copy of it, so the real one only changes if the move is used.
+        """
+        self.cancel()
+
+        self.key = self.getKey(player, opponent, smartShip)
+        self.future = self.executor.submit(self.run, player, opponent, copy(smartShip))
+
+    def run(
+        self, player: Player, opponent: Player, smartShip: SmartShip
+    ) -> tuple[Coordinate, SmartShip]:
+        """
+        This function works out the move on the background thread.
+        """
+        with METRICS.timer("ai_move_background"):
+            return self.targeting(player, opponent, smartShip), smartShip
+
+    def take(
+        self, player: Player, opponent: Player, smartShip: SmartShip
+    ) -> Coordinate:
+        """
+        This function returns the computer's move. The move worked out in the background is used if nothing it depends on has changed since it was started (waiting for it if it isn't done yet); otherwise the move is worked out now.
+        """
+        future: Future = self.future
+        self.future = None
+
+        if future and self.key == self.getKey(player, opponent, smartShip):
+            guess, speculated = future.result()
+
+            # Keep what the smart ship learned while working out the move.
+            smartShip.origin = speculated.origin
+            smartShip.current = speculated.current
+
+            METRICS.increment("speculation", outcome="used")
+
+            return guess
+
+        if future:
+            future.cancel()
+
+            METRICS.increment("speculation", outcome="discarded")
+
+        return self.targeting(player, opponent, smartShip)
+
+    def cancel(self) -> None:
+        """
+        This function throws away the move being worked out, if any.
+        """
+        if self.future:
+            self.future.cancel()
+            self.future = None
+
+    def close(self) -> None:
+        """
+        This function stops the background thread.
+        """
+        self.cancel()
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,81 @@
+import random
+from functools import lru_cache
+
+from classes.Geometry import getGeometry
+
+from functions.masks import getBits
+
+# The states a shot cell can be in: a miss, a hit on a ship that is still afloat, or a cell of a sunk ship.
+STATES = ("miss", "hit", "sunk")
+
+# The seed of the random keys, so the hash of a state is the same in every run.
+ZOBRIST_SEED = 0x5EED
+
+
+@lru_cache(maxsize=None)
+def getZobristKeys(width: int, height: int) -> tuple[tuple[tuple[int, ...], ...], ...]:
+    """
+    This function returns the Zobrist keys of a board size: a random 64 bit number for every state of every cell, seen through every symmetry of the board. They are only built once per size.
+
+    Returns:
+    tuple: The keys, by symmetry, then state (see STATES), then cell. The key of a cell under a symmetry is the key of the cell it is moved to, so a board and its mirror image hash the same under opposite symmetries.
+    """
+    generator: random.Random = random.Random(ZOBRIST_SEED)
+
+    keys: list[list[int]] = [
+        [generator.getrandbits(64) for _ in range(width * height)] for _ in STATES
+    ]
+
+    return tuple(
+        tuple(
+            tuple(stateKeys[cell] for cell in symmetry.tolist()) for stateKeys in keys
+        )
+        for symmetry in getGeometry(width, height).getSymmetries()
+    )
+
+
+class StateHash:
+    """
+    This class is used to store the hash of the shots on a board under every one of its symmetries. The hashes are XORs of Zobrist keys, so they are kept up to date by flipping the keys of the cells that changed since the last update, instead of hashing the whole board after every shot.
+
+    The smallest of the hashes is the same for every rotation and reflection of a board, so it can be used to look up anything that only depends on the shots.
+    """
+
+    def __init__(self, width: int, height: int):
+        self.keys = getZobristKeys(width, height)
+
+        # Where each symmetry moves every cell. See classes.Geometry.Geometry.getSymmetries.
+        self.symmetries = getGeometry(width, height).getSymmetries()
+
+        # The hash under each symmetry, and the cells in each state (see STATES) that the hashes are up to date with.
+        self.hashes: list[int] = [0] * len(self.keys)
+        self.masks: list[int] = [0] * len(STATES)
+
+    def update(self, missMask: int, hitMask: int, sunkMask: int) -> None:
+        """
+        This function brings the hashes up to date with the shots on the board. Only the cells that changed state are hashed, which is one or two after a shot and the cells of the ship after a sink.
+
+        Params:
+        missMask: The cells that were shot and missed.
+        hitMask: The cells that were shot and hit, including the ones of sunk ships.
+        sunkMask: The cells of the ships that have been sunk.
+        """
+        for state, mask in enumerate((missMask, hitMask & ~sunkMask, sunkMask)):
+            changed: int = mask ^ self.masks[state]
+
+            if not changed:
+                continue
+
+            self.masks[state] = mask
+
+            for cell in getBits(changed):
+                for symmetry, keys in enumerate(self.keys):
+                    self.hashes[symmetry] ^= keys[state][cell]
+
+    def getCanonical(self) -> tuple[int, int]:
+        """
+        This function returns the canonical hash of the board: the smallest of its hashes, and the symmetry that gives it.
+        """
+        canonical: int = min(self.hashes)
+
+        return canonical, self.hashes.index(canonical)
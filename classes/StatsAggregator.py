@@ -0,0 +1,88 @@
+from classes.GameDetails import GameDetails
+from classes.RunningStat import RunningStat
+
+# The resolution of the hit ratio sketch. Quantiles of the hit ratio are within this of the real ones.
+HIT_RATIO_RESOLUTION = 0.001
+
+
+class StatsAggregator:
+    """
+    This class is used to store running stats of any number of games, by player number, without keeping the games: the shots each player needed to win, their hit ratio (hits per shot) and the moves they needed to sink each ship. Each game is folded in as it finishes, and aggregates from different processes can be merged.
+    """
+
+    def __init__(self):
+        self.games: int = 0
+        self.wins: dict[int, int] = {1: 0, 2: 0}
+
+        self.shotsToWin: dict[int, RunningStat] = {1: RunningStat(), 2: RunningStat()}
+        self.hitRatio: dict[int, RunningStat] = {
+            1: RunningStat(HIT_RATIO_RESOLUTION),
+            2: RunningStat(HIT_RATIO_RESOLUTION),
+        }
+
+        # The moves to sink each ship, by the player who sunk it, then the name of the ship.
+        self.movesToSink: dict[int, dict[str, RunningStat]] = {1: {}, 2: {}}
+
+    def addGame(self, gameStats: GameDetails) -> None:
+        """
+        This function folds the stats of a finished game into the running stats.
+        """
+        winner: int = gameStats.winner.getRaw()
+
+        self.games += 1
+        self.wins[winner] += 1
+        self.shotsToWin[winner].add(gameStats.winner.totalShots)
+
+        for player in gameStats.players:
+            raw: int = player.getRaw()
+
+            if player.totalShots:
+                self.hitRatio[raw].add(player.hits / player.totalShots)
+
+            # The ships a player sunk are stored on the opponent's board.
+            opponent = gameStats.players[0 if raw == 2 else 1]
+
+            for ship in opponent.board.sunkShips:
+                self.getMovesToSink(raw, ship.name).add(ship.movesToSink)
+
+    def getMovesToSink(self, player: int, name: str) -> RunningStat:
+        """
+        This function returns the running stat of the moves a player needed to sink a ship, creating it if the ship hasn't been sunk yet.
+        """
+        stat: RunningStat = self.movesToSink[player].get(name)
+
+        if stat is None:
+            stat = self.movesToSink[player][name] = RunningStat()
+
+        return stat
+
+    def merge(self, other: "StatsAggregator") -> None:
+        """
+        This function adds the running stats of another aggregator (usually from another process) to this one.
+        """
+        self.games += other.games
+
+        for player in (1, 2):
+            self.wins[player] += other.wins[player]
+            self.shotsToWin[player].merge(other.shotsToWin[player])
+            self.hitRatio[player].merge(other.hitRatio[player])
+
+            for name, stat in other.movesToSink[player].items():
+                self.getMovesToSink(player, name).merge(stat)
+
+    def toDict(self) -> dict:
+        """
+        This function returns the running stats as plain data, by player number.
+        """
+        return {
+            player: dict(
+                wins=self.wins[player],
+                shotsToWin=self.shotsToWin[player].toDict(),
+                hitRatio=self.hitRatio[player].toDict(),
+                movesToSink={
+                    name: stat.toDict()
+                    for name, stat in self.movesToSink[player].items()
+                },
+            )
+            for player in (1, 2)
+        }
@@ -0,0 +1,300 @@
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+from classes.GameDetails import GameDetails
+
+from functions.metrics import METRICS
+
+# If this environment variable is set, the terminal game keeps its history in the database it names instead of STATS_PATH.
+STATS_ENV = "BATTLESHIP_STATS"
+
+# The database the terminal game keeps its history in by default.
+STATS_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "stats.db"
+)
+
+# The most games written in one transaction, and how long (in seconds) the writer waits for more games before writing the ones it has.
+STATS_BATCH = 1000
+STATS_INTERVAL = 0.05
+
+# The tables of the database. Every game has a row in games, a row per player in players and a row per sunk ship in sunkShips.
+# players.targeting and players.placement are the strategies of a computer player, or "human".
+# sunkShips.player is the player who sunk the ship.
+# The indices cover the common queries without reading the tables: win rates by strategy, the shots each strategy needed to win, and the moves to sink each ship.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    playedAt REAL NOT NULL,
+    mode TEXT NOT NULL,
+    width INTEGER NOT NULL,
+    height INTEGER NOT NULL,
+    winner INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS players (
+    gameId INTEGER NOT NULL REFERENCES games (id),
+    player INTEGER NOT NULL,
+    targeting TEXT NOT NULL,
+    placement TEXT NOT NULL,
+    won INTEGER NOT NULL,
+    hits INTEGER NOT NULL,
+    misses INTEGER NOT NULL,
+    totalShots INTEGER NOT NULL,
+    PRIMARY KEY (gameId, player)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS sunkShips (
+    gameId INTEGER NOT NULL REFERENCES games (id),
+    player INTEGER NOT NULL,
+    ship TEXT NOT NULL,
+    movesToSink INTEGER NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS playersByTargeting ON players (targeting, won, totalShots);
+CREATE INDEX IF NOT EXISTS sunkShipsByShip ON sunkShips (ship, movesToSink);
+CREATE INDEX IF NOT EXISTS sunkShipsByGame ON sunkShips (gameId);
+"""
+
+
+class StatsStore:
+    """
+    This class is used to store the results of finished games in a SQLite database, so that they outlive the session. Games are handed to a background thread, which writes them in batches, so adding a game never waits for the disk.
+
+    Several processes can write to the same database; each batch waits for the others to finish theirs.
+
+    Params:
+    path: The database file. It is created if it doesn't exist.
+    batchSize: The most games written in one transaction.
+    interval: How long the writer waits for more games before writing the ones it has.
+    """
+
+    def __init__(
+        self,
+        path: str = STATS_PATH,
+        batchSize: int = STATS_BATCH,
+        interval: float = STATS_INTERVAL,
+    ):
+        self.path = path
+        self.batchSize = batchSize
+        self.interval = interval
+
+        # The games waiting to be written. None tells the writer to stop.
+        self.queue: queue.Queue = queue.Queue()
+
+        # The last error of the writer, raised by flush and close.
+        self.error: Exception = None
+
+        # Create the tables here, so a database that can't be opened fails straight away instead of on the writer thread.
+        connection: sqlite3.Connection = self.connect()
+
+        with connection:
+            connection.executescript(SCHEMA)
+
+        connection.close()
+
+        self.thread = threading.Thread(
+            target=self.write, name="StatsStore", daemon=True
+        )
+        self.thread.start()
+
+    def connect(self) -> sqlite3.Connection:
+        """
+        This function opens a connection to the database. Connections can't be shared between threads, so the writer and the queries each open their own.
+        """
+        connection: sqlite3.Connection = sqlite3.connect(self.path, timeout=30)
+
+        # Write-ahead logging lets the queries read while a batch is being written.
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.execute("PRAGMA synchronous = NORMAL")
+
+        return connection
+
+    def addGame(
+        self,
+        details: GameDetails,
+        targeting: tuple = ("human", "human"),
+        placement: tuple = ("human", "human"),
+        mode: str = None,
+    ) -> None:
+        """
+        This function queues a finished game to be written. Only the numbers are taken from the game, so the players and boards aren't kept alive until it is written.
+
+        Params:
+        details: The finished game.
+        targeting: The targeting strategies of player 1 and player 2, or "human".
+        placement: The placement strategies of player 1 and player 2, or "human".
+        mode: The kind of game. Defaults to pvp or pve.
+        """
+        winner: int = details.winner.getRaw()
+        board = details.players[0].board
+
+        game: tuple = (
+            time.time(),
+            mode or ("pvp" if details.isPVP else "pve"),
+            board.width,
+            board.height,
+            winner,
+        )
+
+        players: list[tuple] = [
+            (
+                player.getRaw(),
+                targeting[index],
+                placement[index],
+                int(player.getRaw() == winner),
+                player.hits,
+                player.misses,
+                player.totalShots,
+            )
+            for index, player in enumerate(details.players)
+        ]
+
+        # The ships a player sunk are stored on the opponent's board.
+        sunkShips: list[tuple] = [
+            (player.getRaw(), ship.name, ship.movesToSink)
+            for player, opponent in zip(details.players, details.players[::-1])
+            for ship in opponent.board.sunkShips
+        ]
+
+        self.queue.put((game, players, sunkShips))
+
+    def write(self) -> None:
+        """
+        This function runs on the writer thread. It waits for games, collects as many as arrive within the interval (up to the batch size), and writes them in one transaction.
+        """
+        connection: sqlite3.Connection = self.connect()
+
+        try:
+            while True:
+                games: list[tuple] = [self.queue.get()]
+                deadline: float = time.monotonic() + self.interval
+
+                while games[-1] is not None and len(games) < self.batchSize:
+                    try:
+                        games.append(
+                            self.queue.get(
+                                timeout=max(0.0, deadline - time.monotonic())
+                            )
+                        )
+                    except queue.Empty:
+                        break
+
+                stopping: bool = games[-1] is None
+                batch: list[tuple] = [game for game in games if game is not None]
+
+                try:
+                    if batch:
+                        self.insert(connection, batch)
+
+                        METRICS.increment("stats_games_written", len(batch))
+                except sqlite3.Error as error:
+                    self.error = error
+
+                    METRICS.increment("stats_write_errors")
+                finally:
+                    for _ in games:
+                        self.queue.task_done()
+
+                if stopping:
+                    return
+        finally:
+            connection.close()
+
+    def insert(self, connection: sqlite3.Connection, batch: list[tuple]) -> None:
+        """
+        This function writes a batch of games in one transaction.
+        """
+        with connection:
+            # Take the write lock for the whole batch, so the ids of the games stay in order.
+            connection.execute("BEGIN IMMEDIATE")
+
+            for game, players, sunkShips in batch:
+                gameId: int = connection.execute(
+                    "INSERT INTO games (playedAt, mode, width, height, winner) VALUES (?, ?, ?, ?, ?)",
+                    game,
+                ).lastrowid
+
+                connection.executemany(
+                    "INSERT INTO players VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    [(gameId, *player) for player in players],
+                )
+                connection.executemany(
+                    "INSERT INTO sunkShips VALUES (?, ?, ?, ?)",
+                    [(gameId, *ship) for ship in sunkShips],
+                )
+
+    def flush(self) -> None:
+        """
+        This function waits until every queued game has been written. It raises the writer's error if a batch couldn't be written.
+        """
+        self.queue.join()
+
+        if self.error:
+            error, self.error = self.error, None
+
+            raise Exception(
+                f"Error writing games to {self.path}: {error}. See classes.StatsStore.StatsStore.write"
+            )
+
+    def close(self) -> None:
+        """
+        This function writes the queued games and stops the writer.
+        """
+        if self.thread.is_alive():
+            self.queue.put(None)
+            self.thread.join()
+
+        self.flush()
+
+    def query(self, sql: str, parameters: tuple = ()) -> list[tuple]:
+        """
+        This function runs a query on a connection of its own, after the queued games have been written.
+        """
+        self.flush()
+
+        connection: sqlite3.Connection = self.connect()
+
+        try:
+            return connection.execute(sql, parameters).fetchall()
+        finally:
+            connection.close()
+
+    def getWinRates(self) -> dict[str, tuple[int, int, float]]:
+        """
+        This function returns how every targeting strategy (and "human") has done.
+
+        Returns:
+        dict: The games played, games won and share of games won, by targeting strategy.
+        """
+        return {
+            targeting: (games, wins, wins / games)
+            for targeting, games, wins in self.query(
+                "SELECT targeting, COUNT(*), SUM(won) FROM players GROUP BY targeting"
+            )
+        }
+
+    def getShotsToWin(self, targeting: str = None) -> dict[int, int]:
+        """
+        This function returns the distribution of the shots needed to win: how many games were won in each amount of shots, by one targeting strategy or by all of them.
+        """
+        condition: str = "won = 1" + (" AND targeting = ?" if targeting else "")
+
+        return dict(
+            self.query(
+                f"SELECT totalShots, COUNT(*) FROM players WHERE {condition} GROUP BY totalShots ORDER BY totalShots",
+                (targeting,) if targeting else (),
+            )
+        )
+
+    def getMeanMovesToSink(self) -> dict[str, float]:
+        """
+        This function returns the average amount of moves it took to sink each ship, over every game.
+        """
+        return dict(
+            self.query(
+                "SELECT ship, AVG(movesToSink) FROM sunkShips GROUP BY ship ORDER BY ship"
+            )
+        )
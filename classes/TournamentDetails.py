@@ -0,0 +1,122 @@
+from classes.GameDetails import GameDetails
+from classes.Heatmap import HEATMAP_MAX_CELLS, Heatmap
+from classes.StatsAggregator import StatsAggregator
+
+
+class TournamentDetails:
+    """
+    This class stores the combined stats of many computer games. Unlike GameDetails, no players are kept; only running totals per player number, so results from different processes can be merged.
+    """
+
+    def __init__(self, targeting: list[str], placement: list[str]):
+        self.targeting = list(targeting)
+        self.placement = list(placement)
+        self.games = 0
+        self.wins = {1: 0, 2: 0}
+        self.shotsToWin = {1: 0, 2: 0}
+        self.movesToSink = {1: {}, 2: {}}
+
+        # The spread of the same stats (variances and quantiles), kept in constant memory.
+        self.aggregate = StatsAggregator()
+
+        # Where each player shot, hit and put its ships, by player number. They are created with the first game, which gives the size of the board.
+        self.heatmaps: dict[int, Heatmap] = {}
+
+    def addGame(self, gameStats: GameDetails) -> None:
+        """
+        This function folds the stats of a finished game into the totals.
+        """
+        winner: int = gameStats.winner.getRaw()
+
+        self.games += 1
+        self.wins[winner] += 1
+        self.shotsToWin[winner] += gameStats.winner.totalShots
+
+        # The ships a player sunk are stored on the opponent's board.
+        for player in gameStats.players:
+            opponent = gameStats.players[0 if player.getRaw() == 2 else 1]
+
+            for ship in opponent.board.sunkShips:
+                total = self.movesToSink[player.getRaw()].setdefault(ship.name, [0, 0])
+                total[0] += ship.movesToSink
+                total[1] += 1
+
+        self.aggregate.addGame(gameStats)
+
+        board = gameStats.players[0].board
+
+        if board.width * board.height <= HEATMAP_MAX_CELLS:
+            for player, opponent in zip(gameStats.players, gameStats.players[::-1]):
+                self.getHeatmap(player.getRaw(), board.width, board.height).addGame(
+                    player.guessedMask, opponent.board.hitMask, player.board.shipMask
+                )
+
+    def getHeatmap(self, player: int, width: int, height: int) -> Heatmap:
+        """
+        This function returns the heatmap of a player, creating it if the player has none yet.
+        """
+        heatmap: Heatmap = self.heatmaps.get(player)
+
+        if heatmap is None:
+            heatmap = self.heatmaps[player] = Heatmap(width, height)
+
+        return heatmap
+
+    def getTypeHeatmaps(self) -> dict[str, Heatmap]:
+        """
+        This function returns the heatmaps by player type, named "targeting-placement". If both players are the same type, their heatmaps are combined.
+        """
+        heatmaps: dict[str, Heatmap] = {}
+
+        for player, heatmap in sorted(self.heatmaps.items()):
+            name: str = f"{self.targeting[player - 1]}-{self.placement[player - 1]}"
+
+            if name not in heatmaps:
+                heatmaps[name] = Heatmap(heatmap.width, heatmap.height)
+
+            heatmaps[name].merge(heatmap)
+
+        return heatmaps
+
+    def merge(self, other: "TournamentDetails") -> None:
+        """
+        This function adds the totals of another tournament (usually from another process) to this one.
+        """
+        self.games += other.games
+
+        for player in (1, 2):
+            self.wins[player] += other.wins[player]
+            self.shotsToWin[player] += other.shotsToWin[player]
+
+            for name, (moves, count) in other.movesToSink[player].items():
+                total = self.movesToSink[player].setdefault(name, [0, 0])
+                total[0] += moves
+                total[1] += count
+
+        self.aggregate.merge(other.aggregate)
+
+        for player, heatmap in other.heatmaps.items():
+            self.getHeatmap(player, heatmap.width, heatmap.height).merge(heatmap)
+
+    def getWinRate(self, player: int) -> float:
+        """
+        This function returns the share of games won by the player.
+        """
+        return self.wins[player] / self.games if self.games else 0.0
+
+    def getMeanShotsToWin(self, player: int) -> float:
+        """
+        This function returns the average amount of shots the player needed in the games it won.
+        """
+        return (
+            self.shotsToWin[player] / self.wins[player] if self.wins[player] else None
+        )
+
+    def getMeanMovesToSink(self, player: int) -> dict:
+        """
+        This function returns the average amount of moves the player needed to sink each of the opponent's ships.
+        """
+        return {
+            name: moves / count
+            for name, (moves, count) in self.movesToSink[player].items()
+        }
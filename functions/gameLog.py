@@ -0,0 +1,147 @@
+import struct
+
+from classes.Board import Board
+from classes.GameSettings import GameSettings
+from classes.Ship import Ship
+
+# The game log format. A log file starts with a header, followed by one record per game:
+#
+# Header: MAGIC, version (1 byte), width (1 byte), height (1 byte), ship count (1 byte), then for each ship its length (1 byte) and its name and colour (each 1 byte of length, then UTF-8).
+# Record: seed (8 bytes, little endian), starting player (1 byte), the fleet of player 1 then player 2 (2 bytes per ship: start cell, then 1 if vertical), one byte per move (the cell index), then END.
+#
+# Turns always alternate, so the player of each move comes from the starting player and the move's position.
+MAGIC = b"BSLOG"
+VERSION = 1
+
+# Marks the end of a game's moves. Cell indices have to stay below it, so boards can have at most 255 cells.
+END = 0xFF
+
+SEED = struct.Struct("<Q")
+
+
+def encodeText(text: str) -> bytes:
+    """
+    This function encodes a ship's name or colour with its length in front.
+    """
+    data: bytes = text.encode("utf-8")
+
+    if len(data) > 255:
+        raise ValueError(f"{text} is too long to log. See functions.gameLog.encodeText")
+
+    return bytes([len(data)]) + data
+
+
+def decodeText(data, offset: int) -> tuple[str, int]:
+    """
+    This function decodes a ship's name or colour.
+
+    Returns:
+    tuple[str, int]: The text and the offset after it.
+    """
+    length: int = data[offset]
+
+    return (
+        bytes(data[offset + 1 : offset + 1 + length]).decode("utf-8"),
+        offset + 1 + length,
+    )
+
+
+def encodeHeader(settings: GameSettings) -> bytes:
+    """
+    This function encodes the header of a game log, which holds the board size and fleet of every game in it.
+    """
+    if settings.width * settings.height > END:
+        raise ValueError(
+            f"Game logs store a byte per cell, so they only support boards with up to {END} cells. See functions.gameLog.encodeHeader"
+        )
+
+    if len(settings.ships) > 255:
+        raise ValueError(
+            "Game logs support up to 255 ships. See functions.gameLog.encodeHeader"
+        )
+
+    header: bytearray = bytearray(MAGIC)
+    header += bytes([VERSION, settings.width, settings.height, len(settings.ships)])
+
+    for ship in settings.ships.values():
+        header += bytes([ship.length]) + encodeText(ship.name) + encodeText(ship.colour)
+
+    return bytes(header)
+
+
+def decodeHeader(data) -> tuple[GameSettings, int]:
+    """
+    This function decodes the header of a game log.
+
+    Returns:
+    tuple[GameSettings, int]: The settings of the games in the log and the offset of the first record.
+    """
+    if bytes(data[: len(MAGIC)]) != MAGIC:
+        raise ValueError("This is not a game log. See functions.gameLog.decodeHeader")
+
+    offset: int = len(MAGIC)
+    version, width, height, count = data[offset : offset + 4]
+    offset += 4
+
+    if version != VERSION:
+        raise ValueError(
+            f"Game log version {version} is not supported. See functions.gameLog.decodeHeader"
+        )
+
+    ships: dict = {}
+
+    for number in range(count):
+        length: int = data[offset]
+
+        name, offset = decodeText(data, offset + 1)
+        colour, offset = decodeText(data, offset)
+
+        ships[f"ship{number}"] = Ship(length, colour, name)
+
+    return GameSettings(ships, width, height), offset
+
+
+def getRecordSize(settings: GameSettings) -> int:
+    """
+    This function returns the size of the fixed part of a record: the seed, the starting player and both fleets.
+    """
+    return SEED.size + 1 + 2 * 2 * len(settings.ships)
+
+
+def encodeFleet(board: Board, settings: GameSettings) -> bytes:
+    """
+    This function encodes where each ship of the fleet was placed on a board, in the order of the fleet.
+    """
+    fleet: bytearray = bytearray()
+
+    for ship in settings.ships.values():
+        location: dict = board.shipLocations[ship.name]
+
+        # Store the top left end of the ship, so its direction is all that's needed to find the rest.
+        x, y = min(location["startCoordinates"], location["endCoordinates"])
+        vertical: bool = (
+            location["startCoordinates"][0] == location["endCoordinates"][0]
+            and ship.length > 1
+        )
+
+        fleet += bytes([y * settings.width + x, vertical])
+
+    return bytes(fleet)
+
+
+def decodeFleet(data, settings: GameSettings) -> list[tuple[list[int], list[int]]]:
+    """
+    This function decodes a fleet into the start and end coordinates of each ship, in the order of the fleet.
+    """
+    fleet: list[tuple[list[int], list[int]]] = []
+
+    for ship, offset in zip(settings.ships.values(), range(0, len(data), 2)):
+        x, y = data[offset] % settings.width, data[offset] // settings.width
+
+        # The end of the ship is further down if it is vertical, or further right if not.
+        if data[offset + 1]:
+            fleet.append(([x, y], [x, y + ship.length - 1]))
+        else:
+            fleet.append(([x, y], [x + ship.length - 1, y]))
+
+    return fleet
@@ -0,0 +1,45 @@
+from typing import Iterator
+
+import numpy as np
+
+
+def maskToArray(mask: int, width: int, height: int) -> np.ndarray:
+    """
+    This function converts a board bitmask into a boolean array of shape (height, width).
+    """
+    # Convert the integer into little endian bytes, then unpack the bytes into bits so that bit i lands on cell i.
+    raw = np.frombuffer(mask.to_bytes((width * height + 7) // 8, "little"), np.uint8)
+
+    return (
+        np.unpackbits(raw, bitorder="little")[: width * height]
+        .reshape(height, width)
+        .astype(bool)
+    )
+
+
+def arrayToMask(array: np.ndarray) -> int:
+    """
+    This function converts a boolean array back into a board bitmask. It is the opposite of maskToArray.
+    """
+    return int.from_bytes(
+        np.packbits(array.astype(bool).ravel(), bitorder="little").tobytes(), "little"
+    )
+
+
+def countBits(mask: int) -> int:
+    """
+    This function returns the number of set cells in a bitmask.
+    """
+    return bin(mask).count("1")
+
+
+def getBits(mask: int) -> Iterator[int]:
+    """
+    This function yields the index of every set cell in a bitmask, from the lowest to the highest.
+    """
+    while mask:
+        lowest: int = mask & -mask
+
+        yield lowest.bit_length() - 1
+
+        mask ^= lowest
@@ -0,0 +1,38 @@
+import os
+
+from classes.Metrics import Metrics
+
+# The metrics of the whole process. Every part of the game records into this one, so a session can be exported in one go.
+METRICS = Metrics()
+
+# If this environment variable is set, the terminal game and the match server write their metrics to the file it names at the end of every game.
+METRICS_ENV = "BATTLESHIP_METRICS"
+
+
+def exportMetrics(path: str, metrics: Metrics = METRICS) -> None:
+    """
+    This function writes the metrics to a file. Files ending in .prom or .txt get the Prometheus text format, and any other file gets JSON.
+    """
+    text: str = (
+        metrics.toPrometheus()
+        if os.path.splitext(path)[1] in (".prom", ".txt")
+        else metrics.toJSON() + "\n"
+    )
+
+    # Write to a temporary file first, so a scraper never reads half of the file.
+    temporary: str = f"{path}.tmp"
+
+    with open(temporary, "w") as file:
+        file.write(text)
+
+    os.replace(temporary, path)
+
+
+def exportConfiguredMetrics(metrics: Metrics = METRICS) -> None:
+    """
+    This function writes the metrics to the file named by the METRICS_ENV environment variable, if it is set.
+    """
+    path: str = os.environ.get(METRICS_ENV)
+
+    if path:
+        exportMetrics(path, metrics)
@@ -0,0 +1,258 @@
+import random
+from functools import lru_cache
+
+import numpy as np
+
+# The amount of bits in each word of a batch mask.
+WORD_BITS = 64
+
+# The most cells fleetFits looks at while it searches for a layout. Past this the fleet is taken to fit, and the placement functions give up after their own attempts instead.
+FIT_STEPS = 200000
+
+# The most batches of candidate fleets in a row that sampleFleets draws without keeping one before it gives up.
+EMPTY_BATCHES = 100
+
+
+@lru_cache(maxsize=None)
+def getPlacements(
+    width: int, height: int, length: int
+) -> tuple[tuple[int, list[int], list[int]], ...]:
+    """
+    This function builds (once per board size and ship length) the table of every legal placement of a ship on an empty board.
+
+    Returns:
+    tuple: One (mask, startCoordinates, endCoordinates) entry per placement. Horizontal placements come first, then vertical ones.
+    """
+    placements: list[tuple[int, list[int], list[int]]] = []
+
+    # A horizontal ship is a run of bits, so its mask is a shifted block of ones.
+    run: int = (1 << length) - 1
+
+    for y in range(height):
+        for x in range(width - length + 1):
+            placements.append((run << (y * width + x), [x, y], [x + length - 1, y]))
+
+    # A vertical ship is one bit per row.
+    column: int = 0
+
+    for offset in range(length):
+        column |= 1 << (offset * width)
+
+    for y in range(height - length + 1):
+        for x in range(width):
+            placements.append((column << (y * width + x), [x, y], [x, y + length - 1]))
+
+    return tuple(placements)
+
+
+@lru_cache(maxsize=None)
+def getPlacementWords(width: int, height: int, length: int) -> np.ndarray:
+    """
+    This function returns the placement masks of a ship as an array of 64-bit words, shape (placements, words), so that many fleets can be checked at once with NumPy.
+    """
+    words: int = (width * height + WORD_BITS - 1) // WORD_BITS
+
+    return np.array(
+        [
+            [(mask >> (word * WORD_BITS)) & (2**WORD_BITS - 1) for word in range(words)]
+            for mask, _, _ in getPlacements(width, height, length)
+        ],
+        dtype=np.uint64,
+    ).reshape(-1, words)
+
+
+@lru_cache(maxsize=None)
+def getPlacementMatrix(width: int, height: int, length: int) -> np.ndarray:
+    """
+    This function returns the placements of a ship as a 0/1 matrix with one row per placement and one column per cell.
+    """
+    words = getPlacementWords(width, height, length)
+
+    # Unpack the words into bits and drop the padding past the last cell.
+    bits = np.unpackbits(words.astype("<u8").view(np.uint8), axis=1, bitorder="little")
+
+    return bits[:, : width * height].astype(float)
+
+
+def fleetFits(width: int, height: int, lengths: list[int]) -> bool:
+    """
+    This function determines if a fleet can be placed on a board without any ships overlapping. It searches for a layout, longest ships first, with each ship trying the cells in order. Ships of the same length are only placed after the one before them, so the same layout isn't tried in every order.
+
+    The search stops after FIT_STEPS cells, in which case the fleet is taken to fit.
+
+    Returns:
+    bool: Whether a layout was found (or the search ran out of steps).
+    """
+    if sum(lengths) > width * height:
+        return False
+
+    if not lengths:
+        return True
+
+    lengths = sorted(lengths, reverse=True)
+    occupied: set[int] = set()
+    steps: int = 0
+
+    def getCandidates(ship: int, first: int):
+        nonlocal steps
+
+        length: int = lengths[ship]
+
+        for start in range(first, width * height):
+            steps += 1
+
+            x, y = start % width, start // width
+
+            # Try the ship horizontally, then vertically. (A ship of one cell is the same both ways.)
+            for fits, step in (
+                (x + length <= width, 1),
+                (y + length <= height and length > 1, width),
+            ):
+                cells = range(start, start + length * step, step)
+
+                if fits and not any(cell in occupied for cell in cells):
+                    yield start, cells
+
+    # The candidates of each placed ship, and the cells it was placed on.
+    stack: list = [getCandidates(0, 0)]
+    placed: list[range] = []
+
+    while stack:
+        # Take the ship at this depth off the board before trying its next placement.
+        if len(placed) == len(stack):
+            occupied.difference_update(placed.pop())
+
+        candidate = next(stack[-1], None)
+
+        if steps > FIT_STEPS:
+            return True
+
+        if candidate is None:
+            stack.pop()
+
+            continue
+
+        start, cells = candidate
+
+        occupied.update(cells)
+        placed.append(cells)
+
+        if len(placed) == len(lengths):
+            return True
+
+        ship: int = len(placed)
+
+        stack.append(
+            getCandidates(ship, start if lengths[ship] == lengths[ship - 1] else 0)
+        )
+
+    return False
+
+
+def sampleFleet(
+    width: int, height: int, lengths: list[int], attempts: int = None
+) -> list[int]:
+    """
+    This function draws a fleet layout uniformly from every layout where no ships overlap.
+
+    Each ship picks a placement from its table independently, and the whole fleet is redrawn if any of the masks intersect. Rejecting whole fleets (instead of retrying ship by ship) is what keeps every valid layout equally likely.
+
+    Params:
+    attempts: The most fleets to draw. By default it keeps drawing until a fleet fits.
+
+    Returns:
+    list[int]: The index of each ship's placement in its table, in the order of the lengths, or None if no fleet fit within the attempts.
+    """
+    tables = [getPlacements(width, height, length) for length in lengths]
+
+    attempt: int = 0
+
+    while attempts is None or attempt < attempts:
+        attempt += 1
+
+        occupied: int = 0
+        layout: list[int] = []
+
+        for table in tables:
+            index: int = random.randrange(len(table))
+            mask: int = table[index][0]
+
+            # Start over if this ship overlaps one that was already placed.
+            if occupied & mask:
+                break
+
+            occupied |= mask
+            layout.append(index)
+        else:
+            return layout
+
+    return None
+
+
+def sampleFleets(
+    count: int,
+    width: int,
+    height: int,
+    lengths: list[int],
+    rng: np.random.Generator = None,
+) -> np.ndarray:
+    """
+    This function draws many fleet layouts at once. It is the batch version of sampleFleet and uses the same uniform rejection, but checks whole batches of candidate fleets with NumPy.
+
+    Returns:
+    np.ndarray: A (count, ships) array with the index of each ship's placement in its table.
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+
+    # An empty fleet only has one layout.
+    if not lengths:
+        return np.zeros((count, 0), dtype=np.int32)
+
+    # Split the tables into one array per word so that every check is on flat arrays.
+    tables = [getPlacementWords(width, height, length).T for length in lengths]
+
+    layouts: list[np.ndarray] = []
+    found: int = 0
+    empty: int = 0
+
+    while found < count:
+        # Draw more candidates than needed, since a share of them overlap.
+        candidates: int = max(1024, 3 * (count - found))
+
+        indices = [
+            rng.integers(table.shape[1], size=candidates, dtype=np.int32)
+            for table in tables
+        ]
+
+        # Start with the first ship on every board, then add the ships one by one.
+        kept = np.arange(candidates)
+        occupied = [words[indices[0]] for words in tables[0]]
+
+        for ship in range(1, len(tables)):
+            masks = [words[indices[ship][kept]] for words in tables[ship]]
+
+            # Keep only the fleets where the new ship doesn't intersect the occupied cells.
+            overlap = occupied[0] & masks[0]
+
+            for word in range(1, len(masks)):
+                overlap |= occupied[word] & masks[word]
+
+            valid = overlap == 0
+
+            kept = kept[valid]
+            occupied = [(words | mask)[valid] for words, mask in zip(occupied, masks)]
+
+        accepted = np.stack([ship[kept] for ship in indices], axis=1)[: count - found]
+
+        # Fleets that (almost) never fit would otherwise be drawn forever.
+        empty = 0 if len(accepted) else empty + 1
+
+        if empty >= EMPTY_BATCHES:
+            raise ValueError(
+                f"No fleet fit on the {width}x{height} board in {EMPTY_BATCHES} batches of candidates. See functions.placements.sampleFleets"
+            )
+
+        layouts.append(accepted)
+        found += len(accepted)
+
+    return np.concatenate(layouts)
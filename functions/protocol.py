@@ -0,0 +1,77 @@
+import json
+
+from classes.Board import Board
+from classes.Ship import Ship
+
+# The match server's protocol. Every message is a JSON object on its own line, with a "type":
+#
+# Client to server: join (mode: "pvp" or "pve"), place (ships: the start and end coordinates of each ship, by key) and fire (cell: the x, y indices).
+# Server to client: waiting, start (player, opponent, width, height, ships), placed, begin (starting player), turn, shot (player, cell, hit, sunk, won), error (message), left.
+
+# The address the server listens on (and the client connects to) by default. Only local clients can connect to it.
+HOST = "127.0.0.1"
+PORT = 5050
+
+# Longer lines than this are rejected, so a client can't make the server buffer without limit.
+MAX_LINE = 64 * 1024
+
+
+def encodeMessage(message: dict) -> bytes:
+    """
+    This function encodes a message as a line of JSON.
+    """
+    return (json.dumps(message, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def decodeMessage(line: bytes) -> dict:
+    """
+    This function decodes a line of JSON into a message. It raises a ValueError if the line is not a message.
+    """
+    message = json.loads(line.decode("utf-8"))
+
+    if not isinstance(message, dict) or not isinstance(message.get("type"), str):
+        raise ValueError(
+            "Messages have to be objects with a type. See functions.protocol.decodeMessage"
+        )
+
+    return message
+
+
+def encodeShips(ships: dict) -> list[list]:
+    """
+    This function encodes a fleet as a list of [key, name, length, colour].
+    """
+    return [[key, ship.name, ship.length, ship.colour] for key, ship in ships.items()]
+
+
+def decodeShips(ships: list[list]) -> dict:
+    """
+    This function decodes a fleet encoded by encodeShips.
+    """
+    return {key: Ship(length, colour, name) for key, name, length, colour in ships}
+
+
+def encodeLayout(board: Board, ships: dict) -> dict:
+    """
+    This function encodes where each ship of a fleet was placed on a board, by key.
+    """
+    return {
+        key: [
+            board.shipLocations[ship.name]["startCoordinates"],
+            board.shipLocations[ship.name]["endCoordinates"],
+        ]
+        for key, ship in ships.items()
+    }
+
+
+def isCell(cell, width: int, height: int) -> bool:
+    """
+    This function determines if a decoded value is the x, y indices of a cell on the board.
+    """
+    return (
+        isinstance(cell, list)
+        and len(cell) == 2
+        and all(type(value) is int for value in cell)
+        and 0 <= cell[0] < width
+        and 0 <= cell[1] < height
+    )
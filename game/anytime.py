@@ -0,0 +1,210 @@
+# Import all needed modules and packages.
+import random
+import time
+from typing import Iterator
+
+import numpy as np
+
+# Import the local classes module.
+from classes.Coordinate import Coordinate
+from classes.MoveResult import MoveResult
+from classes.Player import Player
+from classes.SmartShip import SmartShip
+
+from game.endgame import getEndgameShot, getPlacementTables
+from game.headless import getComputerMove, getCoordinate, getRandomGuess
+from game.targeting import MATRIX_CELLS, getDensityMove, getTargets, pickBestCell
+
+# This module lets the computer think for a set time per move. Each difficulty searches in steps that each give a better answer than the last, and the search is stopped with its best answer so far once the time budget runs out.
+
+# The difficulties, from the weakest to the strongest:
+# easy: Guesses randomly.
+# normal: Guesses randomly, follows up on its hits with the smart ship and solves the endgame exactly. (The terminal game's computer.)
+# hard: Fires at the densest cell, then refines the density by sampling whole fleet layouts until the time runs out.
+DIFFICULTIES = ("easy", "normal", "hard")
+
+# The time budget of a move, in seconds.
+MOVE_BUDGET = 0.01
+
+# The normal difficulty only tries the exact endgame solver once at most this many of the opponent's ships are afloat, so that the rest of its moves stay random guesses.
+ENDGAME_SHIPS = 2
+
+# The time the exact endgame solver usually takes at most. It can't be stopped part way, so it only runs if this much of the budget is left.
+ENDGAME_TIME = 0.005
+
+# The fleet layouts are sampled in batches of this size, and the sampled answer is only trusted once it has MIN_SAMPLES layouts behind it.
+SAMPLE_BATCH = 64
+MIN_SAMPLES = 256
+
+# The most layouts sampled for a move. More barely changes the answer.
+SAMPLE_LIMIT = 20000
+
+
+def sampleLayouts(player: Player, opponent: Player) -> Iterator[tuple[Coordinate, int]]:
+    """
+    This function samples fleet layouts of the opponent's afloat ships that avoid every miss and sunk ship, uniformly, and counts how many cover each cell. After every batch it yields the cell covered by the most layouts so far, or None until there are enough of them to trust.
+
+    Layouts are only sampled while no unsunk hits are left, since nearly no random layouts would cover them.
+
+    Yields:
+    tuple[Coordinate, int]: The best cell so far (or None), and the amount of layouts sampled.
+    """
+    board = opponent.board
+
+    sunkMask, lengths = getTargets(board)
+
+    tables: list[list] = getPlacementTables(
+        board.width, board.height, board.missMask | sunkMask, lengths
+    )
+
+    coverage = np.zeros(board.width * board.height)
+    samples: int = 0
+
+    while samples < SAMPLE_LIMIT:
+        for _ in range(SAMPLE_BATCH):
+            occupied: int = 0
+            vectors: list[np.ndarray] = []
+
+            # Draw a placement for every ship, and throw the whole layout away if any of them overlap. (See functions.placements.sampleFleet)
+            for table in tables:
+                mask, vector = table[random.randrange(len(table))]
+
+                if occupied & mask:
+                    break
+
+                occupied |= mask
+                vectors.append(vector)
+            else:
+                coverage += sum(vectors)
+                samples += 1
+
+        if samples < MIN_SAMPLES:
+            yield None, samples
+        else:
+            yield pickBestCell(
+                coverage.reshape(board.height, board.width), player, board
+            ), samples
+
+
+def searchMove(
+    player: Player,
+    opponent: Player,
+    smartShip: SmartShip,
+    difficulty: str,
+    deadline: float,
+) -> Iterator[tuple[Coordinate, int]]:
+    """
+    This function searches for the computer's next shot in steps. Each step yields a better answer than the one before it, and the first one is always a random cell that hasn't been guessed, which takes microseconds.
+
+    Params:
+    deadline: The time (from time.perf_counter) that the move has to be picked by.
+
+    Yields:
+    tuple[Coordinate, int]: The best shot so far, and the amount of layouts sampled to find it. The shot is None if the step didn't improve on the last answer.
+    """
+    board = opponent.board
+
+    # Start with a random guess, so there is always an answer.
+    yield getCoordinate(
+        board.geometry, *getRandomGuess(player, board.width, board.height)
+    ), 0
+
+    if difficulty == "easy":
+        return
+
+    if difficulty == "normal":
+        # Following up on a hit is quick, and so is guessing until the endgame.
+        if (
+            smartShip.origin
+            or len(board.shipLocations) - len(board.sunkShips) > ENDGAME_SHIPS
+        ):
+            yield getComputerMove(player, opponent, smartShip), 0
+
+            return
+
+        # The endgame solver needs its time.
+        if deadline - time.perf_counter() >= ENDGAME_TIME:
+            yield getEndgameShot(player, opponent) or getComputerMove(
+                player, opponent, smartShip
+            ), 0
+
+        return
+
+    yield getDensityMove(player, opponent), 0
+
+    # The density map already weighs the unsunk hits, and large boards are too big to sample.
+    if (
+        board.hitMask & ~getTargets(board)[0]
+        or board.width * board.height > MATRIX_CELLS
+    ):
+        return
+
+    if deadline - time.perf_counter() >= ENDGAME_TIME:
+        endgameCoordinate: Coordinate = getEndgameShot(player, opponent)
+
+        # The exact answer can't be improved on.
+        if endgameCoordinate:
+            yield endgameCoordinate, 0
+
+            return
+
+    yield from sampleLayouts(player, opponent)
+
+
+def getTimedMove(
+    player: Player,
+    opponent: Player,
+    smartShip: SmartShip = None,
+    budget: float = MOVE_BUDGET,
+    difficulty: str = "hard",
+) -> MoveResult:
+    """
+    This function picks the computer's next shot within a time budget. The search runs until it finishes or the budget runs out, and the best shot it found by then is returned. The budget is checked between the steps of the search, which are each well under a millisecond (apart from the endgame solver, which only runs if there is time left for it).
+
+    Params:
+    smartShip: The smart ship of the computer, which the normal difficulty follows up on its hits with.
+    budget: The time the computer can think for, in seconds.
+    difficulty: One of DIFFICULTIES.
+
+    Returns:
+    MoveResult: The shot, and how much of the search was done.
+    """
+    if difficulty not in DIFFICULTIES:
+        raise ValueError(
+            f"Unknown difficulty: {difficulty}. See game.anytime.DIFFICULTIES"
+        )
+
+    start: float = time.perf_counter()
+    deadline: float = start + budget
+
+    search = searchMove(
+        player, opponent, smartShip or SmartShip(), difficulty, deadline
+    )
+
+    best: Coordinate = None
+    steps: int = 0
+    samples: int = 0
+    complete: bool = True
+
+    for coordinate, samples in search:
+        steps += 1
+
+        if coordinate:
+            best = coordinate
+
+        # Stop thinking once the time is up, and keep the best answer so far.
+        if time.perf_counter() >= deadline:
+            complete = False
+            search.close()
+
+            break
+
+    return MoveResult(
+        best,
+        difficulty,
+        budget,
+        time.perf_counter() - start,
+        steps,
+        samples,
+        complete,
+    )
@@ -0,0 +1,284 @@
+# Import all needed modules and packages.
+import argparse
+from collections import Counter
+
+import numpy as np
+
+# Import the local classes module.
+from classes.BatchDetails import BatchDetails
+from classes.GameSettings import GameSettings
+from classes.TournamentDetails import TournamentDetails
+
+from functions.placements import getPlacementMatrix, sampleFleets
+
+from game.constants import DEFAULT_SETTINGS, SHIPS
+from game.simulation import addHeatmapArguments, printTournament, showHeatmaps
+from game.targeting import HIT_WEIGHT, MATRIX_CELLS
+
+# This module simulates thousands of computer games side by side. Every game is a row of the same NumPy arrays, and each step fires one shot in every unfinished game at once, so the Python loop runs once per shot instead of once per shot per game.
+
+# The targeting strategies that can be simulated in batches:
+# guess: Fires at a random cell that hasn't been guessed. (The random strategy without the smart ship.)
+# density: Fires at the cell covered by the most legal placements of the afloat ships. (The same map as game.targeting.getDensityMove.)
+BATCH_TARGETING = ("guess", "density")
+
+# The most games simulated side by side. Larger batches are split, so the arrays stay a few megabytes.
+BATCH_SIZE = 4096
+
+
+def createFleets(
+    count: int, settings: GameSettings, rng: np.random.Generator
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    This function places a uniformly random fleet on each of the boards.
+
+    Returns:
+    tuple[np.ndarray, np.ndarray]: The index of each ship's placement in its table (count, ships), and the ship on each cell of each board (count, cells), with -1 for water.
+    """
+    lengths: list[int] = settings.getLengths()
+
+    fleets = sampleFleets(count, settings.width, settings.height, lengths, rng)
+
+    shipCells = np.full((count, settings.width * settings.height), -1, dtype=np.int8)
+
+    for ship, length in enumerate(lengths):
+        cells = getPlacementMatrix(settings.width, settings.height, length)[
+            fleets[:, ship]
+        ].astype(bool)
+
+        shipCells[cells] = ship
+
+    return fleets, shipCells
+
+
+def getBatchDensity(
+    settings: GameSettings,
+    blocked: np.ndarray,
+    openHits: np.ndarray,
+    afloat: np.ndarray,
+) -> np.ndarray:
+    """
+    This function computes the density map of every board at once. It is getDensityMap with a row per board.
+
+    Params:
+    blocked: (games, cells) The misses and the cells of sunk ships.
+    openHits: (games, cells) The hits on ships that are still afloat.
+    afloat: (games, ships) Whether each ship is still afloat.
+
+    Returns:
+    np.ndarray: (games, cells) The placement weights of every cell.
+    """
+    lengths: list[int] = settings.getLengths()
+
+    density = np.zeros(blocked.shape, dtype=np.float32)
+
+    # The weight of a placement for each amount of unsunk hits it covers, looked up instead of raised to a power.
+    hitWeights = np.power(HIT_WEIGHT, np.arange(max(lengths) + 1), dtype=np.float32)
+
+    for length in Counter(lengths):
+        # Single precision halves the work of the products, and the counts in them are small whole numbers.
+        placements = getPlacementMatrix(settings.width, settings.height, length).astype(
+            np.float32
+        )
+
+        # The amount of afloat ships of this length on each board.
+        count = afloat[
+            :, [ship for ship, value in enumerate(lengths) if value == length]
+        ].sum(axis=1)
+
+        # Weight each legal placement by the hits it would explain, then spread the weights back onto the cells.
+        weights = (blocked @ placements.T == 0) * hitWeights[
+            (openHits @ placements.T).astype(np.int8)
+        ]
+
+        density += count[:, None] * (weights @ placements)
+
+    return density
+
+
+def shootFleets(
+    shipCells: np.ndarray,
+    settings: GameSettings,
+    targeting: str,
+    rng: np.random.Generator,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    This function has a computer shoot at every board until each fleet is sunk, one shot per board per step. Boards drop out of the step as soon as their fleet is sunk.
+
+    Params:
+    shipCells: (games, cells) The ship on each cell, with -1 for water.
+    targeting: One of BATCH_TARGETING.
+
+    Returns:
+    tuple[np.ndarray, np.ndarray, np.ndarray]: The cell of every shot (games, cells), padded with -1, whether each shot hit (games, cells), and the shot that sunk each ship (games, ships).
+    """
+    games, cells = shipCells.shape
+    lengths = np.array(settings.getLengths())
+    rows = np.arange(games)
+
+    # The state of every board: its misses, hits and sunk cells, and how many cells of each ship are left.
+    misses = np.zeros((games, cells), dtype=bool)
+    hits = np.zeros((games, cells), dtype=bool)
+    sunk = np.zeros((games, cells), dtype=bool)
+    remaining = np.tile(lengths, (games, 1))
+
+    moves = np.full((games, cells), -1, dtype=np.int16)
+    shotHits = np.zeros((games, cells), dtype=bool)
+    sunkAt = np.zeros((games, len(lengths)), dtype=np.int32)
+
+    active = rows
+
+    for shot in range(cells):
+        if not len(active):
+            break
+
+        guessed = misses[active] | hits[active]
+
+        # Score every cell, never picking one that was already guessed. Random scores break the ties between the best cells.
+        if targeting == "density":
+            scores = getBatchDensity(
+                settings,
+                (misses[active] | sunk[active]).astype(np.float32),
+                (hits[active] & ~sunk[active]).astype(np.float32),
+                remaining[active] > 0,
+            )
+            scores[guessed] = -1
+
+            best = scores == scores.max(axis=1, keepdims=True)
+            cell = np.argmax(best * rng.random(best.shape), axis=1)
+        else:
+            cell = np.argmax(~guessed * rng.random(guessed.shape), axis=1)
+
+        ship = shipCells[active, cell]
+        hit = ship >= 0
+
+        moves[active, shot] = cell
+        shotHits[active, shot] = hit
+        misses[active[~hit], cell[~hit]] = True
+
+        # Take the cell off each ship that was hit, and mark the ships that have none left as sunk.
+        hitGames, hitShips = active[hit], ship[hit]
+
+        hits[hitGames, cell[hit]] = True
+        remaining[hitGames, hitShips] -= 1
+
+        sinking = remaining[hitGames, hitShips] == 0
+        sunkGames, sunkShips = hitGames[sinking], hitShips[sinking]
+
+        sunkAt[sunkGames, sunkShips] = shot + 1
+        sunk[sunkGames] |= shipCells[sunkGames] == sunkShips[:, None]
+
+        # Drop the boards whose whole fleet is sunk.
+        active = active[remaining[active].any(axis=1)]
+
+    return moves, shotHits, sunkAt
+
+
+def simulateBatch(
+    games: int,
+    targeting: tuple = ("density", "guess"),
+    seed: int = None,
+    settings: GameSettings = DEFAULT_SETTINGS,
+) -> BatchDetails:
+    """
+    This function plays computer vs. computer games side by side. Both fleets are placed uniformly. Since neither computer's shots depend on the other's, each player shoots at the other's fleet until it is sunk, and the games are then settled by who got there first.
+
+    Params:
+    games: The amount of games to play.
+    targeting: The names of the targeting strategies of player 1 and player 2. See BATCH_TARGETING.
+    seed: The random seed. Games are only repeatable if a seed is given.
+    settings: The board size and fleet of every game.
+
+    Returns:
+    BatchDetails: The stats of every game.
+    """
+    for name in targeting:
+        if name not in BATCH_TARGETING:
+            raise ValueError(
+                f"Unknown batch targeting strategy: {name}. See game.batch.BATCH_TARGETING"
+            )
+
+    # The placement matrices grow with the square of the board.
+    if settings.width * settings.height > MATRIX_CELLS:
+        raise ValueError(
+            f"Boards of more than {MATRIX_CELLS} cells can't be simulated in batches. See game.batch.simulateBatch"
+        )
+
+    rng: np.random.Generator = np.random.default_rng(seed)
+
+    results: list[tuple] = []
+
+    for start in range(0, games, BATCH_SIZE):
+        count: int = min(BATCH_SIZE, games - start)
+
+        fleets: list[np.ndarray] = []
+        shots: list[tuple] = []
+
+        # Each player shoots at the other player's fleet.
+        for strategy in targeting:
+            fleet, shipCells = createFleets(count, settings, rng)
+
+            fleets.append(fleet)
+            shots.append(shootFleets(shipCells, settings, strategy, rng))
+
+        # The fleet player 1 shot at belongs to player 2, and the other way around.
+        results.append(
+            (
+                rng.integers(1, 3, count),
+                np.stack([fleets[1], fleets[0]], axis=1),
+                *(np.stack(arrays, axis=1) for arrays in zip(*shots)),
+            )
+        )
+
+    return BatchDetails(
+        settings,
+        targeting,
+        *(np.concatenate(arrays) for arrays in zip(*results)),
+    )
+
+
+def main(arguments: list[str] = None) -> BatchDetails:
+    """
+    This function simulates a batch of games from the command line.
+    """
+    parser = argparse.ArgumentParser(
+        description="Simulate thousands of computer vs. computer games of Battleship side by side."
+    )
+    parser.add_argument("--games", type=int, default=10000)
+    parser.add_argument(
+        "--targeting", nargs=2, default=["density", "guess"], choices=BATCH_TARGETING
+    )
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--width", type=int, default=10)
+    parser.add_argument("--height", type=int, default=10)
+    parser.add_argument(
+        "--check",
+        type=int,
+        default=0,
+        metavar="GAMES",
+        help="Replay this many of the games through the engine and check that their stats match the batch.",
+    )
+    addHeatmapArguments(parser)
+
+    options = parser.parse_args(arguments)
+
+    details: BatchDetails = simulateBatch(
+        options.games,
+        tuple(options.targeting),
+        options.seed,
+        GameSettings(SHIPS, options.width, options.height),
+    )
+
+    for game in range(min(options.check, len(details))):
+        details.checkReplay(game)
+
+    tournamentDetails: TournamentDetails = details.toTournament()
+
+    printTournament(tournamentDetails)
+    showHeatmaps(tournamentDetails, options.heatmap, options.heatmaps)
+
+    return details
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,398 @@
+# Import all needed modules and packages.
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from contextlib import contextmanager, redirect_stdout
+
+# Import the local classes module.
+from classes.Engine import Engine
+from classes.Player import Player
+from classes.SmartShip import SmartShip
+
+from functions.placements import getPlacements
+
+from game.constants import DEFAULT_SETTINGS, SHIPS
+from game.endgame import getEndgameMove
+from game.headless import (
+    generateNewBoard,
+    getComputerMove,
+    placeComputerShips,
+    playComputerGame,
+)
+from game.targeting import getDensityMove
+
+# The folder of the project, which python -m battleship is run from.
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The file the baseline timings are stored in.
+BASELINE = os.path.join(ROOT, "assets", "benchmarkBaseline.json")
+
+# A benchmark is flagged when it is this much slower than its baseline. (0.25 means 25% slower.)
+TOLERANCE = 0.25
+
+# The most seconds a headless command may take to start in a new process, on top of being compared to the baseline. Simulation workers pay this every time they are spawned.
+STARTUP_BUDGET = 0.25
+
+# Every benchmark is seeded the same way, so each run times the same boards and games.
+SEED = 2023
+
+
+def createPlayers() -> list[Player]:
+    """
+    This function creates two computer players with their ships placed.
+    """
+    players: list[Player] = [
+        DEFAULT_SETTINGS.createPlayer(1, False),
+        DEFAULT_SETTINGS.createPlayer(2, False),
+    ]
+
+    for player in players:
+        placeComputerShips(player.board)
+
+    return players
+
+
+def benchGenerateNewBoard():
+    """
+    This function times building the rows of an empty board.
+    """
+    return generateNewBoard
+
+
+def benchComputerShipPlacement():
+    """
+    This function times the computer placing its fleet, through the same function the terminal game uses.
+    """
+
+    # The terminal game is only imported by the benchmarks that use it, so the others (and startup) don't pay for it.
+    from game import battleship
+
+    def run() -> None:
+        battleship.computerShipPlacement(DEFAULT_SETTINGS.createBoard(), SHIPS)
+
+    return run
+
+
+def benchCollides():
+    """
+    This function times checking every possible placement of every ship against a board with a full fleet on it.
+    """
+    board = createPlayers()[0].board
+
+    spans: list[tuple[list[int], list[int]]] = [
+        (start, end)
+        for ship in SHIPS.values()
+        for _, start, end in getPlacements(board.width, board.height, ship.length)
+    ]
+
+    def run() -> None:
+        for start, end in spans:
+            board.collides(start, end)
+
+    return run
+
+
+def benchTargeting(targeting):
+    """
+    This function returns a benchmark which times a targeting strategy shooting until it sinks a full fleet. The engine resolves the shots, so the time includes firing them.
+    """
+
+    def setup():
+        def run() -> None:
+            player, opponent = createPlayers()
+
+            engine: Engine = Engine([player, opponent], player)
+            smartShip: SmartShip = SmartShip()
+
+            while not engine.winner:
+                event = engine.fire(targeting(player, opponent, smartShip).rawCoords())
+
+                smartShip.record(
+                    event.hit, event.isSunk(), event.cell if event.hit else None
+                )
+
+                # Only the computer being timed shoots, so hand the turn straight back.
+                engine.player = player
+
+        return run
+
+    return setup
+
+
+def benchPrintBoard():
+    """
+    This function times formatting and printing a board part way through a game. The runner sends the output to a null stream.
+    """
+    from game import battleship
+
+    player, opponent = createPlayers()
+
+    # Shoot half of the opponent's cells so that every kind of cell is drawn.
+    engine: Engine = Engine([player, opponent], player)
+
+    for index in random.sample(range(100), 50):
+        engine.fire([index % 10, index // 10])
+
+        engine.player = player
+
+    def run() -> None:
+        battleship.printBoard(player, opponent, False)
+        battleship.printBoard(opponent, player, True)
+
+    return run
+
+
+def benchHeadlessGame():
+    """
+    This function times a complete computer vs. computer game.
+    """
+    return playComputerGame
+
+
+def benchStartup():
+    """
+    This function times starting a headless command in a new process, the way a simulation worker starts: the interpreter starts, imports the simulation and prints its help.
+    """
+    command: list[str] = [sys.executable, "-m", "battleship", "simulate", "--help"]
+
+    def run() -> None:
+        subprocess.run(command, cwd=ROOT, check=True, stdout=subprocess.DEVNULL)
+
+    return run
+
+
+# The benchmarks that run the terminal game, which sleeps between screens unless it is silenced.
+TERMINAL_BENCHMARKS = ("computerShipPlacement", "printBoard")
+
+# The benchmarks, by name. Each one sets up its data and returns the function that is timed.
+BENCHMARKS = dict(
+    generateNewBoard=benchGenerateNewBoard,
+    computerShipPlacement=benchComputerShipPlacement,
+    collides=benchCollides,
+    getComputerMove=benchTargeting(getComputerMove),
+    getDensityMove=benchTargeting(getDensityMove),
+    getEndgameMove=benchTargeting(getEndgameMove),
+    printBoard=benchPrintBoard,
+    headlessGame=benchHeadlessGame,
+    startup=benchStartup,
+)
+
+
+@contextmanager
+def quiet(terminal: bool = False):
+    """
+    This function silences benchmarks while they run: printing goes to a null stream, and if the terminal game is used (terminal) there is no sleeping.
+    """
+    if not terminal:
+        with open(os.devnull, "w") as stream, redirect_stdout(stream):
+            yield
+
+        return
+
+    from game import battleship
+
+    sleep: int = battleship.SLEEP
+    battleship.SLEEP = 0
+
+    try:
+        with open(os.devnull, "w") as stream, redirect_stdout(stream):
+            yield
+    finally:
+        battleship.SLEEP = sleep
+
+
+def measure(name: str, rounds: int, budget: float) -> dict:
+    """
+    This function times a benchmark. It calls it enough times per round to fill the time budget, then repeats the round.
+
+    Params:
+    name: The name of the benchmark. See BENCHMARKS.
+    rounds: The amount of rounds to time.
+    budget: Roughly how many seconds each round should take.
+
+    Returns:
+    dict: The fastest and median time per call in seconds, and the calls per round.
+    """
+    random.seed(SEED)
+
+    with quiet(name in TERMINAL_BENCHMARKS):
+        run = BENCHMARKS[name]()
+
+        # Warm up (and fill any caches), and time one call to pick the calls per round.
+        start: float = time.perf_counter()
+        run()
+        calls: int = max(1, int(budget / max(time.perf_counter() - start, 1e-9)))
+
+        timings: list[float] = []
+
+        for _ in range(rounds):
+            start = time.perf_counter()
+
+            for _ in range(calls):
+                run()
+
+            timings.append((time.perf_counter() - start) / calls)
+
+    return dict(best=min(timings), median=statistics.median(timings), calls=calls)
+
+
+def getMachine() -> dict:
+    """
+    This function describes the machine the timings were taken on. Baselines are only comparable on the same machine.
+    """
+    return dict(
+        python=platform.python_version(),
+        platform=platform.platform(),
+        processor=platform.processor() or platform.machine(),
+    )
+
+
+def loadBaseline(path: str) -> dict:
+    """
+    This function reads the stored baseline. It returns None if there isn't one yet.
+    """
+    if not os.path.exists(path):
+        return None
+
+    with open(path) as file:
+        return json.load(file)
+
+
+def saveBaseline(path: str, results: dict) -> None:
+    """
+    This function stores the timings as the new baseline.
+    """
+    with open(path, "w") as file:
+        json.dump(dict(machine=getMachine(), results=results), file, indent=4)
+        file.write("\n")
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """
+    This function compares the timings to the baseline by their fastest times.
+
+    Returns:
+    list[str]: The names of the benchmarks that are slower than the baseline by more than the tolerance.
+    """
+    return [
+        name
+        for name, result in results.items()
+        if name in baseline["results"]
+        and result["best"] > baseline["results"][name]["best"] * (1 + tolerance)
+    ]
+
+
+def formatTime(seconds: float) -> str:
+    """
+    This function formats a time per call with a readable unit.
+    """
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("µs", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def printResults(results: dict, baseline: dict, regressions: list[str]) -> None:
+    """
+    This function prints the timings, and how they compare to the baseline if there is one.
+    """
+    if baseline and baseline.get("machine") != getMachine():
+        print("Warning: The baseline was taken on a different machine.\n")
+
+    for name, result in results.items():
+        line: str = (
+            f"{name:<24}{formatTime(result['best']):>12}{formatTime(result['median']):>12}"
+        )
+
+        if baseline and name in baseline["results"]:
+            ratio: float = result["best"] / baseline["results"][name]["best"]
+
+            line += f"{ratio:>8.2f}x"
+
+            if name in regressions:
+                line += "  SLOWER"
+
+        print(line)
+
+
+def main(arguments: list[str] = None) -> list[str]:
+    """
+    This function runs the benchmarks from the command line.
+
+    Returns:
+    list[str]: The names of the benchmarks that regressed.
+    """
+    parser = argparse.ArgumentParser(
+        description="Time the hot paths of Battleship and compare them to a stored baseline."
+    )
+    parser.add_argument(
+        "names", nargs="*", help=f"The benchmarks to run: {', '.join(BENCHMARKS)}."
+    )
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--budget", type=float, default=0.2)
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE)
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument(
+        "--save", action="store_true", help="Store the timings as the new baseline."
+    )
+
+    options = parser.parse_args(arguments)
+
+    for name in options.names:
+        if name not in BENCHMARKS:
+            parser.error(f"Unknown benchmark: {name}.")
+
+    results: dict = {
+        name: measure(name, options.rounds, options.budget)
+        for name in options.names or BENCHMARKS
+    }
+
+    baseline: dict = None if options.save else loadBaseline(options.baseline)
+    regressions: list[str] = (
+        compare(results, baseline, options.tolerance) if baseline else []
+    )
+
+    # Starting up has a hard budget, whatever the baseline says.
+    overBudget: bool = (
+        "startup" in results and results["startup"]["best"] > STARTUP_BUDGET
+    )
+
+    if overBudget and "startup" not in regressions:
+        regressions.append("startup")
+
+    print(
+        f"{'Benchmark':<24}{'Best':>12}{'Median':>12}{'Ratio' if baseline else '':>9}\n"
+    )
+
+    printResults(results, baseline, regressions)
+
+    if options.save:
+        # Keep the stored timings of any benchmarks that weren't run.
+        stored: dict = loadBaseline(options.baseline) or dict(results={})
+        stored["results"].update(results)
+
+        saveBaseline(options.baseline, stored["results"])
+
+        print(f"\nSaved the baseline to {options.baseline}.")
+    elif regressions:
+        print(
+            f"\n{len(regressions)} benchmark(s) are more than {options.tolerance:.0%} slower than the baseline."
+        )
+
+    if overBudget:
+        print(
+            f"\nStarting a headless command took {formatTime(results['startup']['best'])}, more than the budget of {formatTime(STARTUP_BUDGET)}."
+        )
+
+    return regressions
+
+
+if __name__ == "__main__":
+    sys.exit(1 if main() else 0)
@@ -0,0 +1,261 @@
+# Import all needed modules and packages.
+import argparse
+import asyncio
+
+from termcolor import cprint, colored
+
+# Import the local classes module.
+from classes.GameSettings import GameSettings
+from classes.Player import Player
+from classes.Seat import Seat
+from classes.Ship import Ship
+from classes.SunkShip import SunkShip
+
+from functions import protocol
+
+from game import battleship
+from game.headless import PLACEMENT
+
+
+def recordShot(
+    shooter: Player, target: Player, cell: list[int], hit: bool, sunk: str, ships: dict
+) -> None:
+    """
+    This function copies a shot resolved by the server onto the client's players, so that the existing board rendering can draw them.
+
+    Params:
+    shooter: The player who fired the shot.
+    target: The player who was shot at.
+    cell: The x, y indices of the shot.
+    hit: Whether the shot hit a ship.
+    sunk: The name of the ship the shot sunk, if any.
+    ships: The fleet of the match.
+    """
+    shooter.addGuessedCell(cell)
+    shooter.totalShots += 1
+
+    if hit:
+        shooter.hits += 1
+    else:
+        shooter.misses += 1
+
+    # The client knows where its own ships are, so shots at it are fired at the real board. Shots at the opponent are only marked.
+    if target.board.cellShips:
+        target.board.fire(cell[0], cell[1])
+    else:
+        target.board.markShot(cell[0], cell[1], hit)
+
+    if sunk:
+        ship: Ship = next(ship for ship in ships.values() if ship.name == sunk)
+
+        target.board.sunkShips.append(SunkShip(ship, shooter.totalShots))
+
+
+def printShot(me: Player, them: Player, message: dict) -> None:
+    """
+    This function prints the outcome of a shot and both boards.
+    """
+    shooter, target = (me, them) if message["player"] == me.getRaw() else (them, me)
+
+    cell: str = (
+        f"{me.board.geometry.letters[message['cell'][0]]}{message['cell'][1] + 1}"
+    )
+
+    battleship.cls()
+
+    if message["hit"]:
+        cprint(
+            f"{shooter.getHumanized().get('determiner')} Shot Hit {target.getHumanized().get('determiner')} Ship On Cell: {cell}!",
+            "magenta",
+            attrs=["bold", "underline"],
+        )
+    else:
+        cprint(
+            f"{shooter.getHumanized().get('determiner')} Shot Missed {target.getHumanized().get('determiner')} Ship(s). {shooter.getHumanized().get('singular2')} Guessed: {cell}",
+            attrs=["bold", "underline"],
+        )
+
+    if message["sunk"]:
+        cprint(
+            f"\n{shooter.getHumanized().get('singular2')} Sunk {target.getHumanized().get('determiner')} {message['sunk']}!",
+            "red",
+            attrs=["bold", "underline"],
+        )
+
+    # Display both boards. The opponent's ships are never sent, so only the shots at them are drawn.
+    cprint(
+        f"\n\n{them.getHumanized().get('determiner')} Board:\n", "blue", attrs=["bold"]
+    )
+
+    battleship.printBoard(them, me, True, isOutcomeScreen=True)
+
+    cprint(
+        f"\n\n{me.getHumanized().get('determiner')} Board:\n", "blue", attrs=["bold"]
+    )
+
+    battleship.printBoard(me, them, False, isOutcomeScreen=True)
+
+
+async def play(
+    host: str = protocol.HOST,
+    port: int = protocol.PORT,
+    mode: str = "pve",
+    manual: bool = True,
+) -> None:
+    """
+    This function plays a match on the match server from the terminal. The server runs the rules; the client only asks for moves and draws the boards with the terminal game's rendering.
+
+    Params:
+    mode: "pvp" to play another client, or "pve" to play the computer.
+    manual: Whether to place the ships by hand. Otherwise they are placed randomly.
+    """
+    reader, writer = await asyncio.open_connection(host, port, limit=protocol.MAX_LINE)
+
+    server: Seat = Seat(reader, writer)
+    loop = asyncio.get_running_loop()
+
+    settings: GameSettings = None
+    me: Player = None
+    them: Player = None
+
+    async def sendFleet() -> None:
+        # Placing the ships by hand waits for input, so it runs in a thread while the connection stays open.
+        me.board = settings.createBoard()
+
+        if manual:
+            await loop.run_in_executor(
+                None, battleship.humanShipPlacement, me, them, settings.ships
+            )
+        else:
+            PLACEMENT["uniform"](me.board, settings.ships)
+
+        await server.send(
+            dict(type="place", ships=protocol.encodeLayout(me.board, settings.ships))
+        )
+
+    async def sendMove() -> None:
+        # The opponent's ships are never sent, so the own board is the only one with ships to show.
+        guess: list[int] = await loop.run_in_executor(
+            None, battleship.getHumanMove, me, them, False
+        )
+
+        await server.send(dict(type="fire", cell=guess))
+
+    # The last request from the server, which is asked again if the server rejects the answer.
+    pending = None
+
+    await server.send(dict(type="join", mode=mode))
+
+    try:
+        while True:
+            message: dict = await server.receive()
+
+            if message is None or message["type"] == "invalid":
+                cprint("\nLost the connection to the server.", "red", attrs=["bold"])
+
+                return
+
+            if message["type"] == "waiting":
+                cprint("Waiting for an opponent to join...", "blue", attrs=["bold"])
+            elif message["type"] == "start":
+                settings = GameSettings(
+                    protocol.decodeShips(message["ships"]),
+                    message["width"],
+                    message["height"],
+                )
+
+                pvp: bool = message["opponent"] == "player"
+
+                me = settings.createPlayer(message["player"], pvp)
+                them = settings.createPlayer(3 - message["player"], pvp)
+
+                pending = sendFleet
+
+                await sendFleet()
+            elif message["type"] == "placed":
+                battleship.cls()
+
+                cprint("Waiting for the match to begin...", "blue", attrs=["bold"])
+            elif message["type"] == "begin":
+                starting: Player = me if message["starting"] == me.getRaw() else them
+
+                cprint(
+                    f"\n{starting.getHumanized().get('determiner2')} starting first!",
+                    "green",
+                    attrs=["bold"],
+                )
+            elif message["type"] == "turn":
+                pending = sendMove
+
+                await sendMove()
+            elif message["type"] == "shot":
+                shooter, target = (
+                    (me, them) if message["player"] == me.getRaw() else (them, me)
+                )
+
+                recordShot(
+                    shooter,
+                    target,
+                    message["cell"],
+                    message["hit"],
+                    message["sunk"],
+                    settings.ships,
+                )
+
+                printShot(me, them, message)
+
+                if message["won"]:
+                    cprint(
+                        f"\n\n{shooter.getHumanized().get('singular2')} Won!",
+                        "cyan",
+                        attrs=["bold", "underline"],
+                    )
+
+                    return
+
+                # Give the player time to read what the opponent did before their turn is drawn.
+                if shooter is them:
+                    await loop.run_in_executor(
+                        None,
+                        input,
+                        colored(
+                            "\n\nPress [ENTER] to continue.", "green", attrs=["bold"]
+                        ),
+                    )
+            elif message["type"] == "left":
+                cprint("\nYour opponent left the match.", "red", attrs=["bold"])
+
+                return
+            elif message["type"] == "error":
+                cprint(f"\n{message['message']}", "red", attrs=["bold"])
+
+                # Answer the request that was rejected again.
+                if pending:
+                    await pending()
+    finally:
+        server.close()
+
+
+def main(arguments: list[str] = None) -> None:
+    """
+    This function connects to a match server from the command line.
+    """
+    parser = argparse.ArgumentParser(description="Play Battleship on a match server.")
+    parser.add_argument("mode", nargs="?", default="pve", choices=["pve", "pvp"])
+    parser.add_argument("--host", default=protocol.HOST)
+    parser.add_argument("--port", type=int, default=protocol.PORT)
+    parser.add_argument(
+        "--random", action="store_true", help="Place the ships randomly."
+    )
+
+    options = parser.parse_args(arguments)
+
+    try:
+        asyncio.run(play(options.host, options.port, options.mode, not options.random))
+    except (ConnectionError, KeyboardInterrupt) as error:
+        if isinstance(error, ConnectionError):
+            cprint(f"Couldn't reach the server: {error}", "red", attrs=["bold"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,17 @@
+from classes.GameSettings import GameSettings
+from classes.Ship import Ship
+
+# Create a string of the first 10 letters of the alphabet.
+ALPHAS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"[:10]
+
+# Create a dictionary of Ship objects with their traditional lengths.
+SHIPS = dict(
+    carrier = Ship(5, "blue", "Carrier"),
+    battleship = Ship(4, "cyan", "Battleship"),
+    cruiser = Ship(3, "yellow", "Cruiser"),
+    submarine=Ship(3, "magenta", "Submarine"),
+    destroyer=Ship(2, "green", "Destroyer"),
+)
+
+# The settings of a standard game: a 10x10 board with the ships above.
+DEFAULT_SETTINGS = GameSettings(SHIPS)
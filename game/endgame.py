@@ -0,0 +1,186 @@
+# Import all needed modules and packages.
+import math
+
+import numpy as np
+
+# Import the local classes module.
+from classes.Coordinate import Coordinate
+from classes.DensityCache import DensityCache
+from classes.Player import Player
+from classes.SmartShip import SmartShip
+
+from functions.masks import countBits, maskToArray
+from functions.placements import getPlacementMatrix, getPlacements
+
+from game.targeting import MATRIX_CELLS, getDensityMove, getTargets, pickBestCell
+
+# The exact solver takes over once the afloat ships have at most this many combinations of legal placements (counted as if ships could overlap, so the real count is lower).
+ENDGAME_CONFIGURATIONS = 2000
+
+
+def getLegalPlacements(
+    width: int, height: int, length: int, blocked: np.ndarray
+) -> list[tuple[int, np.ndarray]]:
+    """
+    This function returns the (mask, cell vector) of every placement of a ship that doesn't cover a blocked cell.
+
+    Params:
+    blocked: The blocked cells of the board, flattened.
+    """
+    matrix = getPlacementMatrix(width, height, length)
+    placements = getPlacements(width, height, length)
+
+    return [
+        (placements[index][0], matrix[index])
+        for index in np.flatnonzero(matrix @ blocked == 0)
+    ]
+
+
+def getPlacementTables(
+    width: int, height: int, blocked: int, lengths: list[int]
+) -> list[list[tuple[int, np.ndarray]]]:
+    """
+    This function returns the legal placements of each ship, in the order of the lengths.
+    """
+    blockedCells = maskToArray(blocked, width, height).ravel()
+
+    # Ships of the same length share their placements.
+    tables: dict = {
+        length: getLegalPlacements(width, height, length, blockedCells)
+        for length in set(lengths)
+    }
+
+    return [tables[length] for length in lengths]
+
+
+def getExactDensityMap(
+    width: int,
+    height: int,
+    missMask: int,
+    hitMask: int,
+    sunkMask: int,
+    lengths: list[int],
+) -> np.ndarray:
+    """
+    This function counts, for every cell, how many complete layouts of the afloat ships cover it. A layout is consistent if no ship covers a miss or a sunk ship, no ships overlap and every unsunk hit is covered.
+
+    The ships are placed one at a time, and the layouts of the remaining ships only depend on the cells they could still reach, so those counts are memoized on that sub-board.
+
+    Returns:
+    np.ndarray: A (height, width) array of layout counts. Divided by the amount of layouts, it is the exact chance of each cell holding a ship.
+    """
+    openHits: int = hitMask & ~sunkMask
+
+    tables: list[list] = getPlacementTables(width, height, missMask | sunkMask, lengths)
+
+    # Place the most constrained ships first, so dead ends are found early.
+    ships = sorted(zip(tables, lengths), key=lambda ship: len(ship[0]))
+    tables = [table for table, _ in ships]
+
+    # The cells the ships from each one onwards could reach, and how many cells they have between them.
+    reach: list[int] = [0] * (len(tables) + 1)
+    cells: list[int] = [0] * (len(tables) + 1)
+
+    for ship in range(len(tables) - 1, -1, -1):
+        reach[ship] = reach[ship + 1]
+        cells[ship] = cells[ship + 1] + ships[ship][1]
+
+        for mask, _ in tables[ship]:
+            reach[ship] |= mask
+
+    memo: dict = {}
+
+    def solve(ship: int, occupied: int) -> tuple[int, np.ndarray]:
+        # Every hit has to be covered once all of the ships are placed.
+        uncovered: int = openHits & ~occupied
+
+        if ship == len(tables):
+            return (0, None) if uncovered else (1, np.zeros(width * height))
+
+        # The remaining ships can't cover more hits than they have cells.
+        if countBits(uncovered) > cells[ship]:
+            return 0, None
+
+        # Only the cells the remaining ships can reach (and the hits they still have to cover) matter to them.
+        key: tuple[int, int] = (ship, occupied & (reach[ship] | openHits))
+
+        if key not in memo:
+            count: int = 0
+            coverage: np.ndarray = None
+
+            for mask, vector in tables[ship]:
+                if mask & occupied:
+                    continue
+
+                subCount, subCoverage = solve(ship + 1, occupied | mask)
+
+                if not subCount:
+                    continue
+
+                # Every layout of the remaining ships covers this placement's cells.
+                total = subCoverage + subCount * vector
+                coverage = total if coverage is None else coverage + total
+                count += subCount
+
+            memo[key] = (count, coverage)
+
+        return memo[key]
+
+    count, coverage = solve(0, 0)
+
+    if not count:
+        return np.zeros((height, width))
+
+    return coverage.reshape(height, width)
+
+
+# The exact maps of recently seen endgame states. They are by far the most expensive maps to work out, and the same endgames come up again and again between games.
+ENDGAME_CACHE = DensityCache(getExactDensityMap, "endgame", maxCells=MATRIX_CELLS)
+
+
+def getEndgameShot(player: Player, opponent: Player) -> Coordinate:
+    """
+    This function picks the shot with the highest exact chance of hitting a ship, if few enough layouts of the opponent's afloat ships are left to count them all.
+
+    Returns:
+    Coordinate: The shot, or None if the game isn't in its endgame yet.
+    """
+    board = opponent.board
+
+    # Large boards keep so many layouts that they never get to the endgame.
+    if board.width * board.height > MATRIX_CELLS:
+        return None
+
+    sunkMask, lengths = getTargets(board)
+
+    blocked = maskToArray(board.missMask | sunkMask, board.width, board.height).ravel()
+
+    # Count the legal placements of each ship first, which is much cheaper than listing them.
+    estimate: int = math.prod(
+        int(
+            np.count_nonzero(
+                getPlacementMatrix(board.width, board.height, length) @ blocked == 0
+            )
+        )
+        for length in lengths
+    )
+
+    if estimate > ENDGAME_CONFIGURATIONS:
+        return None
+
+    density = ENDGAME_CACHE.getMap(board, sunkMask, lengths)
+
+    # The solver finds no layout only if the board is in a state the rules can't reach.
+    if not density.any():
+        return None
+
+    return pickBestCell(density, player, board)
+
+
+def getEndgameMove(
+    player: Player, opponent: Player, smartShip: SmartShip = None
+) -> Coordinate:
+    """
+    This function picks the computer's next shot like getDensityMove, but once the game reaches its endgame it fires at the cell with the highest exact chance of holding a ship.
+    """
+    return getEndgameShot(player, opponent) or getDensityMove(player, opponent)
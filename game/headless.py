@@ -0,0 +1,432 @@
+# Import all needed modules and packages.
+import random
+from copy import deepcopy
+
+# Import the local classes module.
+from classes.Board import Board
+from classes.Coordinate import Coordinate
+from classes.Engine import Engine
+from classes.GameDetails import GameDetails
+from classes.GameLogWriter import GameLogWriter
+from classes.GameSettings import GameSettings
+from classes.Geometry import Geometry, getGeometry
+from classes.Player import Player
+from classes.ShotEvent import ShotEvent
+from classes.SmartShip import SmartShip
+
+from functions.metrics import METRICS
+from functions.placements import getPlacements, sampleFleet
+
+from game.constants import DEFAULT_SETTINGS, SHIPS
+from game.endgame import getEndgameMove
+from game.targeting import getDensityMove
+
+# This module holds every part of the game that doesn't touch the terminal, so that computer games can be played without any input, printing or sleeping.
+
+# The amount of whole fleets the uniform placement draws before it falls back to placing ships one at a time.
+UNIFORM_ATTEMPTS = 10000
+
+# The most spots tried for each ship when placing ships one at a time. A fleet that still hasn't fit by then probably can't fit around the ships already placed.
+PLACEMENT_ATTEMPTS = 100000
+
+# The amount of random cells the computer draws before it stops guessing and walks the board for a cell it hasn't shot.
+RANDOM_ATTEMPTS = 32
+
+
+# Define a function to generate the initial game board.
+def generateNewBoard(width: int = 10, height: int = 10) -> list[list[Coordinate]]:
+    """
+    This function generates the blank boards for the start of the game.
+
+    Returns:
+    list[list[Coordinate]]: This function returns a nested list per row (10 by default). They all contain the rows of the board which are filled with coordinate classes.
+    """
+
+    # Create an empty list to store the rows of the board.
+    rows: list[list[Coordinate]] = []
+
+    # Get the letters of the columns from the geometry table.
+    geometry: Geometry = getGeometry(width, height)
+
+    # Iterate through the columns of the board.
+    for column in range(height):
+        # Assign a alpha and a number to the specific coordinate.
+        row: list[Coordinate] = [
+            Coordinate(alpha, column, geometry) for alpha in geometry.letters
+        ]
+
+        # Append the row to the rows list.
+        rows.append(row)
+
+    return rows
+
+
+def placeComputerShips(board: Board, ships: dict = SHIPS) -> None:
+    """
+    This function randomly generates ships onto the board for the computer.
+
+    Params:
+    board: The computers board.
+    ships: The fleet to place.
+    """
+
+    def getBestDirection(point: Coordinate, shipLen: int) -> list[list[int, int]]:
+        # Get the raw coordinates of the point.
+        coords = point.rawCoords()
+
+        # Get the mask and end coordinates of the ship in each direction that stays on the board.
+        outcomes = board.oracle.getDirections(coords, shipLen)
+
+        possibleDirections: list[str] = []
+
+        # Iterate through all of the directions that stay on the board.
+        for direction, (_, end) in outcomes.items():
+            # If the movement does not collide with any other ship, append the direction to the possible directions array.
+            if board.fits(coords, end):
+                possibleDirections.append(direction)
+            # If the ship collides, find another location to place the ship.
+            else:
+                return False
+
+        if not possibleDirections:
+            raise ValueError(
+                "No suitable computer rotation. See game.headless.placeComputerShips"
+            )
+
+        # Pick a random direction from the possible directions.
+        randomDirection: str = random.choice(possibleDirections)
+
+        # Return the start and end coordinates of the random chosen direction.
+        return [coords, outcomes[randomDirection][1]]
+
+    # Iterate through all of the ships & parse the data.
+    for ship, data in ships.items():
+        attempts: int = 0
+
+        while True:
+            attempts += 1
+
+            if attempts > PLACEMENT_ATTEMPTS:
+                raise ValueError(
+                    f"The {data.name} didn't fit anywhere in {PLACEMENT_ATTEMPTS} attempts. See game.headless.placeComputerShips"
+                )
+
+            # Pick a random row from the board.
+            randomRow = board.getRandomRow()
+
+            # Pick a random coordinate from the random row.
+            randomCoordinate = board.getRandomCoordinate(randomRow)
+
+            # If there is no random coordinate which also does not have a ship, pick another random row.
+            if not randomCoordinate:
+                continue
+
+            try:
+                # Use the above algorithm to pick the best orientation for the ship.
+                adjustedCoordinates: list[list[int, int]] = getBestDirection(
+                    randomCoordinate, data.length
+                )
+            except ValueError:
+                continue
+
+            # If there is no good rotation which also doesn't collide, pick another row and restart this process.
+            if not adjustedCoordinates:
+                continue
+
+            # Parse the new rotated ship's coordinates.
+            adjustedStartCoordinates, adjustedEndCoordinates = adjustedCoordinates
+
+            # Set the AI's ship to the specified location from the algorithm.
+            board.setShip(
+                adjustedStartCoordinates, adjustedEndCoordinates, deepcopy(data)
+            )
+
+            # Break the loop & continue this process for the next ship(s).
+            break
+
+        # Count how many spots were tried before the ship fit.
+        METRICS.increment("placement_retries", attempts - 1, strategy="random")
+
+
+def placeUniformShips(board: Board, ships: dict = SHIPS) -> None:
+    """
+    This function places the computer's ships using the placement table. Every layout where no ships overlap is equally likely.
+
+    Large (sparse) boards and fleets that almost fill the board can't be drawn as a whole fleet, so their ships are placed one at a time instead.
+
+    Params:
+    board: The computers board.
+    ships: The fleet to place.
+    """
+    fleet: list = list(ships.values())
+
+    # Draw a whole fleet at once from the placement tables.
+    layout: list[int] = (
+        None
+        if board.sparse
+        else sampleFleet(
+            board.width,
+            board.height,
+            [data.length for data in fleet],
+            UNIFORM_ATTEMPTS,
+        )
+    )
+
+    if layout is None:
+        METRICS.increment("placement_fallbacks", strategy="uniform")
+
+        placeSequentialShips(board, ships)
+
+        return
+
+    # Set each ship to its drawn placement.
+    for data, index in zip(fleet, layout):
+        mask, startCoordinates, endCoordinates = getPlacements(
+            board.width, board.height, data.length
+        )[index]
+
+        board.setShip(startCoordinates, endCoordinates, deepcopy(data))
+
+
+def placeSequentialShips(board: Board, ships: dict = SHIPS) -> None:
+    """
+    This function places the ships one at a time, each at a random start and direction that doesn't collide with the ships placed before it. Only the cells of the ship are checked, so this works on boards of any size.
+
+    Params:
+    board: The computers board.
+    ships: The fleet to place.
+    """
+    for ship, data in ships.items():
+        attempts: int = 0
+
+        while True:
+            attempts += 1
+
+            if attempts > PLACEMENT_ATTEMPTS:
+                raise ValueError(
+                    f"The {data.name} didn't fit anywhere in {PLACEMENT_ATTEMPTS} attempts. See game.headless.placeSequentialShips"
+                )
+
+            # Pick a random direction, then a random start that keeps the ship on the board.
+            horizontal: bool = random.random() < 0.5
+
+            if data.length > (board.width if horizontal else board.height):
+                continue
+
+            x: int = random.randrange(
+                board.width - (data.length - 1 if horizontal else 0)
+            )
+            y: int = random.randrange(
+                board.height - (0 if horizontal else data.length - 1)
+            )
+
+            startCoordinates: list[int] = [x, y]
+            endCoordinates: list[int] = (
+                [x + data.length - 1, y] if horizontal else [x, y + data.length - 1]
+            )
+
+            # Place the ship if it doesn't collide, or try again.
+            if not board.collides(startCoordinates, endCoordinates):
+                board.setShip(startCoordinates, endCoordinates, deepcopy(data))
+
+                break
+
+        METRICS.increment("placement_retries", attempts - 1, strategy="sequential")
+
+
+def getCoordinate(geometry: Geometry, x: int, y: int) -> Coordinate:
+    """
+    This function builds the Coordinate class of a cell from the geometry alone. The computer's moves are worked out on other threads (see classes.Speculation), so they never touch a board's rows while the game is shooting at it.
+    """
+    return Coordinate(geometry.letters[x], y, geometry)
+
+
+def getComputerMove(
+    player: Player, opponent: Player, smartShip: SmartShip
+) -> Coordinate:
+    """
+    This function picks the computer's next shot. It guesses randomly until it hits a ship, then searches around the hit using the smart ship. The shot is not recorded here; the engine records it once it is fired.
+    """
+    randomCoordinate: Coordinate = None
+
+    # Get the size and geometry of the board that is being shot at.
+    width: int = opponent.board.width
+    height: int = opponent.board.height
+    geometry: Geometry = opponent.board.geometry
+
+    while True:
+        METRICS.increment("computer_move_iterations")
+
+        # If there is an original hit point;
+        if smartShip.origin:
+            # Get the origin's cell index.
+            originIndex: int = geometry.getIndex(*smartShip.origin.rawCoords())
+
+            # If there is a current hit point;
+            if smartShip.current:
+                # Get the current point's raw coordinates and the direction it lies in from the origin. (The ship continues that way.)
+                currentCoords: list[int] = smartShip.current.rawCoords()
+                currentIndex: int = geometry.getIndex(*currentCoords)
+
+                direction: str = getDirection(originIndex, currentIndex, width)
+
+                if not direction:
+                    raise Exception(
+                        "Illegal move. Couldn't smart guess in line with the hits."
+                    )
+
+                # Get the next cell in that direction.
+                nextIndex: int = geometry.getNeighbour(currentIndex, direction)
+
+                # If the next cell is off the board or was already guessed, the ship can't continue this way, so reset the point.
+                if nextIndex is None or player.isGuessed(geometry.getPoint(nextIndex)):
+                    smartShip.current = None
+
+                    continue
+
+                return getCoordinate(geometry, *geometry.getPoint(nextIndex))
+            # If there is no current point; (Ship is hit for the first time)
+            else:
+                # Pick from the neighbours of the origin that haven't been guessed. (In the order up, down, left, right.)
+                possibleDirections: list[int] = [
+                    neighbour
+                    for _, neighbour in geometry.getNeighbours(originIndex)
+                    if not player.isGuessed(geometry.getPoint(neighbour))
+                ]
+
+                # If there is no eligible directions, reset the points.
+                if not possibleDirections:
+                    smartShip.current = None
+                    smartShip.origin = None
+
+                    continue
+
+                # Set the random coordinate to the class of a random choice from the possible directions.
+                randomCoordinate = getCoordinate(
+                    geometry, *geometry.getPoint(random.choice(possibleDirections))
+                )
+        # If there is no origin point.
+        else:
+            # Pick a random cell that hasn't been guessed.
+            randomCoords: list[int] = getRandomGuess(player, width, height)
+
+            randomCoordinate = getCoordinate(geometry, randomCoords[0], randomCoords[1])
+
+        return randomCoordinate
+
+
+def getRandomGuess(player: Player, width: int, height: int) -> list[int]:
+    """
+    This function picks a random cell that the player hasn't guessed. It draws random cells until it finds one, and once RANDOM_ATTEMPTS draws in a row were already guessed it walks the board from the last one instead, so it never takes longer than one pass over the board.
+
+    Returns:
+    list[int]: The x, y indices of the cell.
+    """
+    for attempt in range(1, RANDOM_ATTEMPTS + 1):
+        # Pick a random row and a random coordinate in it.
+        randomCoords: list[int] = [random.randrange(width), random.randrange(height)]
+
+        if not player.isGuessed(randomCoords):
+            METRICS.increment("random_guess_draws", attempt)
+
+            return randomCoords
+
+    METRICS.increment("random_guess_draws", RANDOM_ATTEMPTS)
+    METRICS.increment("random_guess_walks")
+
+    # Walk the cells from the last draw until one hasn't been guessed.
+    start: int = randomCoords[1] * width + randomCoords[0]
+
+    for offset in range(1, width * height):
+        index: int = (start + offset) % (width * height)
+
+        if not player.isGuessed([index % width, index // width]):
+            return [index % width, index // width]
+
+    raise Exception(
+        "Every cell has already been guessed. See game.headless.getRandomGuess"
+    )
+
+
+def getDirection(originIndex: int, currentIndex: int, width: int) -> str:
+    """
+    This function returns the direction a cell lies in from another cell in the same row or column, or None if they don't line up.
+    """
+    if originIndex % width == currentIndex % width:
+        return "up" if currentIndex < originIndex else "down"
+    elif originIndex // width == currentIndex // width:
+        return "left" if currentIndex < originIndex else "right"
+
+    return None
+
+
+def playComputerGame(
+    targeting: tuple = ("random", "random"),
+    placement: tuple = ("random", "random"),
+    settings: GameSettings = DEFAULT_SETTINGS,
+    log: GameLogWriter = None,
+    seed: int = None,
+) -> GameDetails:
+    """
+    This function plays a full game of the computer against itself through the engine, without any input, printing or sleeping.
+
+    Params:
+    targeting: The names of the targeting strategies (from TARGETING) used by player 1 and player 2.
+    placement: The names of the placement strategies (from PLACEMENT) used by player 1 and player 2.
+    settings: The board size and fleet of the game.
+    log: The game log to write the game to.
+    seed: The random seed of the game. Logged games are always seeded (with a random seed if none is given), so that the seed in the log plays the same game again.
+
+    Returns:
+    GameDetails: The class holds the stats for the simulated game.
+    """
+    if log and seed is None:
+        seed = random.getrandbits(64)
+
+    if seed is not None:
+        random.seed(seed)
+
+    # Create a new array for the players, each with an empty board.
+    players: list[Player] = [
+        settings.createPlayer(1, False),
+        settings.createPlayer(2, False),
+    ]
+
+    # Place the ships of each player.
+    for player, strategy in zip(players, placement):
+        PLACEMENT[strategy](player.board, settings.ships)
+
+    # Each computer player gets its own move function and smart ship to follow up on its hits.
+    moves: dict = {
+        player.getRaw(): TARGETING[strategy]
+        for player, strategy in zip(players, targeting)
+    }
+    smartShips: dict = {player.getRaw(): SmartShip() for player in players}
+
+    engine: Engine = Engine(players, random.choice(players), log, seed or 0)
+
+    while not engine.winner:
+        player: Player = engine.player
+
+        # Get the computer's move and fire it.
+        guess: Coordinate = moves[player.getRaw()](
+            player, engine.getOpponent(player), smartShips[player.getRaw()]
+        )
+
+        event: ShotEvent = engine.fire(guess.rawCoords())
+
+        # Only hits need the cell class, so misses skip building it.
+        smartShips[player.getRaw()].record(
+            event.hit, event.isSunk(), event.cell if event.hit else None
+        )
+
+    return GameDetails(False, engine.winner, players)
+
+
+# The computer's targeting strategies. They all take (player, opponent, smartShip) and return the Coordinate to shoot.
+TARGETING = dict(
+    random=getComputerMove, density=getDensityMove, endgame=getEndgameMove
+)
+
+# The computer's ship placement strategies. They all take the board to place the ships on and the fleet.
+PLACEMENT = dict(random=placeComputerShips, uniform=placeUniformShips)
@@ -0,0 +1,358 @@
+# Import all needed modules and packages.
+import argparse
+import asyncio
+import random
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+
+# Import the local classes module.
+from classes.Board import Board
+from classes.Engine import Engine
+from classes.GameSettings import GameSettings
+from classes.MoveResult import MoveResult
+from classes.Player import Player
+from classes.Seat import Seat
+from classes.ShotEvent import ShotEvent
+from classes.SmartShip import SmartShip
+
+from functions import protocol
+from functions.metrics import METRICS, exportConfiguredMetrics
+
+from game.anytime import DIFFICULTIES, getTimedMove
+from game.constants import DEFAULT_SETTINGS
+from game.headless import PLACEMENT
+
+# The strategies of the computer in player vs. computer matches. Every computer move is picked within the time budget (in seconds), on a worker thread so that the other matches carry on meanwhile.
+COMPUTER_DIFFICULTY = "hard"
+COMPUTER_BUDGET = 0.01
+COMPUTER_PLACEMENT = "uniform"
+
+# The threads the computer thinks on. The searches hold the GIL, so more threads only take it from the event loop more often; two keep the loop responsive while one search waits for the other.
+COMPUTER_THREADS = 2
+COMPUTER_EXECUTOR = ThreadPoolExecutor(COMPUTER_THREADS, thread_name_prefix="computer")
+
+# The error sent to a client for each problem with a ship's placement. See classes.PlacementOracle.PROBLEMS.
+PLACEMENT_ERRORS = dict(
+    offBoard="The {name} isn't on the board.",
+    shape="The {name} has to be a straight line of {length} cells.",
+    overlap="The {name} overlaps another ship.",
+)
+
+
+def placeFleet(board: Board, ships: dict, layout) -> None:
+    """
+    This function places a fleet sent by a client on a board. It raises a ValueError if the layout is not a legal placement of the whole fleet.
+
+    Params:
+    board: The empty board of the player.
+    ships: The fleet of the match.
+    layout: The start and end coordinates of each ship, by key. See functions.protocol.encodeLayout.
+    """
+    if not isinstance(layout, dict) or set(layout) != set(ships):
+        raise ValueError("Every ship has to be placed exactly once.")
+
+    for key, ship in ships.items():
+        span = layout[key]
+
+        if not (
+            isinstance(span, list)
+            and len(span) == 2
+            and all(protocol.isCell(cell, board.width, board.height) for cell in span)
+        ):
+            raise ValueError(f"The {ship.name} isn't on the board.")
+
+        start, end = span
+
+        # The ship has to be in a straight line, exactly as long as the ship and clear of the ships placed before it.
+        problem: str = board.oracle.getProblem(start, end, ship.length, board.shipMask)
+
+        if problem:
+            raise ValueError(
+                PLACEMENT_ERRORS[problem].format(name=ship.name, length=ship.length)
+            )
+
+        board.setShip(start, end, deepcopy(ship))
+
+
+async def placeRemoteFleet(seat: Seat, settings: GameSettings) -> bool:
+    """
+    This function waits for a client to place its fleet, asking again until the placement is legal.
+
+    Returns:
+    bool: False if the client disconnected.
+    """
+    while True:
+        message: dict = await seat.receive()
+
+        if message is None:
+            return False
+
+        if message["type"] != "place":
+            await seat.send(dict(type="error", message="Place your ships first."))
+
+            continue
+
+        try:
+            placeFleet(seat.player.board, settings.ships, message.get("ships"))
+        except ValueError as error:
+            # Start over with an empty board.
+            seat.player.board = settings.createBoard()
+
+            await seat.send(dict(type="error", message=str(error)))
+
+            continue
+
+        await seat.send(dict(type="placed"))
+
+        return True
+
+
+async def getRemoteMove(seat: Seat, opponent: Player) -> list[int]:
+    """
+    This function asks a client for its move, asking again until it is a cell on the board that hasn't been guessed.
+
+    Returns:
+    list[int]: The x, y indices of the move, or None if the client disconnected.
+    """
+    await seat.send(dict(type="turn"))
+
+    while True:
+        message: dict = await seat.receive()
+
+        if message is None:
+            return None
+
+        cell = message.get("cell")
+
+        if message["type"] != "fire" or not protocol.isCell(
+            cell, opponent.board.width, opponent.board.height
+        ):
+            await seat.send(
+                dict(type="error", message="That is not a cell on the board.")
+            )
+        elif seat.player.isGuessed(cell):
+            await seat.send(
+                dict(type="error", message="That cell was already guessed.")
+            )
+        else:
+            return cell
+
+
+async def playMatch(
+    seats: list[Seat],
+    settings: GameSettings = DEFAULT_SETTINGS,
+    difficulty: str = COMPUTER_DIFFICULTY,
+) -> Player:
+    """
+    This function plays a match between two seats. The rules run on the event loop through the engine; each shot takes microseconds and the computer thinks on a worker thread, so one process can host hundreds of matches.
+
+    Returns:
+    Player: The winner, or None if a client disconnected.
+    """
+    pvp: bool = not any(seat.isComputer() for seat in seats)
+
+    for raw, seat in enumerate(seats, start=1):
+        seat.player = settings.createPlayer(raw, pvp)
+
+    for seat in seats:
+        await seat.send(
+            dict(
+                type="start",
+                player=seat.player.getRaw(),
+                opponent="player" if pvp else "computer",
+                width=settings.width,
+                height=settings.height,
+                ships=protocol.encodeShips(settings.ships),
+            )
+        )
+
+    # The computer places its ships straight away, while both clients place theirs at the same time.
+    for seat in seats:
+        if seat.isComputer():
+            PLACEMENT[COMPUTER_PLACEMENT](seat.player.board, settings.ships)
+
+    placements: list[asyncio.Task] = [
+        asyncio.ensure_future(placeRemoteFleet(seat, settings))
+        for seat in seats
+        if not seat.isComputer()
+    ]
+
+    # If a client leaves while placing, stop waiting for the other one.
+    for placement in asyncio.as_completed(placements):
+        if not await placement:
+            for task in placements:
+                task.cancel()
+
+            await broadcast(seats, dict(type="left"))
+
+            return None
+
+    players: list[Player] = [seat.player for seat in seats]
+
+    engine: Engine = Engine(players, random.choice(players))
+    smartShip: SmartShip = SmartShip()
+
+    await broadcast(seats, dict(type="begin", starting=engine.player.getRaw()))
+
+    while not engine.winner:
+        seat: Seat = seats[engine.player.getRaw() - 1]
+        opponent: Player = engine.getOpponent(seat.player)
+
+        if seat.isComputer():
+            # Think on a worker thread, so the other matches keep running while the computer spends its budget.
+            move: MoveResult = await asyncio.get_running_loop().run_in_executor(
+                COMPUTER_EXECUTOR,
+                getTimedMove,
+                seat.player,
+                opponent,
+                smartShip,
+                COMPUTER_BUDGET,
+                difficulty,
+            )
+
+            METRICS.observe("ai_move", move.elapsed, strategy=difficulty)
+
+            guess: list[int] = move.rawCoords()
+        else:
+            guess: list[int] = await getRemoteMove(seat, opponent)
+
+            if guess is None:
+                await broadcast(seats, dict(type="left"))
+
+                return None
+
+        event: ShotEvent = engine.fire(guess)
+
+        if seat.isComputer():
+            smartShip.record(
+                event.hit, event.isSunk(), event.cell if event.hit else None
+            )
+
+        await broadcast(
+            seats,
+            dict(
+                type="shot",
+                player=seat.player.getRaw(),
+                cell=guess,
+                hit=event.hit,
+                sunk=event.sunkShip.name if event.sunkShip else None,
+                won=event.won,
+            ),
+        )
+
+    return engine.winner
+
+
+async def broadcast(seats: list[Seat], message: dict) -> None:
+    """
+    This function sends a message to every client in a match.
+    """
+    for seat in seats:
+        await seat.send(message)
+
+
+async def startServer(
+    host: str = protocol.HOST,
+    port: int = protocol.PORT,
+    settings: GameSettings = DEFAULT_SETTINGS,
+    difficulty: str = COMPUTER_DIFFICULTY,
+) -> asyncio.AbstractServer:
+    """
+    This function starts the match server. Every connection joins a player vs. computer match straight away, or waits in the lobby for the next player vs. player opponent.
+
+    Returns:
+    asyncio.AbstractServer: The running server.
+    """
+    # The players waiting for an opponent, in the order they joined.
+    lobby: list[Seat] = []
+
+    async def handleConnection(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        seat: Seat = Seat(reader, writer)
+
+        try:
+            message: dict = await seat.receive()
+
+            if (
+                not message
+                or message["type"] != "join"
+                or message.get("mode") not in ("pvp", "pve")
+            ):
+                await seat.send(
+                    dict(type="error", message="Join with a mode of pvp or pve.")
+                )
+
+                return
+
+            if message["mode"] == "pve":
+                await playMatch([seat, Seat()], settings, difficulty)
+
+                return
+
+            # Play the player who has waited the longest, or wait for the next player.
+            if lobby:
+                opponent: Seat = lobby.pop(0)
+                opponent.startMatch()
+
+                try:
+                    await playMatch([opponent, seat], settings, difficulty)
+                finally:
+                    opponent.done.set()
+            else:
+                lobby.append(seat)
+
+                await seat.send(dict(type="waiting"))
+
+                # Players who leave while they wait are taken out of the lobby, so nobody is matched with them.
+                if not await seat.waitInLobby() and seat in lobby:
+                    lobby.remove(seat)
+        finally:
+            seat.close()
+
+            exportConfiguredMetrics()
+
+    return await asyncio.start_server(
+        handleConnection, host, port, limit=protocol.MAX_LINE
+    )
+
+
+async def serve(
+    host: str = protocol.HOST,
+    port: int = protocol.PORT,
+    difficulty: str = COMPUTER_DIFFICULTY,
+) -> None:
+    """
+    This function runs the match server until it is stopped.
+    """
+    server: asyncio.AbstractServer = await startServer(
+        host, port, difficulty=difficulty
+    )
+
+    print(f"Hosting Battleship matches on {host}:{port}.")
+
+    async with server:
+        await server.serve_forever()
+
+
+def main(arguments: list[str] = None) -> None:
+    """
+    This function runs the match server from the command line.
+    """
+    parser = argparse.ArgumentParser(description="Host networked games of Battleship.")
+    parser.add_argument("--host", default=protocol.HOST)
+    parser.add_argument("--port", type=int, default=protocol.PORT)
+    parser.add_argument(
+        "--difficulty", default=COMPUTER_DIFFICULTY, choices=DIFFICULTIES
+    )
+
+    options = parser.parse_args(arguments)
+
+    try:
+        asyncio.run(serve(options.host, options.port, options.difficulty))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,298 @@
+# Import all needed modules and packages.
+import argparse
+import os
+import random
+from multiprocessing import Pool
+
+# Import the local classes module.
+from classes.GameLogWriter import GameLogWriter
+from classes.GameSettings import GameSettings
+from classes.Heatmap import Heatmap
+from classes.RunningStat import RunningStat
+from classes.StatsStore import StatsStore
+from classes.TournamentDetails import TournamentDetails
+
+from game.constants import DEFAULT_SETTINGS, SHIPS
+from game.headless import PLACEMENT, TARGETING, playComputerGame
+
+# The amount of chunks each process gets. More chunks balance the work better, fewer have less overhead.
+CHUNKS_PER_PROCESS = 4
+
+
+def simulate(
+    games: int,
+    targeting: tuple,
+    placement: tuple,
+    seed: int = None,
+    settings: GameSettings = DEFAULT_SETTINGS,
+    log: str = None,
+    stats: str = None,
+) -> TournamentDetails:
+    """
+    This function plays computer games one after another in the current process.
+
+    Params:
+    games: The amount of games to play.
+    targeting: The names of the targeting strategies of player 1 and player 2.
+    placement: The names of the placement strategies of player 1 and player 2.
+    seed: The random seed. Games are only repeatable if a seed is given.
+    settings: The board size and fleet of every game.
+    log: The path of a game log to append every game to.
+    stats: The path of a stats database to write every game to. See classes.StatsStore.StatsStore.
+
+    Returns:
+    TournamentDetails: The combined stats of all of the games.
+    """
+    if seed is not None:
+        random.seed(seed)
+
+    details: TournamentDetails = TournamentDetails(targeting, placement)
+
+    writer: GameLogWriter = GameLogWriter(log, settings) if log else None
+    store: StatsStore = StatsStore(stats) if stats else None
+
+    try:
+        for _ in range(games):
+            gameStats = playComputerGame(targeting, placement, settings, writer)
+
+            details.addGame(gameStats)
+
+            if store:
+                store.addGame(gameStats, targeting, placement, "simulation")
+    finally:
+        if writer:
+            writer.close()
+
+        if store:
+            store.close()
+
+    return details
+
+
+def simulateChunk(arguments: tuple) -> TournamentDetails:
+    """
+    This function unpacks a chunk of work for the process pool.
+    """
+    return simulate(*arguments)
+
+
+def tournament(
+    games: int,
+    targeting: tuple = ("density", "random"),
+    placement: tuple = ("random", "random"),
+    processes: int = None,
+    seed: int = None,
+    settings: GameSettings = DEFAULT_SETTINGS,
+    log: str = None,
+    stats: str = None,
+) -> TournamentDetails:
+    """
+    This function plays many computer games across all of the cores with a process pool and combines their stats.
+
+    Params:
+    games: The amount of games to play.
+    targeting: The names of the targeting strategies of player 1 and player 2. See game.headless.TARGETING.
+    placement: The names of the placement strategies of player 1 and player 2. See game.headless.PLACEMENT.
+    processes: The amount of worker processes. Defaults to the amount of cores.
+    seed: The random seed. Each chunk is seeded from it, so a seeded tournament is repeatable for a given amount of processes.
+    settings: The board size and fleet of every game.
+    log: The path of a game log to append every game to. Every process appends to the same file.
+    stats: The path of a stats database to write every game to. Every process writes to the same database.
+
+    Returns:
+    TournamentDetails: The combined stats of all of the games.
+    """
+    # Check the strategy names before any processes are started.
+    for name in targeting:
+        if name not in TARGETING:
+            raise ValueError(
+                f"Unknown targeting strategy: {name}. game.simulation.tournament"
+            )
+    for name in placement:
+        if name not in PLACEMENT:
+            raise ValueError(
+                f"Unknown placement strategy: {name}. game.simulation.tournament"
+            )
+
+    processes = processes or os.cpu_count() or 1
+
+    # Write the header of a new log (or check the settings of an existing one) before the processes start appending to it.
+    if log:
+        GameLogWriter(log, settings).close()
+
+    # Create the tables of the stats database before the processes start writing to it.
+    if stats:
+        StatsStore(stats).close()
+
+    # Split the games into chunks, spreading the remainder over the first chunks.
+    chunks: int = max(1, min(games, processes * CHUNKS_PER_PROCESS))
+
+    work: list[tuple] = [
+        (
+            games // chunks + (1 if index < games % chunks else 0),
+            targeting,
+            placement,
+            None if seed is None else seed + index,
+            settings,
+            log,
+            stats,
+        )
+        for index in range(chunks)
+    ]
+
+    details: TournamentDetails = TournamentDetails(targeting, placement)
+
+    # A single process doesn't need a pool.
+    if processes == 1:
+        for arguments in work:
+            details.merge(simulateChunk(arguments))
+
+        return details
+
+    with Pool(processes) as pool:
+        for result in pool.imap_unordered(simulateChunk, work):
+            details.merge(result)
+
+    return details
+
+
+def printTournament(details: TournamentDetails) -> None:
+    """
+    This function prints the combined stats of a tournament.
+    """
+    print(f"Games: {details.games}\n")
+
+    for player in (1, 2):
+        meanShots = details.getMeanShotsToWin(player)
+        shotsToWin: RunningStat = details.aggregate.shotsToWin[player]
+        hitRatio: RunningStat = details.aggregate.hitRatio[player]
+
+        print(
+            f"Player {player} ({details.targeting[player - 1]} targeting, {details.placement[player - 1]} placement):"
+        )
+        print(f"  Win Rate: {details.getWinRate(player):.2%}")
+        print(
+            f"  Mean Shots To Win: {meanShots:.2f}"
+            if meanShots is not None
+            else "  Mean Shots To Win: (Insufficient Data)"
+        )
+
+        # The spread of the shots to win, from the running stats.
+        if shotsToWin.count > 1:
+            print(
+                f"  Shots To Win: Median {shotsToWin.getQuantile(0.5):.0f}, 90th Percentile {shotsToWin.getQuantile(0.9):.0f}, Standard Deviation {shotsToWin.getStandardDeviation():.2f}"
+            )
+
+        if hitRatio.count > 1:
+            print(
+                f"  Hit Ratio: Mean {hitRatio.getMean():.2%}, Median {hitRatio.getQuantile(0.5):.1%}, Standard Deviation {hitRatio.getStandardDeviation():.2%}"
+            )
+
+        for name, moves in details.getMeanMovesToSink(player).items():
+            print(f"  Mean Moves To Sink {name}: {moves:.2f}")
+
+        print()
+
+
+def showHeatmaps(
+    details: TournamentDetails, layer: str = None, directory: str = None
+) -> None:
+    """
+    This function prints a layer of the heatmap of each player type and/or saves every heatmap as a .npy file named after the player type.
+
+    Params:
+    details: The tournament the heatmaps were kept in.
+    layer: The layer to print (shots, hits, ships or hitRate). Nothing is printed without one.
+    directory: The directory to save the heatmaps in. Nothing is saved without one.
+    """
+    heatmaps: dict[str, Heatmap] = details.getTypeHeatmaps()
+
+    if layer:
+        # The terminal game is only loaded when a heatmap is printed.
+        from game.battleship import printHeatmap
+
+        for name, heatmap in heatmaps.items():
+            print(f"{name} {layer} ({heatmap.games} games):\n")
+            printHeatmap(heatmap.getLayer(layer))
+            print()
+
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+        for name, heatmap in heatmaps.items():
+            path: str = os.path.join(directory, f"{name}.npy")
+
+            heatmap.save(path)
+
+            print(f"Saved the {name} heatmap to {path}")
+
+
+def addHeatmapArguments(parser: argparse.ArgumentParser) -> None:
+    """
+    This function adds the heatmap options shared by the simulation and the batch.
+    """
+    parser.add_argument(
+        "--heatmap",
+        default=None,
+        choices=["shots", "hits", "ships", "hitRate"],
+        help="A heatmap layer to print for each player type.",
+    )
+    parser.add_argument(
+        "--heatmaps",
+        default=None,
+        help="A directory to save the heatmap of each player type in, as .npy files.",
+    )
+
+
+def main(arguments: list[str] = None) -> TournamentDetails:
+    """
+    This function runs a tournament from the command line.
+    """
+    parser = argparse.ArgumentParser(
+        description="Play computer vs. computer games of Battleship across all cores."
+    )
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument(
+        "--targeting", nargs=2, default=["density", "random"], choices=list(TARGETING)
+    )
+    parser.add_argument(
+        "--placement", nargs=2, default=["random", "random"], choices=list(PLACEMENT)
+    )
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--width", type=int, default=10)
+    parser.add_argument("--height", type=int, default=10)
+    parser.add_argument("--sparse", action="store_true", default=None)
+    parser.add_argument(
+        "--log", default=None, help="A game log to append every game to."
+    )
+    parser.add_argument(
+        "--stats", default=None, help="A stats database to write every game to."
+    )
+    addHeatmapArguments(parser)
+
+    options = parser.parse_args(arguments)
+
+    settings: GameSettings = GameSettings(
+        SHIPS, options.width, options.height, options.sparse
+    )
+
+    details: TournamentDetails = tournament(
+        options.games,
+        tuple(options.targeting),
+        tuple(options.placement),
+        options.processes,
+        options.seed,
+        settings,
+        options.log,
+        options.stats,
+    )
+
+    printTournament(details)
+    showHeatmaps(details, options.heatmap, options.heatmaps)
+
+    return details
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+# Import all needed modules and packages.
+import random
+from collections import Counter
+
+import numpy as np
+
+# Import the local classes module.
+from classes.Coordinate import Coordinate
+from classes.DensityCache import DensityCache
+from classes.Player import Player
+from classes.SmartShip import SmartShip
+
+from functions.masks import maskToArray, countBits
+from functions.placements import getPlacementMatrix
+
+# How much more likely a placement becomes for every unsunk hit that it covers.
+HIT_WEIGHT = 100.0
+
+# Boards with more cells than this count placements with sliding windows instead of placement matrices, since the matrices grow with the square of the board.
+MATRIX_CELLS = 400
+
+
+def getDensityMap(
+    width: int,
+    height: int,
+    missMask: int,
+    hitMask: int,
+    sunkMask: int,
+    lengths: list[int],
+) -> np.ndarray:
+    """
+    This function counts, for every cell, how many legal placements of the afloat ships cover it.
+
+    Params:
+    width, height: The size of the board.
+    missMask: The cells that were shot and missed.
+    hitMask: The cells that were shot and hit.
+    sunkMask: The cells of the ships that have been sunk.
+    lengths: The lengths of the ships that are still afloat.
+
+    Returns:
+    np.ndarray: A (height, width) array of placement weights. Placements covering unsunk hits are weighted by HIT_WEIGHT per hit.
+    """
+    # Ships can't be placed on misses or on the cells of sunk ships.
+    blocked = maskToArray(missMask | sunkMask, width, height)
+
+    # Hits that don't belong to a sunk ship must belong to a ship that is still afloat.
+    openHits = maskToArray(hitMask & ~sunkMask, width, height)
+
+    if width * height > MATRIX_CELLS:
+        return getWindowDensityMap(blocked, openHits, lengths)
+
+    blocked = blocked.ravel()
+    openHits = openHits.ravel()
+
+    density = np.zeros(width * height)
+
+    # Ships of the same length share their placements, so each length is only counted once.
+    for length, count in Counter(lengths).items():
+        placements = getPlacementMatrix(width, height, length)
+
+        # A placement is legal if none of its cells are blocked. Weight each legal placement by the hits it would explain.
+        weights = (placements @ blocked == 0) * np.power(
+            HIT_WEIGHT, placements @ openHits
+        )
+
+        # Spread each placement's weight back onto the cells it covers.
+        density += count * (weights @ placements)
+
+    return density.reshape(height, width)
+
+
+def getWindowDensityMap(
+    blocked: np.ndarray, openHits: np.ndarray, lengths: list[int]
+) -> np.ndarray:
+    """
+    This function is the large board version of getDensityMap. It gives the same map, but counts the blocked cells and hits of every placement with running sums along the rows and columns, so the work grows with the board instead of its square.
+    """
+    density = np.zeros(blocked.shape)
+
+    for length, count in Counter(lengths).items():
+        # Horizontal placements run along the rows, vertical ones along the columns (the transposed board).
+        for axis in (1, 0):
+            blockedLines = blocked if axis else blocked.T
+            hitLines = openHits if axis else openHits.T
+            lineDensity = density if axis else density.T
+
+            if length > blockedLines.shape[1]:
+                continue
+
+            # Count the blocked cells and hits under every window of the ship's length.
+            blockedSums = np.cumsum(
+                np.pad(blockedLines, ((0, 0), (1, 0))), axis=1, dtype=np.int64
+            )
+            hitSums = np.cumsum(
+                np.pad(hitLines, ((0, 0), (1, 0))), axis=1, dtype=np.int64
+            )
+
+            windowBlocked = blockedSums[:, length:] - blockedSums[:, :-length]
+            windowHits = hitSums[:, length:] - hitSums[:, :-length]
+
+            weights = count * (windowBlocked == 0) * np.power(HIT_WEIGHT, windowHits)
+
+            # Spread each window's weight back onto the cells it covers. The transposed view writes straight into the density map.
+            for offset in range(length):
+                lineDensity[:, offset : offset + weights.shape[1]] += weights
+
+    return density
+
+
+# The density maps of recently seen board states. The opening position is the same in every game, and its rotations and reflections share one map.
+DENSITY_CACHE = DensityCache(getDensityMap, "density", maxCells=MATRIX_CELLS)
+
+
+def getTargets(board) -> tuple[int, list[int]]:
+    """
+    This function finds what the computer knows about the opponent's fleet. (The game announces every sunk ship.)
+
+    Returns:
+    tuple[int, list[int]]: The mask of the cells of the sunk ships, and the lengths of the ships that are still afloat.
+    """
+    sunkNames: set = {ship.name for ship in board.sunkShips}
+
+    sunkMask: int = 0
+    lengths: list[int] = []
+
+    for name, mask in board.shipMasks.items():
+        if name in sunkNames:
+            sunkMask |= mask
+        else:
+            lengths.append(countBits(mask))
+
+    return sunkMask, lengths
+
+
+def pickBestCell(density: np.ndarray, player: Player, board) -> Coordinate:
+    """
+    This function picks the cell with the highest value in a map of the board which the player hasn't guessed yet.
+    """
+    density = density.copy()
+
+    # Never shoot the same cell twice.
+    density[maskToArray(player.guessedMask, board.width, board.height)] = -1
+
+    # Pick randomly between the best cells so that the computer can't be predicted.
+    best = np.flatnonzero(density == density.max())
+    index: int = int(best[random.randrange(len(best))])
+
+    return Coordinate(
+        board.geometry.letters[index % board.width],
+        index // board.width,
+        board.geometry,
+    )
+
+
+def getDensityMove(
+    player: Player, opponent: Player, smartShip: SmartShip = None
+) -> Coordinate:
+    """
+    This function picks the computer's next shot by firing at the cell covered by the most legal placements of the opponent's afloat ships. It can be used in place of getComputerMove; the smart ship isn't needed because unsunk hits are already weighted into the density map.
+    """
+    board = opponent.board
+
+    # Find the ships that are still afloat, and the cells of the ones that were sunk.
+    sunkMask, lengths = getTargets(board)
+
+    return pickBestCell(DENSITY_CACHE.getMap(board, sunkMask, lengths), player, board)
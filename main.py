@@ -24,17 +24,31 @@
 }
 
 # Import all needed modules and packages.
-import time
+import argparse
 import os
+import time
+from functools import lru_cache
 from termcolor import cprint, colored
 
 from game import battleship
 from assets import introGraphics
 from functions import utils
+from functions.metrics import exportConfiguredMetrics
 
 from classes.GameDetails import GameDetails
+from classes.GameSummary import GameSummary
+from classes.StatsAggregator import StatsAggregator
+from classes.StatsStore import STATS_ENV, STATS_PATH, StatsStore
+
+from game.constants import DEFAULT_SETTINGS
 
-RULES: str = f"""{colored("In-Game Symbols", "blue", attrs=["bold"])}
+
+@lru_cache(maxsize=None)
+def getRules() -> str:
+    """
+    Builds the rules screen. It is only coloured the first time the rules are shown, so starting the game doesn't pay for it.
+    """
+    return f"""{colored("In-Game Symbols", "blue", attrs=["bold"])}
 
 In Battleship, various symbols are used to denote grid cell meanings. In this version of Battleship, you will see the following symbols:
 
@@ -79,12 +93,9 @@ As soon as all of one player"s ships have been sunk, the game ends & you have th
 """
 
 
-# Clear screen function.
+# Clear screen function. This uses the game's renderer, which writes the clear sequence directly instead of starting a "clear" subprocess.
 def cls() -> None:
-    os.system("clear")
-
-
-cls()
+    battleship.cls()
 
 
 def introSequence() -> None:
@@ -148,7 +159,10 @@ def menu(firstGame: bool) -> int:
             continue
 
 
-def printGameStats(gameNumber: int, gameStats: GameDetails):
+def printGameStats(gameNumber: int, summary: GameSummary):
+    # Rebuild the full game from the summary's move log. Only this game is held in full, and only while its stats are printed.
+    gameStats: GameDetails = summary.getDetails()
+
     # Print the game number
     cprint(f"Game {gameNumber}:\n", "blue", attrs=["bold", "underline"])
 
@@ -177,7 +191,7 @@ def printGameStats(gameNumber: int, gameStats: GameDetails):
             colored(f"Guesses:", "green", attrs=["bold"]),
             ", ".join(
                 utils.coordListToString(
-                    [[utils.convertNumberToLetter(str(cell[0])), cell[1] + 1]
+                    [[player.board.geometry.letters[cell[0]], cell[1] + 1]
                      for cell in player.guessedCells]))
             if player.guessedCells else "N/A",
         )
@@ -231,15 +245,67 @@ def printGameStats(gameNumber: int, gameStats: GameDetails):
             print("\n\n~---------------~\n\n")
 
 
-def main() -> None:
+def printSessionStats(aggregate: StatsAggregator) -> None:
+    """
+    Prints the running stats of every game in the session, from the aggregator instead of the games themselves.
+    """
+    cprint(f"All {aggregate.games} Games:\n", "blue", attrs=["bold", "underline"])
+
+    for player in (1, 2):
+        shotsToWin = aggregate.shotsToWin[player]
+        hitRatio = aggregate.hitRatio[player]
+
+        cprint(f"Player {player} Stats:\n", "grey", attrs=["bold", "underline"])
+
+        # Print the wins.
+        print(colored("Wins:", "green", attrs=["bold"]), aggregate.wins[player])
+        # Print the average and median shots to win, if the player won at all.
+        print(
+            colored("Shots To Win:", "cyan", attrs=["bold"]),
+            f"{shotsToWin.getMean():.2f} on average, {shotsToWin.getQuantile(0.5)} median"
+            if shotsToWin.count else "(Insufficient Data)",
+        )
+        # Print the average share of shots that hit.
+        print(
+            colored("Hit Ratio:", "red", attrs=["bold"]),
+            f"{hitRatio.getMean():.2%}" if hitRatio.count else "(Insufficient Data)",
+        )
+
+        # Print the average moves to sink each ship.
+        for name, moves in aggregate.movesToSink[player].items():
+            print(
+                colored(f"Moves To Sink {name}:", "magenta", attrs=["bold"]),
+                f"{moves.getMean():.2f} on average",
+            )
+
+        print()
+
+
+def main(arguments: list[str] = None) -> None:
+    parser = argparse.ArgumentParser(description="Play Battleship in the terminal.")
+    parser.add_argument(
+        "--skip-intro", action="store_true", help="Go straight to the menu."
+    )
+
+    options = parser.parse_args(arguments)
+
+    cls()
+
     # Print the intro graphics.
-    introSequence()
+    if not options.skip_intro:
+        introSequence()
 
-    # Init lists for all of the stats and the total number of games played.
-    allStats: list = []
+    # Init lists for all of the stats and the total number of games played. Each game is kept as a compact summary, so a long session doesn't keep every board in memory.
+    allStats: list[GameSummary] = []
 
     totalGames: int = 0
 
+    # The running stats of the whole session. Each game is folded in as it finishes.
+    aggregate: StatsAggregator = StatsAggregator()
+
+    # Every game is also written to the stats database in the background, so the history outlives the session.
+    store: StatsStore = StatsStore(os.environ.get(STATS_ENV, STATS_PATH))
+
     while True:
         # Get the menu choice from the user.
         menuChoice: int = menu(True if totalGames == 0 else False)
@@ -248,12 +314,23 @@ def main() -> None:
         if menuChoice == 1:
             totalGames += 1
 
-            stats = battleship.main()
+            stats: GameDetails = battleship.main()
+
+            allStats.append(GameSummary(stats, DEFAULT_SETTINGS))
+            aggregate.addGame(stats)
 
-            allStats.append(stats)
+            # Player 1 is always human. In PVE, player 2 is the computer.
+            store.addGame(
+                stats,
+                ("human", "human" if stats.isPVP else battleship.COMPUTER_TARGETING),
+                ("human", "human" if stats.isPVP else battleship.COMPUTER_PLACEMENT),
+            )
+
+            # Write the session's metrics so far, if a metrics file was asked for.
+            exportConfiguredMetrics()
         # If the user chooses 2, launch the rules.
         elif menuChoice == 2:
-            print(RULES)
+            print(getRules())
 
             input(
                 colored("\nPress [ENTER] to continue.",
@@ -263,6 +340,9 @@ def main() -> None:
             continue
         # If the user chooses 3, exit to stats if applicable.
         elif menuChoice == 3:
+            # Finish writing the games before leaving.
+            store.close()
+
             if not allStats:
                 exit("Goodbye! 👋")
             else:
@@ -282,6 +362,16 @@ def main() -> None:
 
         printGameStats(gameNumber, gameStat)
 
+    # Print the stats of the whole session after the games.
+    if len(allStats) > 1:
+        cprint(
+            "\n\n~----------------------------------------~\n\n",
+            "red",
+            attrs=["bold"],
+        )
+
+        printSessionStats(aggregate)
+
 
 if __name__ == "__main__":
     main()